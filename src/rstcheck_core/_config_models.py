@@ -0,0 +1,171 @@
+"""Pydantic models of the rstcheck configuration.
+
+Loaded on first use by :py:mod:`rstcheck_core.config`, so that checks without config files do not
+import pydantic.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import pathlib
+import re
+import typing as t
+
+import pydantic
+
+from .config import DEFAULT_REPORT_LEVEL, ReportLevel, ReportLevelMap, _split_str_validator
+
+
+class RstcheckConfigFile(pydantic.BaseModel):
+    """Rstcheck config file.
+
+    :raises ValueError: If setting has incorrect value or type
+    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    """
+
+    report_level: ReportLevel | None = None
+    ignore_directives: list[str] | None = None
+    ignore_roles: list[str] | None = None
+    ignore_substitutions: list[str] | None = None
+    ignore_languages: list[str] | None = None
+    ignore_messages: t.Pattern[str] | None = None
+    sphinx_source_dir: pathlib.Path | None = None
+
+    @pydantic.field_validator("report_level", mode="before")
+    @classmethod
+    def valid_report_level(cls, value: t.Any) -> ReportLevel | None:  # noqa: ANN401
+        """Validate the report_level setting.
+
+        :param value: Value to validate
+        :raises ValueError: If ``value`` is not a valid docutils report level
+        :return: Instance of :py:class:`ReportLevel` or None if empty string.
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, ReportLevel):
+            return value
+
+        if value == "":
+            return DEFAULT_REPORT_LEVEL
+
+        if isinstance(value, bool):
+            msg = "Invalid report level"
+            raise TypeError(msg)
+
+        if isinstance(value, str):
+            if value.casefold() in set(ReportLevelMap):
+                return ReportLevel(ReportLevelMap[value.casefold()])
+
+            with contextlib.suppress(ValueError):
+                value = int(value)
+
+        max_report_lvl = 5
+        min_report_lvl = 1
+        if isinstance(value, int) and min_report_lvl <= value <= max_report_lvl:
+            return ReportLevel(value)
+
+        msg = "Invalid report level"
+        raise TypeError(msg)
+
+    @pydantic.field_validator(
+        "ignore_directives",
+        "ignore_roles",
+        "ignore_substitutions",
+        "ignore_languages",
+        mode="before",
+    )
+    @classmethod
+    def split_str(cls, value: t.Any) -> list[str] | None:  # noqa: ANN401
+        """Validate and parse the following ignore_* settings.
+
+        - ignore_directives
+        - ignore_roles
+        - ignore_substitutions
+        - ignore_languages
+
+        Comma separated strings are split into a list.
+
+        :param value: Value to validate
+        :raises ValueError: If not a :py:class:`str` or :py:class:`list` of :py:class:`str`
+        :return: List of things to ignore in the respective category
+        """
+        return _split_str_validator(value)
+
+    @pydantic.field_validator("ignore_messages", mode="before")
+    @classmethod
+    def join_regex_str(cls, value: t.Any) -> str | t.Pattern[str] | None:  # noqa: ANN401
+        """Validate and concatenate the ignore_messages setting to a RegEx string.
+
+        If a list is given, the entries are concatenated with "|" to create an or RegEx.
+
+        :param value: Value to validate
+        :raises ValueError: If not a :py:class:`str` or :py:class:`list` of :py:class:`str`
+        :return: A RegEx string with messages to ignore or :py:class:`typing.Pattern` if it is one
+            already
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, re.Pattern):
+            return value
+
+        if isinstance(value, list) and all(isinstance(v, str) for v in value):
+            return r"|".join(value)
+
+        if isinstance(value, str):
+            return value
+
+        msg = "Not a string or list of strings"
+        raise TypeError(msg)
+
+
+class RstcheckConfig(RstcheckConfigFile):
+    """Rstcheck config.
+
+    :raises ValueError: If setting has incorrect value or type
+    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    """
+
+    config_path: pathlib.Path | None = None
+    recursive: bool | None = None
+    warn_unknown_settings: bool | None = None
+
+
+class RstcheckConfigINIFile(pydantic.BaseModel):
+    """Type for [rstcheck] section in INI file.
+
+    The types apply to the file's data before the parsing by :py:class:`RstcheckConfig` is done.
+
+    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    """
+
+    report_level: str | int | None = None
+    ignore_directives: str | None = None
+    ignore_roles: str | None = None
+    ignore_substitutions: str | None = None
+    ignore_languages: str | None = None
+    ignore_messages: str | None = None
+    sphinx_source_dir: pathlib.Path | None = None
+
+
+class RstcheckConfigTOMLFile(pydantic.BaseModel):
+    """Type for [tool.rstcheck] section in TOML file.
+
+    The types apply to the file's data before the parsing by :py:class:`RstcheckConfig` is done.
+
+    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    """
+
+    report_level: str | int | None = None
+    ignore_directives: list[str] | None = None
+    ignore_roles: list[str] | None = None
+    ignore_substitutions: list[str] | None = None
+    ignore_languages: list[str] | None = None
+    ignore_messages: list[str] | str | None = None
+    sphinx_source_dir: pathlib.Path | None = None
+
+
+# NOTE: The public models are documented and pickled as part of the config module.
+RstcheckConfigFile.__module__ = "rstcheck_core.config"
+RstcheckConfig.__module__ = "rstcheck_core.config"
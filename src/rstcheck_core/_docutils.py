@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import logging
 import typing as t
@@ -41,19 +42,73 @@ def ignore_role(  # noqa: PLR0913, PLR0917
     return ([], [])
 
 
+_RegistrySnapshot = tuple[dict[str, t.Any], dict[str, t.Any], dict[str, t.Any]]
+
+_registry_snapshot: _RegistrySnapshot | None = None
+
+
 def clean_docutils_directives_and_roles_cache() -> None:  # pragma: no cover
     """Clean docutils' directives and roles cache by reloading their modules.
 
     Reloads:
     - :py:mod:`docutils.parsers.rst.directives`
     - :py:mod:`docutils.parsers.rst.roles`
+
+    Inside of :py:func:`keep_directives_and_roles_warm` the snapshot taken on entering is restored
+    instead.
     """
+    if _registry_snapshot is not None:
+        logger.info("Restore snapshot of docutils directives and roles.")
+        _restore_registry_snapshot(_registry_snapshot)
+        return
+
     logger.info("Reload module docutils.parsers.rst.directives/roles")
     importlib.reload(docutils.parsers.rst.directives)
     importlib.reload(docutils.parsers.rst.roles)
 
 
-def ignore_directives_and_roles(directives: list[str], roles: list[str]) -> None:
+def registries_are_warm() -> bool:
+    """Check if a :py:func:`keep_directives_and_roles_warm` context is active.
+
+    :return: If the directives and roles are restored from a snapshot
+    """
+    return _registry_snapshot is not None
+
+
+@contextlib.contextmanager
+def keep_directives_and_roles_warm() -> t.Generator[None, None, None]:
+    """Contextmanager to replace the module reloads by restoring a snapshot.
+
+    The snapshot of the registered directives and roles is taken when entering the context.
+    :py:func:`clean_docutils_directives_and_roles_cache` then restores it instead of reloading the
+    modules. This keeps e.g. the directives and roles registered by Sphinx without setting up
+    Sphinx again.
+    """
+    global _registry_snapshot  # noqa: PLW0603
+    previous_snapshot = _registry_snapshot
+    _registry_snapshot = (
+        dict(docutils.parsers.rst.directives._directives),  # type: ignore[attr-defined]  # noqa: SLF001
+        dict(docutils.parsers.rst.roles._roles),  # type: ignore[attr-defined]  # noqa: SLF001
+        dict(docutils.parsers.rst.roles._role_registry),  # type: ignore[attr-defined]  # noqa: SLF001
+    )
+    try:
+        yield
+    finally:
+        _registry_snapshot = previous_snapshot
+
+
+def _restore_registry_snapshot(snapshot: _RegistrySnapshot) -> None:
+    """Replace the registered directives and roles with copies of the snapshot.
+
+    :param snapshot: Snapshot to restore
+    """
+    (directives, roles, role_registry) = snapshot
+    docutils.parsers.rst.directives._directives = dict(directives)  # type: ignore[attr-defined]  # noqa: SLF001
+    docutils.parsers.rst.roles._roles = dict(roles)  # type: ignore[attr-defined]  # noqa: SLF001
+    docutils.parsers.rst.roles._role_registry = dict(role_registry)  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+def ignore_directives_and_roles(directives: t.Iterable[str], roles: t.Iterable[str]) -> None:
     """Ignore directives and roles in docutils.
 
     :param directives: Directives to ignore
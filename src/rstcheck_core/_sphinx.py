@@ -8,7 +8,7 @@ import pathlib
 import tempfile
 import typing as t
 
-from . import _docutils, _extras
+from . import _docutils, _extras, stats
 
 if _extras.SPHINX_INSTALLED:
     import sphinx.application
@@ -41,9 +41,14 @@ def create_dummy_sphinx_app() -> sphinx.application.Sphinx:
 
 @contextlib.contextmanager
 def load_sphinx_if_available() -> t.Generator[sphinx.application.Sphinx | None, None, None]:
-    """Contextmanager to register Sphinx directives and roles if sphinx is available."""
-    if _extras.SPHINX_INSTALLED:
-        create_dummy_sphinx_app()
+    """Contextmanager to register Sphinx directives and roles if sphinx is available.
+
+    Inside of :py:func:`rstcheck_core._docutils.keep_directives_and_roles_warm` Sphinx is not set
+    up again, because its directives and roles are restored from the snapshot.
+    """
+    if _extras.SPHINX_INSTALLED and not _docutils.registries_are_warm():
+        with stats.span(stats.PHASE_SPHINX_LOAD):
+            create_dummy_sphinx_app()
         # NOTE: Hack to prevent sphinx warnings for overwriting registered nodes; see #113
         sphinx.application.builtin_extensions = [
             e
@@ -54,6 +59,18 @@ def load_sphinx_if_available() -> t.Generator[sphinx.application.Sphinx | None,
     yield None
 
 
+@contextlib.contextmanager
+def load_sphinx_warm() -> t.Generator[None, None, None]:
+    """Contextmanager to set up Sphinx once and keep its directives and roles registered.
+
+    Resets the docutils directives and roles, loads Sphinx if available and then keeps the
+    resulting state with :py:func:`rstcheck_core._docutils.keep_directives_and_roles_warm`.
+    """
+    _docutils.clean_docutils_directives_and_roles_cache()
+    with load_sphinx_if_available(), _docutils.keep_directives_and_roles_warm():
+        yield
+
+
 def get_sphinx_directives_and_roles() -> tuple[list[str], list[str]]:
     """Return Sphinx directives and roles loaded from sphinx.
 
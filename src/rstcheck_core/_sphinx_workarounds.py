@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import os
 import pathlib
 import re
 import typing as t
@@ -29,54 +32,248 @@ def strip_include_directives(source: str) -> str:
     return _INCLUDE_REGEX.sub(replacer, source)
 
 
+class IncludeLookupCache:
+    """Cache of the file system lookups for include directives.
+
+    The existence of included files is looked up in cached listings of their directories, so that
+    every directory is scanned only once instead of one ``stat`` call per include directive. Only
+    names missing from the listing, e.g. differing in case on case-insensitive file systems, are
+    checked with a ``stat`` call. The sphinx ``source`` directory found for a directory is cached
+    as well.
+
+    The cache is never invalidated, so it should only live for a single run.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty :py:class:`IncludeLookupCache`."""
+        self._file_names: dict[pathlib.Path, frozenset[str]] = {}
+        self._sphinx_source_dirs: dict[pathlib.Path, pathlib.Path | None] = {}
+
+    def is_file(self, path: pathlib.Path) -> bool:
+        """Check if the path is an existing file by the cached listing of its directory.
+
+        See :py:func:`is_listed_file`.
+
+        :param path: Path to check
+        :return: If the path is a file
+        """
+        file_names = self._file_names.get(path.parent)
+        if file_names is None:
+            file_names = list_directory_files(path.parent)
+            self._file_names[path.parent] = file_names
+        return is_listed_file(path, file_names)
+
+    def find_sphinx_source_dir(self, base_dir: pathlib.Path) -> pathlib.Path | None:
+        """Search for the sphinx ``source`` directory with :py:func:`find_sphinx_source_dir`.
+
+        :param base_dir: Directory to start the search in
+        :return: Found sphinx ``source`` directory or :py:obj:`None`
+        """
+        if base_dir not in self._sphinx_source_dirs:
+            self._sphinx_source_dirs[base_dir] = find_sphinx_source_dir(base_dir)
+        return self._sphinx_source_dirs[base_dir]
+
+
+def list_directory_files(directory: pathlib.Path) -> frozenset[str]:
+    """List the names of all files in a directory with a single directory scan.
+
+    :param directory: Directory to list
+    :return: Names of the files in the directory; empty if the directory cannot be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+def is_listed_file(path: pathlib.Path, file_names: frozenset[str]) -> bool:
+    """Check if the path is an existing file by the listing of its directory.
+
+    The listing is only a fast path: names missing from it are checked with ``stat``, as they may
+    differ in case from the listed names on case-insensitive file systems.
+
+    :param path: Path to check
+    :param file_names: Names of the files in the path's directory from
+        :py:func:`list_directory_files`
+    :return: If the path is a file
+    """
+    return path.name in file_names or path.is_file()
+
+
+_include_lookup_cache: contextvars.ContextVar[IncludeLookupCache | None] = contextvars.ContextVar(
+    "include_lookup_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def cache_include_lookups(
+    cache: IncludeLookupCache | None = None,
+) -> t.Generator[IncludeLookupCache, None, None]:
+    """Contextmanager to cache the file system lookups for include directives.
+
+    Inside the context included files and sphinx ``source`` directories are looked up with the
+    :py:class:`IncludeLookupCache`. Files created or removed inside the context may be missed.
+
+    :param cache: Cache to use; defaults to :py:obj:`None` which creates a new one
+    :return: :py:obj:`None`
+    :yield: The used cache
+    """
+    cache = cache if cache is not None else IncludeLookupCache()
+    token = _include_lookup_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _include_lookup_cache.reset(token)
+
+
+_include_file_exists: contextvars.ContextVar[t.Callable[[pathlib.Path], bool] | None] = (
+    contextvars.ContextVar("include_file_exists", default=None)
+)
+
+
+@contextlib.contextmanager
+def lookup_included_files_with(
+    file_exists: t.Callable[[pathlib.Path], bool],
+) -> t.Generator[None, None, None]:
+    """Contextmanager to check the existence of included files with the given function.
+
+    Inside the context :py:func:`yield_include_errors` uses ``file_exists`` unless another function
+    is passed, also for the rst code blocks nested in the checked sources.
+
+    :param file_exists: Function checking if an included file exists, e.g. in an archive
+    :return: :py:obj:`None`
+    :yield: :py:obj:`None`
+    """
+    token = _include_file_exists.set(file_exists)
+    try:
+        yield
+    finally:
+        _include_file_exists.reset(token)
+
+
+def get_include_base_dir(source_origin: types.SourceFileOrString) -> pathlib.Path:
+    """Get the directory relative include paths of the source are resolved against.
+
+    :param source_origin: Origin of the source
+    :return: Absolute base directory
+    """
+    if isinstance(source_origin, pathlib.Path) and source_origin.name != "-":
+        return source_origin.parent.absolute()
+    return pathlib.Path.cwd().absolute()
+
+
+def find_sphinx_source_dir(base_dir: pathlib.Path) -> pathlib.Path | None:
+    """Search the directory and its parents for a sphinx directory named ``source``.
+
+    :param base_dir: Directory to start the search in
+    :return: Found sphinx ``source`` directory or :py:obj:`None`
+    """
+    found_source_dir = base_dir
+    while len(found_source_dir.parents) > 0:
+        if found_source_dir.stem == "source":
+            return found_source_dir
+        found_source_dir = found_source_dir.parent
+    return None
+
+
+def resolve_include_path(
+    include_file_path_raw: str,
+    base_dir: pathlib.Path,
+    sphinx_source_dir: pathlib.Path | None = None,
+) -> pathlib.Path | None:
+    """Resolve the path of an include directive to the path of the included file.
+
+    Relative paths are resolved against the ``base_dir``. Absolute paths are resolved against the
+    sphinx ``source`` directory, which is searched for if not passed. The search is cached inside
+    of :py:func:`cache_include_lookups`.
+
+    :param include_file_path_raw: Path as written in the include directive
+    :param base_dir: Directory of the including file
+    :param sphinx_source_dir: Sphinx ``source`` directory; defaults to :py:obj:`None`
+    :return: Path to the included file or :py:obj:`None` if no sphinx ``source`` directory could be
+        found for an absolute path
+    """
+    if not include_file_path_raw.startswith("/"):
+        return base_dir / include_file_path_raw
+
+    if sphinx_source_dir is None:
+        cache = _include_lookup_cache.get()
+        sphinx_source_dir = (
+            cache.find_sphinx_source_dir(base_dir)
+            if cache is not None
+            else find_sphinx_source_dir(base_dir)
+        )
+        if sphinx_source_dir is None:
+            return None
+
+    return sphinx_source_dir.absolute() / include_file_path_raw.lstrip("/")
+
+
+def find_include_paths(
+    source: str,
+    source_origin: types.SourceFileOrString,
+    sphinx_source_dir: pathlib.Path | None = None,
+) -> t.Generator[tuple[int, pathlib.Path | None], None, None]:
+    """Find and resolve the paths of all include directives in the source.
+
+    :param source: Source containing include directives
+    :param source_origin: Origin of the source
+    :param sphinx_source_dir: Sphinx ``source`` directory; defaults to :py:obj:`None`
+    :return: :py:obj:`None`
+    :yield: Tuples of the line number of the directive and the resolved path;
+        the path is :py:obj:`None` if it could not be resolved
+    """
+    base_dir = get_include_base_dir(source_origin)
+
+    for match in _INCLUDE_REGEX.finditer(source):
+        line_number = source[: match.start()].count("\n") + 1
+        include_file_path_raw = match.group(2).strip()
+        yield (
+            line_number,
+            resolve_include_path(include_file_path_raw, base_dir, sphinx_source_dir),
+        )
+
+
 def yield_include_errors(
     source: str,
     source_origin: types.SourceFileOrString,
     ignore_messages: t.Pattern[str] | None = None,
     sphinx_source_dir: pathlib.Path | None = None,
+    file_exists: t.Callable[[pathlib.Path], bool] | None = None,
 ) -> types.YieldedLintError:
     """Check existence of included files from include directives.
 
     :param source: Source containing include directives
     :param source_origin: Origin of the source
     :param ignore_messages: Regex for ignoring error messages; defaults to :py:obj:`None`
+    :param file_exists: Function checking if an included file exists, e.g. in an archive;
+        defaults to :py:obj:`None` which means the function set with
+        :py:func:`lookup_included_files_with` or else the file system is checked, with the cache of
+        :py:func:`cache_include_lookups` if active
     :return: :py:obj:`None`
     :yield: Found issues
     """
-    if isinstance(source_origin, pathlib.Path) and source_origin.name != "-":
-        base_dir = source_origin.parent.absolute()
-    else:
-        base_dir = pathlib.Path.cwd().absolute()
+    base_err_message = '(SEVERE/4) File referenced in "include" directive not found:'
+    if file_exists is None:
+        file_exists = _include_file_exists.get()
+    if file_exists is None:
+        cache = _include_lookup_cache.get()
+        file_exists = cache.is_file if cache is not None else pathlib.Path.is_file
 
-    for match in _INCLUDE_REGEX.finditer(source):
-        line_number = source[: match.start()].count("\n") + 1
-        include_file_path_raw = match.group(2).strip()
-        include_file_path = pathlib.Path(include_file_path_raw)
-
-        base_err_message = '(SEVERE/4) File referenced in "include" directive not found:'
-
-        if not include_file_path_raw.startswith("/"):
-            include_file_path = base_dir / include_file_path
-        elif sphinx_source_dir is not None:
-            include_file_path = sphinx_source_dir.absolute() / include_file_path_raw.lstrip("/")
-        else:
-            found_source_dir = base_dir
-            while len(found_source_dir.parents) > 0:
-                if found_source_dir.stem == "source":
-                    break
-                found_source_dir = found_source_dir.parent
-            else:
-                message = base_err_message + (
-                    " Could not find sphinx 'source' directory. Please provide via config."
-                )
-                yield types.LintError(
-                    source_origin=source_origin, line_number=line_number, message=message
-                )
-                continue
-            include_file_path = found_source_dir / include_file_path_raw.lstrip("/")
+    for line_number, include_file_path in find_include_paths(
+        source, source_origin, sphinx_source_dir
+    ):
+        if include_file_path is None:
+            message = base_err_message + (
+                " Could not find sphinx 'source' directory. Please provide via config."
+            )
+            yield types.LintError(
+                source_origin=source_origin, line_number=line_number, message=message
+            )
+            continue
 
-        if not include_file_path.is_file():
-            line_number = source[: match.start()].count("\n") + 1
+        if not file_exists(include_file_path):
             message = f"{base_err_message} '{include_file_path}'."
 
             if ignore_messages and ignore_messages.search(message):
@@ -0,0 +1,170 @@
+"""File watching helpers for the watch mode of the runner."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pathlib
+import typing as t
+
+from . import include_graph
+
+logger = logging.getLogger(__name__)
+
+
+def is_checkable_rst_file_name(name: str) -> bool:
+    """Check if a file name belongs to a rst file to check.
+
+    :param name: File name
+    :return: If the file should be checked
+    """
+    return not name.startswith(".") and pathlib.PurePath(name).suffix.casefold() == ".rst"
+
+
+def scan_rst_files(
+    check_paths: t.Iterable[pathlib.Path], *, recursive: bool
+) -> dict[pathlib.Path, include_graph.FileSignature]:
+    """Scan the paths for rst files and their signatures using :py:func:`os.scandir`.
+
+    Applies the same rules as :py:meth:`rstcheck_core.runner.RstcheckMainRunner.update_file_list`.
+
+    :param check_paths: Files and directories to scan
+    :param recursive: If directories are scanned recursively
+    :return: Map of found rst files to their signature
+    """
+    found: dict[pathlib.Path, include_graph.FileSignature] = {}
+    pending_dirs: list[pathlib.Path] = []
+
+    for path in check_paths:
+        if recursive and path.is_dir():
+            pending_dirs.append(path)
+            continue
+        signature = include_graph.get_file_signature(path)
+        if signature is not None and path.is_file() and is_checkable_rst_file_name(path.name):
+            found[path] = signature
+
+    while pending_dirs:
+        directory = pending_dirs.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        pending_dirs.append(pathlib.Path(entry.path))
+                    elif entry.is_file() and is_checkable_rst_file_name(entry.name):
+                        stat_result = entry.stat()
+                        found[pathlib.Path(entry.path)] = (
+                            stat_result.st_mtime_ns,
+                            stat_result.st_size,
+                        )
+        except OSError:
+            logger.debug("Could not scan directory: '%s'.", directory)
+
+    return found
+
+
+def hash_file_content(path: pathlib.Path) -> str | None:
+    """Hash the content of a file.
+
+    :param path: File to hash
+    :return: Hex digest of the content or :py:obj:`None` if the file cannot be read
+    """
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    """Poll rst files and their included files for content changes."""
+
+    def __init__(
+        self,
+        check_paths: list[pathlib.Path],
+        *,
+        recursive: bool,
+        sphinx_source_dir: pathlib.Path | None = None,
+    ) -> None:
+        """Initialize the :py:class:`FileWatcher`.
+
+        :param check_paths: Files and directories to watch
+        :param recursive: If directories are watched recursively
+        :param sphinx_source_dir: Sphinx ``source`` directory used to resolve absolute include
+            paths; defaults to :py:obj:`None`
+        """
+        self.check_paths = check_paths
+        self.recursive = recursive
+        self.graph = include_graph.IncludeGraph(sphinx_source_dir)
+        self._signatures: dict[pathlib.Path, include_graph.FileSignature] = {}
+        self._hashes: dict[pathlib.Path, str | None] = {}
+        self._documents: dict[pathlib.Path, pathlib.Path] = {}
+
+    @property
+    def files(self) -> list[pathlib.Path]:
+        """Currently known rst files to check."""
+        return sorted(self._signatures)
+
+    def start(self) -> list[pathlib.Path]:
+        """Scan the watched paths for the first time.
+
+        :return: All found rst files to check
+        """
+        self._signatures = scan_rst_files(self.check_paths, recursive=self.recursive)
+        for path in self._signatures:
+            self._add_document(path)
+        return self.files
+
+    def poll(self) -> tuple[set[pathlib.Path], set[pathlib.Path]]:
+        """Scan the watched paths for changes since the last call.
+
+        Files with a new ``mtime`` or size but unchanged content are not reported.
+
+        :return: Tuple of the rst files to check again and the rst files which were removed
+        """
+        current = scan_rst_files(self.check_paths, recursive=self.recursive)
+        removed = self._signatures.keys() - current.keys()
+        to_check = current.keys() - self._signatures.keys()
+        # NOTE: Created and removed rst files can be included by other files.
+        changed_contents = {include_graph.normalize_path(p) for p in removed | to_check}
+
+        for normalized in changed_contents:
+            if self._documents.pop(normalized, None) is not None:
+                self._hashes.pop(normalized, None)
+                self.graph.remove_file(normalized)
+
+        for path in to_check:
+            self._add_document(path)
+
+        changed_files = {
+            include_graph.normalize_path(path)
+            for path, signature in current.items()
+            if path in self._signatures and self._signatures[path] != signature
+        } | self.graph.changed_files(self.graph.files - self._documents.keys())
+        self._signatures = current
+
+        for normalized in changed_files:
+            content_hash = hash_file_content(normalized)
+            if self._hashes.get(normalized) != content_hash:
+                self._hashes[normalized] = content_hash
+                changed_contents.add(normalized)
+
+        self.graph.refresh_files(changed_files)
+        for normalized in self.graph.affected_files(changed_contents):
+            to_check.add(self._documents[normalized])
+
+        return (to_check, removed)
+
+    def _add_document(self, path: pathlib.Path) -> None:
+        """Register a rst file to check.
+
+        :param path: Path of the file as found while scanning
+        """
+        normalized = include_graph.normalize_path(path)
+        self._documents[normalized] = path
+        self._hashes[normalized] = hash_file_content(normalized)
+        known_files = self.graph.files
+        self.graph.update_file(normalized)
+        for fragment in self.graph.files - known_files:
+            self._hashes.setdefault(fragment, hash_file_content(fragment))
@@ -0,0 +1,319 @@
+"""Checking of rst documents inside of zip and tar archives without extracting them.
+
+The archive is read twice: first to index its members and read the config files, then to stream
+the rst members into :py:func:`rstcheck_core.checker.check_sources`.
+
+- The issues' source origin is the path of the archive joined with the member's name, e.g.
+  ``docs.zip/guide/index.rst``.
+- The config of a member is resolved from the config files inside the archive like
+  :py:func:`rstcheck_core.config.load_config_file_from_dir_tree` does on the file system, but
+  the search stops at the archive's root.
+- Included files are checked for existence in the archive's index, also in nested rst code
+  blocks. ``include`` directives are stripped before the check, as docutils cannot read included
+  files from the archive.
+- With a pool the members are decoded and sent to the workers in chunks while the archive is
+  read, so only a few chunks are held in memory.
+
+Example usage:
+
+.. code-block:: python
+
+    import pathlib
+
+    from rstcheck_core import archive, config
+
+    archive_path = pathlib.Path("docs.tar.gz")
+    for member, errors in archive.check_archive(archive_path, config.RstcheckConfig()):
+        print(member, errors)
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import pathlib
+import tarfile
+import typing as t
+import zipfile
+
+from . import _sphinx_workarounds, checker, config, types
+
+if t.TYPE_CHECKING:
+    import multiprocessing.pool
+
+logger = logging.getLogger(__name__)
+
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+"""Suffixes of supported archives."""
+
+
+def is_archive(path: pathlib.Path) -> bool:
+    """Check if the path is a supported archive by its suffix.
+
+    :param path: Path to check
+    :return: If the path is an archive
+    """
+    return path.name.casefold().endswith(ARCHIVE_SUFFIXES)
+
+
+class ArchiveIndex:
+    """Index of the files in an archive with the contents of its config files."""
+
+    def __init__(
+        self,
+        archive_path: pathlib.Path,
+        files: set[pathlib.PurePosixPath],
+        config_files: dict[pathlib.PurePosixPath, str],
+    ) -> None:
+        """Initialize the :py:class:`ArchiveIndex`.
+
+        :param archive_path: Path of the archive
+        :param files: Names of all regular files in the archive
+        :param config_files: Map of the names of config files to their content
+        """
+        self.archive_path = archive_path
+        self.files = files
+        self.config_files = config_files
+        self._root = pathlib.Path(os.path.normpath(archive_path.absolute()))
+
+    def has_file(self, path: pathlib.Path) -> bool:
+        """Check if a file exists, e.g. an included file.
+
+        :param path: Path as resolved for an issue's source origin inside the archive
+        :return: If the file is in the archive or, for paths outside the archive, on the file
+            system
+        """
+        normalized_path = pathlib.Path(os.path.normpath(path.absolute()))
+        try:
+            member = normalized_path.relative_to(self._root)
+        except ValueError:
+            return path.is_file()
+        return pathlib.PurePosixPath(member.as_posix()) in self.files
+
+
+def read_archive_index(archive_path: pathlib.Path) -> ArchiveIndex:
+    """Index the files of an archive and read its config files.
+
+    :param archive_path: Path of the archive
+    :return: Index of the archive
+    """
+    logger.debug("Index archive '%s'.", archive_path)
+    files: set[pathlib.PurePosixPath] = set()
+    config_files: dict[pathlib.PurePosixPath, str] = {}
+    for member, data in _iter_archive_files(
+        archive_path, lambda member: member.name in config.CONFIG_FILES
+    ):
+        files.add(member)
+        if data is not None:
+            config_files[member] = data.decode("utf-8")
+    return ArchiveIndex(archive_path, files, config_files)
+
+
+def check_archive(
+    archive_path: pathlib.Path,
+    rstcheck_config: config.RstcheckConfig,
+    *,
+    overwrite_config: bool = True,
+    pool: multiprocessing.pool.Pool | None = None,
+) -> t.Generator[tuple[pathlib.PurePosixPath, list[types.LintError]], None, None]:
+    """Check the rst members of an archive and yield the issues per member.
+
+    Members in hidden directories or with hidden names are skipped like in directories.
+
+    :param archive_path: Path of the archive
+    :param rstcheck_config: Base configuration
+    :param overwrite_config: If config files in the archive overwrite the ``rstcheck_config``;
+        defaults to :py:obj:`True`
+    :param pool: Pool to check the members in parallel; see
+        :py:func:`rstcheck_core.checker.check_sources`;
+        defaults to :py:obj:`None` which means the members are checked in this process
+    :return: :py:obj:`None`
+    :yield: Tuples of the member's name and its issues
+    """
+    logger.info("Check archive '%s'.", archive_path)
+    index = read_archive_index(archive_path)
+    run_configs = _ArchiveRunConfigs(index, rstcheck_config, overwrite_config=overwrite_config)
+    members = (
+        (member, data)
+        for member, data in _iter_archive_files(archive_path, _is_checkable_rst_member)
+        if data is not None
+    )
+
+    for run_config, group in itertools.groupby(
+        members, key=lambda item: run_configs.get(item[0].parent)
+    ):
+        pending_errors: dict[str, tuple[pathlib.PurePosixPath, list[types.LintError]]] = {}
+        sources = _prepare_members(group, archive_path, index, run_config, pending_errors)
+        for name, errors in checker.check_sources(
+            sources, run_config, pool=pool, file_exists=index.has_file
+        ):
+            (member, include_errors) = pending_errors.pop(name)
+            yield (member, include_errors + errors)
+
+
+def _prepare_members(
+    members: t.Iterable[tuple[pathlib.PurePosixPath, bytes]],
+    archive_path: pathlib.Path,
+    index: ArchiveIndex,
+    run_config: config.RstcheckConfig,
+    pending_errors: dict[str, tuple[pathlib.PurePosixPath, list[types.LintError]]],
+) -> t.Generator[tuple[str, str], None, None]:
+    """Prepare members for :py:func:`rstcheck_core.checker.check_sources`.
+
+    :param members: Tuples of the members' names and contents
+    :param archive_path: Path of the archive
+    :param index: Index of the archive
+    :param run_config: Config of the members
+    :param pending_errors: Map the members' names and include issues are stored in by source name
+    :return: :py:obj:`None`
+    :yield: Tuples of the source name and the prepared source
+    """
+    for member, data in members:
+        source_origin = archive_path / member
+        (source, errors) = _prepare_member(data, source_origin, index, run_config)
+        pending_errors[str(source_origin)] = (member, errors)
+        yield (str(source_origin), source)
+
+
+def _prepare_member(
+    data: bytes,
+    source_origin: pathlib.Path,
+    index: ArchiveIndex,
+    run_config: config.RstcheckConfig,
+) -> tuple[str, list[types.LintError]]:
+    """Decode a member and check its includes against the archive index.
+
+    :param data: Raw content of the member
+    :param source_origin: Source origin of the member
+    :param index: Index of the archive
+    :param run_config: Config of the member
+    :return: Tuple of the source with stripped include directives and the found issues
+    """
+    try:
+        source = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        message = "(SEVERE/4) Archive member is not UTF-8 encoded."
+        return ("", [types.LintError(source_origin=source_origin, line_number=0, message=message)])
+
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    errors = list(
+        _sphinx_workarounds.yield_include_errors(
+            source,
+            source_origin,
+            run_config.ignore_messages,
+            sphinx_source_dir=run_config.sphinx_source_dir,
+            file_exists=index.has_file,
+        )
+    )
+    return (_sphinx_workarounds.strip_include_directives(source), errors)
+
+
+class _ArchiveRunConfigs:
+    """Run configs of the directories in an archive resolved from its config files."""
+
+    def __init__(
+        self,
+        index: ArchiveIndex,
+        rstcheck_config: config.RstcheckConfig,
+        *,
+        overwrite_config: bool,
+    ) -> None:
+        self.index = index
+        self.config = rstcheck_config
+        self.overwrite_config = overwrite_config
+        self._run_configs: dict[pathlib.PurePosixPath, config.RstcheckConfig] = {}
+
+    def get(self, directory: pathlib.PurePosixPath) -> config.RstcheckConfig:
+        """Get the run config for members in the directory.
+
+        Directories sharing a config file get the identical run config object.
+
+        :param directory: Directory inside the archive
+        :return: Base config merged with the nearest config file in the archive
+        """
+        run_config = self._run_configs.get(directory)
+        if run_config is not None:
+            return run_config
+
+        run_config = self.config
+        if self.config.config_path is None:
+            for search_dir in (directory, *directory.parents):
+                if search_dir in self._run_configs:
+                    run_config = self._run_configs[search_dir]
+                    break
+                file_config = self._load_config_file(search_dir)
+                if file_config is not None:
+                    run_config = config.merge_configs(
+                        self.config, file_config, config_add_is_dominant=self.overwrite_config
+                    )
+                    self._run_configs[search_dir] = run_config
+                    break
+        self._run_configs[directory] = run_config
+        return run_config
+
+    def _load_config_file(
+        self, directory: pathlib.PurePosixPath
+    ) -> config.RstcheckConfigFile | None:
+        """Load the first config file with rstcheck config in the directory.
+
+        :param directory: Directory inside the archive
+        :return: Config or :py:obj:`None` if the directory has none
+        """
+        for file_name in config.CONFIG_FILES:
+            content = self.index.config_files.get(directory / file_name)
+            if content is None:
+                continue
+            file_config = config.load_config_file_content(
+                content,
+                self.index.archive_path / directory / file_name,
+                log_missing_section_as_warning=file_name == ".rstcheck.cfg",
+                warn_unknown_settings=self.config.warn_unknown_settings or False,
+            )
+            if file_config is not None:
+                return file_config
+        return None
+
+
+def _is_checkable_rst_member(member: pathlib.PurePosixPath) -> bool:
+    """Check if the member is an rst file to check.
+
+    :param member: Name of the member
+    :return: If the member is checked
+    """
+    return member.suffix.casefold() == ".rst" and not any(
+        part.startswith(".") for part in member.parts
+    )
+
+
+def _iter_archive_files(
+    archive_path: pathlib.Path, read_member: t.Callable[[pathlib.PurePosixPath], bool]
+) -> t.Generator[tuple[pathlib.PurePosixPath, bytes | None], None, None]:
+    """Iterate over the regular files of an archive in archive order.
+
+    :param archive_path: Path of the archive
+    :param read_member: Function selecting the members whose content is read
+    :return: :py:obj:`None`
+    :yield: Tuples of the member's name and its content if selected
+    """
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir():
+                    continue
+                member = pathlib.PurePosixPath(info.filename)
+                yield (member, zip_file.read(info) if read_member(member) else None)
+        return
+
+    with tarfile.open(archive_path, "r:*") as tar_file:
+        for tar_info in tar_file:
+            if not tar_info.isfile():
+                continue
+            member = pathlib.PurePosixPath(tar_info.name)
+            data = None
+            if read_member(member):
+                member_file = tar_file.extractfile(tar_info)
+                data = member_file.read() if member_file is not None else b""
+            yield (member, data)
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import collections
 import contextlib
-import copy
+import contextvars
 import doctest
+import functools
 import io
+import itertools
 import json
 import locale
 import logging
+import math
+import mmap
 import os
 import pathlib
 import re
@@ -16,8 +23,10 @@ import shlex
 import subprocess
 import sys
 import tempfile
+import threading
 import typing as t
 import warnings
+import weakref
 import xml.etree.ElementTree as ET
 
 import docutils.core
@@ -26,7 +35,21 @@ import docutils.nodes
 import docutils.utils
 import docutils.writers
 
-from . import _docutils, _extras, _sphinx, _sphinx_workarounds, config, inline_config, types
+from . import (
+    _docutils,
+    _extras,
+    _sphinx,
+    _sphinx_workarounds,
+    config,
+    inline_config,
+    profiling,
+    stats,
+    types,
+)
+
+if t.TYPE_CHECKING:
+    import concurrent.futures
+    import multiprocessing.pool
 
 try:
     import yaml
@@ -42,45 +65,267 @@ logger = logging.getLogger(__name__)
 EXCEPTION_LINE_NO_REGEX = re.compile(r": line\s+([0-9]+)[^:]*$")
 DOCTEST_LINE_NO_REGEX = re.compile(r"line ([0-9]+)")
 MARKDOWN_LINK_REGEX = re.compile(r"\[[^\]]+\]\([^\)]+\)")
+ENCODING_DECLARATION_REGEX = re.compile(rb"coding[:=]\s*([-\w.]+)")
 
+_OTHER_LINE_BREAK_REGEX = re.compile("[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
 
-def check_file(
+DEFAULT_STREAM_CHUNK_SIZE = 16
+"""Default number of sources per pool task for sources streamed by :py:func:`check_sources`."""
+
+MMAP_THRESHOLD = 1024 * 1024
+"""Minimal size in bytes of source files to memory-map instead of reading them."""
+
+DEFAULT_MAX_SUBPROCESSES = os.cpu_count() or 1
+"""Default limit of concurrent code block check subprocesses per event loop for the async API."""
+
+_AsyncCheckerRunFunction = t.Callable[
+    [asyncio.Semaphore | None], t.Coroutine[t.Any, t.Any, list[types.LintError]]
+]
+_source_check_lock = threading.Lock()
+"""Serializes the in-process part of async checks, as docutils' registries are global."""
+_default_subprocess_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _get_default_subprocess_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting code block check subprocesses for the running event loop.
+
+    :return: Semaphore allowing :py:data:`DEFAULT_MAX_SUBPROCESSES` concurrent subprocesses
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _default_subprocess_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_SUBPROCESSES)
+        _default_subprocess_semaphores[loop] = semaphore
+    return semaphore
+
+
+def check_file(  # noqa: PLR0913
     source_file: pathlib.Path,
-    rstcheck_config: config.RstcheckConfig,
+    rstcheck_config: config.RstcheckConfig | config.RunConfig,
     overwrite_with_file_config: bool = True,  # noqa: FBT001,FBT002
+    *,
+    search_file_config: bool = True,
+    source: str | None = None,
+    profile: profiling.ProfileSettings | None = None,
+    max_errors: int | None = None,
 ) -> list[types.LintError]:
     """Check the given file for issues.
 
     On every call docutils' caches for roles and directives are cleared by reloading their modules.
 
     :param source_file: Path to file to check
-    :param rstcheck_config: Main configuration of the application
+    :param rstcheck_config: Main configuration of the application or a
+        :py:class:`rstcheck_core.config.RunConfig` already resolved for the file, which is used as
+        is without searching for a config file
     :param overwrite_with_file_config: If the loaded file config should overwrite the
         ``rstcheck_config``;
         defaults to :py:obj:`True`
+    :param search_file_config: If the directory tree of the file should be searched for a config
+        file to merge into the ``rstcheck_config``; :py:obj:`False` if the ``rstcheck_config`` is
+        already resolved for the file;
+        defaults to :py:obj:`True`
+    :param source: Content of the file e.g. from an unsaved editor buffer;
+        defaults to :py:obj:`None` which means the file is read
+    :param profile: Settings to profile the check;
+        defaults to :py:obj:`None` which means no profiling;
+        see :py:mod:`rstcheck_core.profiling`
+    :param max_errors: Stop the check after this many issues; see :py:func:`check_source`;
+        defaults to :py:obj:`None` which means all issues are reported
     :return: A list of found issues
     """
+    with (
+        profiling.profile_file(source_file, profile)
+        if profile is not None
+        else contextlib.nullcontext()
+    ):
+        return list(
+            yield_file_errors(
+                source_file,
+                rstcheck_config,
+                overwrite_with_file_config,
+                search_file_config=search_file_config,
+                source=source,
+                max_errors=max_errors,
+            )
+        )
+
+
+def yield_file_errors(
+    source_file: pathlib.Path,
+    rstcheck_config: config.RstcheckConfig | config.RunConfig,
+    overwrite_with_file_config: bool = True,  # noqa: FBT001,FBT002
+    *,
+    search_file_config: bool = True,
+    source: str | None = None,
+    max_errors: int | None = None,
+) -> types.YieldedLintError:
+    """Check the given file for issues and yield them as they are found.
+
+    Lazy variant of :py:func:`check_file`. Closing the generator early stops the check after the
+    currently running code block check, e.g. when the checked content is outdated.
+
+    :param source_file: Path to file to check
+    :param rstcheck_config: Main configuration of the application or the resolved run config;
+        see :py:func:`check_file`
+    :param overwrite_with_file_config: If the loaded file config should overwrite the
+        ``rstcheck_config``;
+        defaults to :py:obj:`True`
+    :param search_file_config: If the directory tree of the file should be searched for a config
+        file; see :py:func:`check_file`;
+        defaults to :py:obj:`True`
+    :param source: Content of the file; see :py:func:`check_file`;
+        defaults to :py:obj:`None` which means the file is read
+    :param max_errors: Stop the check after this many issues; see :py:func:`check_source`;
+        defaults to :py:obj:`None` which means all issues are reported
+    :return: :py:obj:`None`
+    :yield: Found issues
+    """
     logger.info("Check file'%s'", source_file)
-    run_config = _load_run_config(
-        source_file.parent, rstcheck_config, overwrite_config=overwrite_with_file_config
-    )
-    ignore_dict = _create_ignore_dict_from_config(run_config)
+    with stats.span(stats.PHASE_CONFIG):
+        run_config = _get_run_config(
+            source_file,
+            rstcheck_config,
+            overwrite_config=overwrite_with_file_config,
+            search_file_config=search_file_config,
+        )
 
-    source = _get_source(source_file)
+    if source is None:
+        with stats.span(stats.PHASE_READ):
+            source = _get_source(source_file)
 
-    _docutils.clean_docutils_directives_and_roles_cache()
+    with stats.span(stats.PHASE_REGISTRY_RESET):
+        _docutils.clean_docutils_directives_and_roles_cache()
 
     with _sphinx.load_sphinx_if_available():
-        return list(
-            check_source(
+        yield from check_source(
+            source,
+            source_file=source_file,
+            ignores=run_config.ignores,
+            report_level=run_config.report_level,
+            sphinx_source_dir=run_config.sphinx_source_dir,
+            warn_unknown_settings=run_config.warn_unknown_settings,
+            max_errors=max_errors,
+        )
+
+
+async def check_file_async(  # noqa: PLR0913
+    source_file: pathlib.Path,
+    rstcheck_config: config.RstcheckConfig | config.RunConfig,
+    overwrite_with_file_config: bool = True,  # noqa: FBT001,FBT002
+    *,
+    search_file_config: bool = True,
+    source: str | None = None,
+    executor: concurrent.futures.Executor | None = None,
+    subprocess_semaphore: asyncio.Semaphore | None = None,
+) -> list[types.LintError]:
+    """Check the given file for issues without blocking the event loop.
+
+    Async variant of :py:func:`check_file`. Reading the file, loading the config, the docutils
+    parsing and the in-process code block checks run in the ``executor``. As docutils' registries
+    are global, these parts of concurrent checks run one after another. The subprocesses checking
+    bash, C and C++ code blocks run concurrently via :py:func:`asyncio.create_subprocess_exec`.
+
+    :param source_file: Path to file to check
+    :param rstcheck_config: Main configuration of the application or the resolved run config;
+        see :py:func:`check_file`
+    :param overwrite_with_file_config: If the loaded file config should overwrite the
+        ``rstcheck_config``;
+        defaults to :py:obj:`True`
+    :param search_file_config: See :py:func:`check_file`; defaults to :py:obj:`True`
+    :param source: See :py:func:`check_file`;
+        defaults to :py:obj:`None` which means the file is read
+    :param executor: Thread based executor for the blocking parts;
+        defaults to :py:obj:`None` which means the event loop's default executor
+    :param subprocess_semaphore: Semaphore limiting the number of concurrent subprocesses;
+        defaults to :py:obj:`None` which means a limit of :py:data:`DEFAULT_MAX_SUBPROCESSES` per
+        event loop
+    :return: A list of found issues
+    """
+    loop = asyncio.get_running_loop()
+    prepared_check = await loop.run_in_executor(
+        executor,
+        contextvars.copy_context().run,
+        functools.partial(
+            _prepare_file_check,
+            source_file,
+            rstcheck_config,
+            overwrite_with_file_config,
+            search_file_config=search_file_config,
+            source=source,
+        ),
+    )
+    return await _finish_check_async(prepared_check, subprocess_semaphore)
+
+
+def _prepare_file_check(
+    source_file: pathlib.Path,
+    rstcheck_config: config.RstcheckConfig | config.RunConfig,
+    overwrite_with_file_config: bool,  # noqa: FBT001
+    *,
+    search_file_config: bool,
+    source: str | None,
+) -> _PreparedCheck:
+    """Run the in-process part of :py:func:`check_file_async`.
+
+    :param source_file: Path to file to check
+    :param rstcheck_config: Main configuration of the application or the resolved run config
+    :param overwrite_with_file_config: If the loaded file config should overwrite the
+        ``rstcheck_config``
+    :param search_file_config: If the directory tree of the file is searched for a config file
+    :param source: Content of the file or :py:obj:`None` to read the file
+    :return: Prepared check
+    """
+    with _source_check_lock:
+        logger.info("Check file'%s'", source_file)
+        with stats.span(stats.PHASE_CONFIG):
+            run_config = _get_run_config(
+                source_file,
+                rstcheck_config,
+                overwrite_config=overwrite_with_file_config,
+                search_file_config=search_file_config,
+            )
+
+        if source is None:
+            with stats.span(stats.PHASE_READ):
+                source = _get_source(source_file)
+
+        with stats.span(stats.PHASE_REGISTRY_RESET):
+            _docutils.clean_docutils_directives_and_roles_cache()
+
+        with _sphinx.load_sphinx_if_available():
+            return _prepare_source_check(
                 source,
                 source_file=source_file,
-                ignores=ignore_dict,
-                report_level=run_config.report_level or config.DEFAULT_REPORT_LEVEL,
+                ignores=run_config.ignores,
+                report_level=run_config.report_level,
                 sphinx_source_dir=run_config.sphinx_source_dir,
-                warn_unknown_settings=run_config.warn_unknown_settings or False,
+                warn_unknown_settings=run_config.warn_unknown_settings,
             )
-        )
+
+
+def _get_run_config(
+    source_file: pathlib.Path,
+    rstcheck_config: config.RstcheckConfig | config.RunConfig,
+    *,
+    overwrite_config: bool,
+    search_file_config: bool,
+) -> config.RunConfig:
+    """Get the run config for the file.
+
+    :param source_file: Path to file to check
+    :param rstcheck_config: Main configuration of the application or the already resolved run
+        config, which is returned as is
+    :param overwrite_config: If the loaded config should overwrite the ``rstcheck_config``
+    :param search_file_config: If the directory tree of the file is searched for a config file
+    :return: Snapshot of the config to check the file with
+    """
+    if isinstance(rstcheck_config, config.RunConfig):
+        return rstcheck_config
+    if not search_file_config:
+        return config.RunConfig.from_config(rstcheck_config)
+    return _load_run_config(source_file.parent, rstcheck_config, overwrite_config=overwrite_config)
 
 
 def _load_run_config(
@@ -88,7 +333,7 @@ def _load_run_config(
     rstcheck_config: config.RstcheckConfig,
     *,
     overwrite_config: bool = True,
-) -> config.RstcheckConfig:
+) -> config.RunConfig:
     """Load file specific config file and create run config.
 
     If the ``rstcheck_config`` does not contain a ``config_path`` the ``source_file_dir`` directory
@@ -99,18 +344,15 @@ def _load_run_config(
     :param rstcheck_config: Main configuration of the application
     :param overwrite_config: If the loaded config should overwrite the ``rstcheck_config``;
         defaults to :py:obj:`True`
-    :return: Merged config
+    :return: Snapshot of the merged config
     """
-    if rstcheck_config.config_path is not None:
-        return rstcheck_config
-
-    file_config = config.load_config_file_from_dir_tree(source_file_dir)
-
-    if file_config is None:
-        return rstcheck_config
-
-    return config.merge_configs(
-        copy.copy(rstcheck_config), file_config, config_add_is_dominant=overwrite_config
+    file_config = (
+        config.load_config_file_from_dir_tree(source_file_dir)
+        if rstcheck_config.config_path is None
+        else None
+    )
+    return config.RunConfig.from_config(
+        rstcheck_config, file_config, config_add_is_dominant=overwrite_config
     )
 
 
@@ -127,48 +369,112 @@ def _get_source(source_file: pathlib.Path) -> str:
         return sys.stdin.read()
 
     resolved_file_path = source_file.resolve()
+    with resolved_file_path.open("rb") as raw_file:
+        if os.fstat(raw_file.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                source = _decode_utf8_source(mapped_file)
+        else:
+            source = _decode_utf8_source(raw_file.read())
+    if source is not None:
+        return source
+
+    logger.debug("Read '%s' with docutils.", resolved_file_path)
     with contextlib.closing(docutils.io.FileInput(source_path=resolved_file_path)) as input_file:
         return input_file.read()
 
 
-def _replace_ignored_substitutions(source: str, ignore_substitutions: list[str]) -> str:
+def _decode_utf8_source(data: bytes | mmap.mmap) -> str | None:
+    """Decode the raw source as UTF-8 without BOM and with normalized newlines.
+
+    Sources which docutils versions read differently, as they contain line breaks other than CR and
+    LF or miss the final newline, are left to :py:class:`docutils.io.FileInput`.
+
+    :param data: Raw source
+    :return: Decoded source or :py:obj:`None` if the source is not UTF-8, declares another
+        encoding or has to be read by docutils
+    """
+    start = len(codecs.BOM_UTF8) if data[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+    for line in data[start : start + 1024].splitlines()[:2]:
+        match = ENCODING_DECLARATION_REGEX.search(line)
+        if match is not None and _get_codec_name(match.group(1)) != "utf-8":
+            return None
+
+    with memoryview(data) as view, view[start:] as content:
+        try:
+            source = str(content, "utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    if source and (not source.endswith("\n") or _OTHER_LINE_BREAK_REGEX.search(source)):
+        return None
+    return source
+
+
+def _get_codec_name(encoding: bytes) -> str | None:
+    """Get the normalized codec name of an encoding declaration.
+
+    :param encoding: Declared encoding
+    :return: Codec name or :py:obj:`None` if the encoding is unknown
+    """
+    try:
+        return codecs.lookup(encoding.decode("ascii")).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def _replace_ignored_substitutions(source: str, ignore_substitutions: t.Iterable[str]) -> str:
     """Replace rst substitutions from the ignore list with a dummy.
 
+    All substitutions are replaced in a single pass over the source.
+
     :param source: Source to replace substitutions in
     :param ignore_substitutions: Substitutions to replace with dummy
     :return: Cleaned source
     """
-    for substitution in ignore_substitutions:
-        source = source.replace(f"|{substitution}|", f"x{substitution}x")
-    return source
+    if "|" not in source:
+        return source
+    regex = _compile_ignored_substitutions_regex(frozenset(ignore_substitutions))
+    if regex is None:
+        return source
+    return regex.sub(r"x\1x", source)
+
 
+@functools.lru_cache(maxsize=32)
+def _compile_ignored_substitutions_regex(
+    ignore_substitutions: frozenset[str],
+) -> re.Pattern[str] | None:
+    """Compile a regex matching any of the substitution references to ignore.
 
-def _create_ignore_dict_from_config(rstcheck_config: config.RstcheckConfig) -> types.IgnoreDict:
-    """Extract ignore settings from config and create a :py:class:`rstcheck_core.types.IgnoreDict`.
+    Cached, so that the regex is compiled once per set of ignored substitutions.
 
-    :param rstcheck_config: Config to extract ignore settings from
-    :return: :py:class:`rstcheck_core.types.IgnoreDict`
+    :param ignore_substitutions: Substitutions to match
+    :return: Regex with the substitution's name as first group or :py:obj:`None` if there are no
+        substitutions to match
     """
-    return types.construct_ignore_dict(
-        messages=rstcheck_config.ignore_messages,
-        languages=rstcheck_config.ignore_languages,
-        directives=rstcheck_config.ignore_directives,
-        roles=rstcheck_config.ignore_roles,
-        substitutions=rstcheck_config.ignore_substitutions,
-    )
+    if not ignore_substitutions:
+        return None
+    # NOTE: Sorted, so that the regex does not depend on the iteration order of the set.
+    names = sorted(ignore_substitutions)
+    return re.compile(r"\|(" + "|".join(map(re.escape, names)) + r")\|")
 
 
-def check_source(
+def check_source(  # noqa: PLR0913
     source: str,
     source_file: types.SourceFileOrString | None = None,
-    ignores: types.IgnoreDict | None = None,
+    ignores: types.IgnoreDict | types.Ignores | None = None,
     report_level: config.ReportLevel = config.DEFAULT_REPORT_LEVEL,
     sphinx_source_dir: pathlib.Path | None = None,
     *,
     warn_unknown_settings: bool = False,
+    max_errors: int | None = None,
 ) -> types.YieldedLintError:
     """Check the given rst source for issues.
 
+    With ``max_errors`` the rst issues are collected before the code blocks are checked and the
+    remaining code block checkers are skipped once the limit is reached.
+
     :param source_file: Path to file the source comes from if it comes from a file;
         defaults to :py:obj:`None`
     :param ignores: Ignore information; defaults to :py:obj:`None`
@@ -176,53 +482,424 @@ def check_source(
         :py:data:`rstcheck_core.config.DEFAULT_REPORT_LEVEL`
     :param warn_unknown_settings: If a warning should be logged for unknown settings in config file;
         defaults to :py:obj:`False`
+    :param max_errors: Stop the check after this many issues;
+        defaults to :py:obj:`None` which means all issues are reported
     :return: :py:obj:`None`
     :yield: Found issues
     """
-    source_origin: types.SourceFileOrString = source_file or "<string>"
-    if isinstance(source_origin, pathlib.Path) and source_origin.name == "-":
-        source_origin = "<stdin>"
+    source_origin = _get_source_origin(source_file)
     logger.info("Check source from '%s'", source_origin)
-    ignores = ignores or types.construct_ignore_dict()
-    ignores["directives"].extend(
-        inline_config.find_ignored_directives(
-            source, source_origin, warn_unknown_settings=warn_unknown_settings
-        )
+    ignores = _add_inline_config_ignores(
+        source, source_origin, ignores, warn_unknown_settings=warn_unknown_settings
     )
-    ignores["roles"].extend(
-        inline_config.find_ignored_roles(
-            source, source_origin, warn_unknown_settings=warn_unknown_settings
+
+    include_errors: list[types.LintError] = []
+    if _extras.SPHINX_INSTALLED:
+        include_errors = list(
+            _sphinx_workarounds.yield_include_errors(
+                source, source_origin, ignores.messages, sphinx_source_dir=sphinx_source_dir
+            )
         )
-    )
-    ignores["substitutions"].extend(
-        inline_config.find_ignored_substitutions(
-            source, source_origin, warn_unknown_settings=warn_unknown_settings
+        source = _sphinx_workarounds.strip_include_directives(source)
+
+    if max_errors is None:
+        yield from include_errors
+        writer, rst_errors = _parse_source(
+            source, source_origin, ignores, report_level, sphinx_source_dir
         )
+        yield from _run_code_checker_and_filter_errors(writer.checkers, ignores.messages)
+        yield from _parse_rst_errors_with_span(rst_errors, source_origin, ignores.messages)
+        return
+
+    writer, rst_errors = _parse_source(
+        source, source_origin, ignores, report_level, sphinx_source_dir
     )
-    ignores["languages"].extend(
-        inline_config.find_ignored_languages(
-            source, source_origin, warn_unknown_settings=warn_unknown_settings
-        )
+    rst_lint_errors = _parse_rst_errors_with_span(rst_errors, source_origin, ignores.messages)
+    code_block_error_limit = max(max_errors - len(include_errors) - len(rst_lint_errors), 0)
+    code_block_errors = itertools.islice(
+        _run_code_checker_and_filter_errors(writer.checkers, ignores.messages),
+        code_block_error_limit,
     )
+    yield from itertools.islice(
+        itertools.chain(include_errors, code_block_errors, rst_lint_errors), max_errors
+    )
+
 
+def check_sources(
+    sources: t.Mapping[str, str] | t.Iterable[tuple[str, str]],
+    rstcheck_config: config.RstcheckConfig,
+    *,
+    pool: multiprocessing.pool.Pool | None = None,
+    chunk_size: int | None = None,
+    file_exists: t.Callable[[pathlib.Path], bool] | None = None,
+) -> t.Generator[tuple[str, list[types.LintError]], None, None]:
+    """Check many rst sources with one setup and yield the issues per source.
+
+    The config is used as is for all sources; no config files are searched. Sphinx is set up
+    once and its directives and roles are kept registered, see
+    :py:func:`rstcheck_core._sphinx.load_sphinx_warm`, and the code block results are cached, see
+    :py:func:`cache_code_block_results`, as are the lookups of included files, see
+    :py:func:`rstcheck_core._sphinx_workarounds.cache_include_lookups`. Ignores from inline config
+    comments only apply to the source they are in.
+
+    Without a pool the setup stays active while the generator is suspended. Exhaust or close the
+    generator before running other checks in the same thread.
+
+    :param sources: Map of names to sources or iterable of tuples of name and source; the names
+        are used as paths for the source origin of the issues; an iterable is consumed lazily,
+        e.g. documents read with :py:func:`rstcheck_core.framing.read_documents`; with a pool only
+        a few chunks of sources are held at a time
+    :param rstcheck_config: Configuration for all sources
+    :param pool: Pool to check the sources in parallel; each task sets up once for a chunk of
+        sources; defaults to :py:obj:`None` which means the sources are checked in this process
+    :param chunk_size: Number of sources per task of the pool;
+        defaults to :py:obj:`None` which means about four tasks per CPU for a map of sources and
+        :py:data:`DEFAULT_STREAM_CHUNK_SIZE` for other iterables
+    :param file_exists: Function checking if an included file exists, e.g. in an archive; see
+        :py:func:`rstcheck_core._sphinx_workarounds.lookup_included_files_with`;
+        defaults to :py:obj:`None` which means the file system is checked
+    :return: :py:obj:`None`
+    :yield: Tuples of name and issues in the order of the sources
+    """
+    items_iterable = sources.items() if isinstance(sources, t.Mapping) else sources
+    if pool is None:
+        yield from _yield_named_source_errors(items_iterable, rstcheck_config, file_exists)
+        return
+
+    if isinstance(items_iterable, t.Sized):
+        if len(items_iterable) <= 1:
+            yield from _yield_named_source_errors(items_iterable, rstcheck_config, file_exists)
+            return
+        chunk_size = chunk_size or math.ceil(len(items_iterable) / ((os.cpu_count() or 1) * 4))
+
+    chunks = _iter_chunks(items_iterable, chunk_size or DEFAULT_STREAM_CHUNK_SIZE)
+    check_chunk = functools.partial(
+        _check_named_sources, rstcheck_config=rstcheck_config, file_exists=file_exists
+    )
+    # NOTE: Only a few chunks are submitted ahead, so that an iterable is not read into memory.
+    pending: collections.deque[
+        multiprocessing.pool.AsyncResult[list[tuple[str, list[types.LintError]]]]
+    ] = collections.deque()
+    max_pending = (os.cpu_count() or 1) * 2
+    for chunk in chunks:
+        pending.append(pool.apply_async(check_chunk, (chunk,)))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().get()
+    while pending:
+        yield from pending.popleft().get()
+
+
+def _iter_chunks(
+    items: t.Iterable[tuple[str, str]], chunk_size: int
+) -> t.Generator[list[tuple[str, str]], None, None]:
+    """Split the items lazily into chunks (Helper function).
+
+    :param items: Items to split
+    :param chunk_size: Number of items per chunk
+    :return: :py:obj:`None`
+    :yield: Chunks of the items in order
+    """
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _check_named_sources(
+    items: list[tuple[str, str]],
+    rstcheck_config: config.RstcheckConfig,
+    file_exists: t.Callable[[pathlib.Path], bool] | None = None,
+) -> list[tuple[str, list[types.LintError]]]:
+    """Check named sources with one setup (Helper function for pool workers).
+
+    :param items: Tuples of name and source
+    :param rstcheck_config: Configuration for all sources
+    :param file_exists: Function checking if an included file exists or :py:obj:`None`
+    :return: Tuples of name and issues
+    """
+    return list(_yield_named_source_errors(items, rstcheck_config, file_exists))
+
+
+def _yield_named_source_errors(
+    items: t.Iterable[tuple[str, str]],
+    rstcheck_config: config.RstcheckConfig,
+    file_exists: t.Callable[[pathlib.Path], bool] | None = None,
+) -> t.Generator[tuple[str, list[types.LintError]], None, None]:
+    """Check named sources with one setup and yield the issues per source.
+
+    :param items: Tuples of name and source
+    :param rstcheck_config: Configuration for all sources
+    :param file_exists: Function checking if an included file exists or :py:obj:`None`
+    :return: :py:obj:`None`
+    :yield: Tuples of name and issues
+    """
+    run_config = config.RunConfig.from_config(rstcheck_config)
+
+    with (
+        _sphinx.load_sphinx_warm(),
+        cache_code_block_results(),
+        _sphinx_workarounds.cache_include_lookups(),
+        _sphinx_workarounds.lookup_included_files_with(file_exists)
+        if file_exists is not None
+        else contextlib.nullcontext(),
+    ):
+        for name, source in items:
+            with stats.span(stats.PHASE_REGISTRY_RESET):
+                _docutils.clean_docutils_directives_and_roles_cache()
+            errors = list(
+                check_source(
+                    source,
+                    source_file=pathlib.Path(name),
+                    ignores=run_config.ignores,
+                    report_level=run_config.report_level,
+                    sphinx_source_dir=run_config.sphinx_source_dir,
+                    warn_unknown_settings=run_config.warn_unknown_settings,
+                )
+            )
+            yield (name, errors)
+
+
+async def check_source_async(  # noqa: PLR0913
+    source: str,
+    source_file: types.SourceFileOrString | None = None,
+    ignores: types.IgnoreDict | types.Ignores | None = None,
+    report_level: config.ReportLevel = config.DEFAULT_REPORT_LEVEL,
+    sphinx_source_dir: pathlib.Path | None = None,
+    *,
+    warn_unknown_settings: bool = False,
+    executor: concurrent.futures.Executor | None = None,
+    subprocess_semaphore: asyncio.Semaphore | None = None,
+) -> list[types.LintError]:
+    """Check the given rst source for issues without blocking the event loop.
+
+    Async variant of :py:func:`check_source`; see :py:func:`check_file_async` for how the work is
+    split between the ``executor`` and the event loop.
+
+    :param source: Rst source to check
+    :param source_file: Path to file the source comes from if it comes from a file;
+        defaults to :py:obj:`None`
+    :param ignores: Ignore information; defaults to :py:obj:`None`
+    :param report_level: Report level; defaults to
+        :py:data:`rstcheck_core.config.DEFAULT_REPORT_LEVEL`
+    :param sphinx_source_dir: Sphinx ``source`` directory; defaults to :py:obj:`None`
+    :param warn_unknown_settings: If a warning should be logged for unknown settings in config file;
+        defaults to :py:obj:`False`
+    :param executor: Thread based executor for the blocking parts;
+        defaults to :py:obj:`None` which means the event loop's default executor
+    :param subprocess_semaphore: Semaphore limiting the number of concurrent subprocesses;
+        defaults to :py:obj:`None` which means a limit of :py:data:`DEFAULT_MAX_SUBPROCESSES` per
+        event loop
+    :return: A list of found issues
+    """
+
+    def prepare_check() -> _PreparedCheck:
+        """Run the in-process part of the check."""
+        with _source_check_lock:
+            return _prepare_source_check(
+                source,
+                source_file,
+                ignores,
+                report_level,
+                sphinx_source_dir,
+                warn_unknown_settings=warn_unknown_settings,
+            )
+
+    loop = asyncio.get_running_loop()
+    prepared_check = await loop.run_in_executor(
+        executor, contextvars.copy_context().run, prepare_check
+    )
+    return await _finish_check_async(prepared_check, subprocess_semaphore)
+
+
+class _PreparedCheck(t.NamedTuple):
+    """Results of the in-process part of an async check."""
+
+    include_errors: list[types.LintError]
+    code_block_results: list[list[types.LintError] | _AsyncCheckerRunFunction]
+    """Filtered issues of in-process checked code blocks or the pending subprocess checks."""
+    rst_errors: list[types.LintError]
+    ignore_messages: t.Pattern[str] | None
+
+
+def _prepare_source_check(
+    source: str,
+    source_file: types.SourceFileOrString | None,
+    ignores: types.IgnoreDict | types.Ignores | None,
+    report_level: config.ReportLevel,
+    sphinx_source_dir: pathlib.Path | None,
+    *,
+    warn_unknown_settings: bool,
+) -> _PreparedCheck:
+    """Run all parts of :py:func:`check_source` except the code block checks in subprocesses.
+
+    :param source: Rst source to check
+    :param source_file: Path to file the source comes from if it comes from a file
+    :param ignores: Ignore information
+    :param report_level: Report level
+    :param sphinx_source_dir: Sphinx ``source`` directory
+    :param warn_unknown_settings: If a warning should be logged for unknown settings
+    :return: Prepared check
+    """
+    source_origin = _get_source_origin(source_file)
+    logger.info("Check source from '%s'", source_origin)
+    ignores = _add_inline_config_ignores(
+        source, source_origin, ignores, warn_unknown_settings=warn_unknown_settings
+    )
+
+    include_errors: list[types.LintError] = []
     if _extras.SPHINX_INSTALLED:
-        yield from _sphinx_workarounds.yield_include_errors(
-            source, source_origin, ignores["messages"], sphinx_source_dir=sphinx_source_dir
+        include_errors = list(
+            _sphinx_workarounds.yield_include_errors(
+                source, source_origin, ignores.messages, sphinx_source_dir=sphinx_source_dir
+            )
         )
         source = _sphinx_workarounds.strip_include_directives(source)
 
-    source = _replace_ignored_substitutions(source, ignores["substitutions"])
+    writer, rst_errors = _parse_source(
+        source, source_origin, ignores, report_level, sphinx_source_dir
+    )
+
+    code_block_results: list[list[types.LintError] | _AsyncCheckerRunFunction] = [
+        run_async
+        if run_async is not None
+        else list(_run_code_checker_and_filter_errors([run], ignores.messages))
+        for run, run_async in zip(writer.checkers, writer.async_checkers, strict=True)
+    ]
+
+    return _PreparedCheck(
+        include_errors=include_errors,
+        code_block_results=code_block_results,
+        rst_errors=_parse_rst_errors_with_span(rst_errors, source_origin, ignores.messages),
+        ignore_messages=ignores.messages,
+    )
+
+
+async def _finish_check_async(
+    prepared_check: _PreparedCheck, subprocess_semaphore: asyncio.Semaphore | None
+) -> list[types.LintError]:
+    """Run the pending subprocess checks concurrently and collect all issues in order.
+
+    :param prepared_check: Result of the in-process part of the check
+    :param subprocess_semaphore: Semaphore limiting the number of concurrent subprocesses
+    :return: A list of found issues
+    """
+    async_results = iter(
+        await asyncio.gather(
+            *(
+                run_async(subprocess_semaphore)
+                for run_async in prepared_check.code_block_results
+                if not isinstance(run_async, list)
+            )
+        )
+    )
+
+    errors = list(prepared_check.include_errors)
+    for code_block_result in prepared_check.code_block_results:
+        if isinstance(code_block_result, list):
+            errors += code_block_result
+            continue
+        ignore_messages = prepared_check.ignore_messages
+        errors += [
+            error
+            for error in next(async_results)
+            if not (ignore_messages and ignore_messages.search(error["message"]))
+        ]
+    return errors + prepared_check.rst_errors
+
+
+def _parse_rst_errors_with_span(
+    rst_errors: str,
+    source_origin: types.SourceFileOrString,
+    ignore_messages: t.Pattern[str] | None,
+) -> list[types.LintError]:
+    """Parse and filter the rst errors as ``error_parsing`` phase.
+
+    :param rst_errors: String with rst errors
+    :param source_origin: Origin of the source with the errors
+    :param ignore_messages: Regex for ignoring error messages
+    :return: Parsed and filtered issues
+    """
+    if not rst_errors:
+        return []
+    with stats.span(stats.PHASE_ERROR_PARSING):
+        return list(_parse_and_filter_rst_errors(rst_errors, source_origin, ignore_messages))
+
+
+def _get_source_origin(
+    source_file: types.SourceFileOrString | None,
+) -> types.SourceFileOrString:
+    """Get the source origin used in errors for the source file.
+
+    :param source_file: Path to file the source comes from if it comes from a file
+    :return: Path of the file, ``"<stdin>"`` for ``-`` or ``"<string>"`` if no file is given
+    """
+    source_origin: types.SourceFileOrString = source_file or "<string>"
+    if isinstance(source_origin, pathlib.Path) and source_origin.name == "-":
+        source_origin = "<stdin>"
+    return source_origin
+
+
+def _add_inline_config_ignores(
+    source: str,
+    source_origin: types.SourceFileOrString,
+    ignores: types.IgnoreDict | types.Ignores | None,
+    *,
+    warn_unknown_settings: bool,
+) -> types.Ignores:
+    """Derive the ignores extended with the ignores from inline config comments of the source.
+
+    The passed ignores are not changed.
+
+    :param source: Source to search for inline config comments
+    :param source_origin: Origin of the source
+    :param ignores: Ignore information to extend or :py:obj:`None` to create new one
+    :param warn_unknown_settings: If a warning should be logged for unknown settings
+    :return: Extended ignore information
+    """
+    return types.Ignores.from_ignore_dict(ignores).extend(
+        directives=inline_config.find_ignored_directives(
+            source, source_origin, warn_unknown_settings=warn_unknown_settings
+        ),
+        roles=inline_config.find_ignored_roles(
+            source, source_origin, warn_unknown_settings=warn_unknown_settings
+        ),
+        substitutions=inline_config.find_ignored_substitutions(
+            source, source_origin, warn_unknown_settings=warn_unknown_settings
+        ),
+        languages=inline_config.find_ignored_languages(
+            source, source_origin, warn_unknown_settings=warn_unknown_settings
+        ),
+    )
+
+
+def _parse_source(
+    source: str,
+    source_origin: types.SourceFileOrString,
+    ignores: types.Ignores,
+    report_level: config.ReportLevel,
+    sphinx_source_dir: pathlib.Path | None,
+) -> tuple[_CheckWriter, str]:
+    """Parse the source with docutils and collect the code block checkers.
+
+    :param source: Rst source to parse; include directives must already be stripped
+    :param source_origin: Origin of the source
+    :param ignores: Ignore information
+    :param report_level: Report level
+    :param sphinx_source_dir: Sphinx ``source`` directory
+    :return: Tuple of the writer holding the code block checkers and the rst errors as string
+    """
+    source = _replace_ignored_substitutions(source, ignores.substitutions)
 
     _docutils.register_code_directive(
-        ignore_code_directive="code" in ignores["directives"],
-        ignore_codeblock_directive="code-block" in ignores["directives"],
-        ignore_sourcecode_directive="sourcecode" in ignores["directives"],
+        ignore_code_directive="code" in ignores.directives,
+        ignore_codeblock_directive="code-block" in ignores.directives,
+        ignore_sourcecode_directive="sourcecode" in ignores.directives,
     )
 
-    _docutils.ignore_directives_and_roles(ignores["directives"] or [], ignores["roles"] or [])
+    _docutils.ignore_directives_and_roles(ignores.directives, ignores.roles)
 
     if _extras.SPHINX_INSTALLED:
-        _sphinx.load_sphinx_ignores()
+        with stats.span(stats.PHASE_SPHINX_LOAD):
+            _sphinx.load_sphinx_ignores()
 
     writer = _CheckWriter(
         source, source_origin, ignores, report_level, sphinx_source_dir=sphinx_source_dir
@@ -233,10 +910,9 @@ def check_source(
     # This is a hack to avoid false positive from docutils (#23). docutils mistakes BOMs for actual
     # visible letters. This results in the "underline too short" warning firing.
     # This is tested in the CLI integration tests with the `testing/examples/good/bom.rst` file.
-    with contextlib.suppress(UnicodeError):
-        source = source.encode("utf-8").decode("utf-8-sig")
+    source = source.removeprefix("\ufeff")
 
-    with contextlib.suppress(docutils.utils.SystemMessage):
+    with stats.span(stats.PHASE_DOCUTILS_PARSE), contextlib.suppress(docutils.utils.SystemMessage):
         # Sphinx will sometimes throw an `AttributeError` trying to access
         # "self.state.document.settings.env". Ignore this for now until we
         # figure out a better approach.
@@ -266,14 +942,7 @@ def check_source(
                 source_origin,
             )
 
-    yield from _run_code_checker_and_filter_errors(writer.checkers, ignores["messages"])
-
-    rst_errors = string_io.getvalue().strip()
-
-    if not rst_errors:
-        return
-
-    yield from _parse_and_filter_rst_errors(rst_errors, source_origin, ignores["messages"])
+    return (writer, string_io.getvalue().strip())
 
 
 def _run_code_checker_and_filter_errors(
@@ -325,7 +994,7 @@ class _CheckWriter(docutils.writers.Writer):  # type: ignore[type-arg]
         self,
         source: str,
         source_origin: types.SourceFileOrString,
-        ignores: types.IgnoreDict | None = None,
+        ignores: types.Ignores | None = None,
         report_level: config.ReportLevel = config.DEFAULT_REPORT_LEVEL,
         sphinx_source_dir: pathlib.Path | None = None,
         *,
@@ -344,6 +1013,7 @@ class _CheckWriter(docutils.writers.Writer):  # type: ignore[type-arg]
         """
         super().__init__()
         self.checkers: list[types.CheckerRunFunction] = []
+        self.async_checkers: list[_AsyncCheckerRunFunction | None] = []
         self.source = source
         self.source_origin = source_origin
         self.ignores = ignores
@@ -368,6 +1038,7 @@ class _CheckWriter(docutils.writers.Writer):  # type: ignore[type-arg]
         )
         self.document.walkabout(visitor)
         self.checkers += visitor.checkers
+        self.async_checkers += visitor.async_checkers
 
 
 class _CheckTranslator(docutils.nodes.NodeVisitor):
@@ -378,7 +1049,7 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
         document: docutils.nodes.document,
         source: str,
         source_origin: types.SourceFileOrString,
-        ignores: types.IgnoreDict | None = None,
+        ignores: types.Ignores | None = None,
         report_level: config.ReportLevel = config.DEFAULT_REPORT_LEVEL,
         sphinx_source_dir: pathlib.Path | None = None,
         *,
@@ -398,9 +1069,10 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
         """
         docutils.nodes.NodeVisitor.__init__(self, document)
         self.checkers: list[types.CheckerRunFunction] = []
+        self.async_checkers: list[_AsyncCheckerRunFunction | None] = []
         self.source = source
         self.source_origin = source_origin
-        self.ignores = ignores or types.construct_ignore_dict()
+        self.ignores = ignores or types.Ignores()
         self.report_level = report_level
         self.warn_unknown_settings = warn_unknown_settings
         self.code_block_checker = CodeBlockChecker(
@@ -423,7 +1095,16 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
 
         :param node: The doctest node
         """
-        if "doctest" in self.ignores["languages"]:
+        stats.count(f"{stats.COUNTER_CODE_BLOCK_SEEN}:doctest")
+        self._add_doctest_check(node)
+
+    def _add_doctest_check(self, node: docutils.nodes.Element) -> None:
+        """Add check for syntax of doctest unless doctest is ignored.
+
+        :param node: The doctest or code block node
+        """
+        if "doctest" in self.ignores.languages:
+            stats.count(f"{stats.COUNTER_CODE_BLOCK_IGNORED_LANGUAGE}:doctest")
             return
 
         self._add_check(
@@ -450,6 +1131,7 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
                 return
             language = classes[-1]
 
+        stats.count(f"{stats.COUNTER_CODE_BLOCK_SEEN}:{language}")
         directive_line = _get_code_block_directive_line(node, self.source)
         if directive_line is None:
             logger.warning(
@@ -469,20 +1151,24 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
                 self.source_origin,
                 node.line,
             )
+            stats.count(f"{stats.COUNTER_CODE_BLOCK_IGNORE_COMMENT}:{language}")
             return
 
-        if language in self.ignores["languages"]:
+        if language in self.ignores.languages:
+            stats.count(f"{stats.COUNTER_CODE_BLOCK_IGNORED_LANGUAGE}:{language}")
             return
 
         if language == "doctest" or (
             language == "python" and node.rawsource.lstrip().startswith(">>> ")
         ):
-            self.visit_doctest_block(node)
+            self._add_doctest_check(node)
             raise docutils.nodes.SkipNode
 
         if self.code_block_checker.language_is_supported(language):
             run = self.code_block_checker.create_checker(node.rawsource, language)
             self._add_check(node=node, run=run, language=language, is_code_node=is_code_node)
+        else:
+            stats.count(f"{stats.COUNTER_CODE_BLOCK_UNSUPPORTED}:{language}")
 
         raise docutils.nodes.SkipNode
 
@@ -518,28 +1204,64 @@ class _CheckTranslator(docutils.nodes.NodeVisitor):
             all_results = run()
             if all_results is not None:
                 if all_results:
-                    for result in all_results:
-                        error_offset = result["line_number"] - 1
-
-                        line_number = getattr(node, "line", None)
-                        if line_number is not None:
-                            yield types.LintError(
-                                source_origin=result["source_origin"],
-                                line_number=_beginning_of_code_block(
-                                    node=node,
-                                    line_number=line_number,
-                                    full_contents=self.source,
-                                    is_code_node=is_code_node,
-                                )
-                                + error_offset,
-                                message=f"({language}) {result['message']}",
+                    with stats.span(f"{stats.PHASE_CODE_BLOCK}:{language}"):
+                        errors = list(
+                            self._locate_errors(
+                                node, language, all_results, is_code_node=is_code_node
                             )
+                        )
+                    yield from errors
                 else:
                     yield types.LintError(
                         source_origin=self.source_origin, line_number=0, message="unknown error"
                     )
 
+        async def run_check_async(
+            subprocess_semaphore: asyncio.Semaphore | None,
+        ) -> list[types.LintError]:
+            """Return found issues."""
+            with stats.span(f"{stats.PHASE_CODE_BLOCK}:{language}"):
+                results = await self.code_block_checker.check_async(
+                    node.rawsource, language, subprocess_semaphore
+                )
+            return list(self._locate_errors(node, language, results, is_code_node=is_code_node))
+
         self.checkers.append(run_check)
+        self.async_checkers.append(run_check_async if language in _SUBPROCESS_LANGUAGES else None)
+
+    def _locate_errors(
+        self,
+        node: docutils.nodes.Element,
+        language: str,
+        results: t.Iterable[types.LintError],
+        *,
+        is_code_node: bool,
+    ) -> types.YieldedLintError:
+        """Move the issues found in a code block to their line in the whole source.
+
+        :param node: The checked node
+        :param language: The language of the node
+        :param results: Issues with line numbers relative to the code block
+        :param is_code_node: If it is a code block node
+        :return: :py:obj:`None`
+        :yield: Issues with line numbers in the whole source
+        """
+        for result in results:
+            error_offset = result["line_number"] - 1
+
+            line_number = getattr(node, "line", None)
+            if line_number is not None:
+                yield types.LintError(
+                    source_origin=result["source_origin"],
+                    line_number=_beginning_of_code_block(
+                        node=node,
+                        line_number=line_number,
+                        full_contents=self.source,
+                        is_code_node=is_code_node,
+                    )
+                    + error_offset,
+                    message=f"({language}) {result['message']}",
+                )
 
     def unknown_visit(self, node: docutils.nodes.Node) -> None:
         """Ignore."""
@@ -608,13 +1330,168 @@ def _get_code_block_directive_line(node: docutils.nodes.Element, full_contents:
     return None
 
 
+_SUBPROCESS_LANGUAGES = frozenset(("bash", "c", "cpp"))
+"""Languages checked by external programs in a subprocess."""
+_UNCACHEABLE_LANGUAGES = frozenset(("rst",))
+"""Languages whose results depend on more than the code block itself."""
+_DIRECTORY_DEPENDENT_LANGUAGES = _SUBPROCESS_LANGUAGES
+"""Languages whose results depend on the directory of the source, as they run in a subprocess."""
+
+
+class CodeBlockResultCache:
+    """LRU cache for results of code block checks.
+
+    Cached results are stored without their source origin, so that identical code blocks from
+    different sources share one entry. The source origin is added back when the results are used.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """Initialize an empty :py:class:`CodeBlockResultCache`.
+
+        :param max_size: Maximum number of cached code blocks; defaults to ``4096``
+        """
+        self.max_size = max_size
+        self._results: collections.OrderedDict[t.Hashable, list[tuple[int, str]]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Get the number of cached code blocks."""
+        return len(self._results)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
+
+    def get(self, key: t.Hashable) -> list[tuple[int, str]] | None:
+        """Get cached results.
+
+        :param key: Key of the code block
+        :return: List of tuples of line number and message or :py:obj:`None` if not cached
+        """
+        results = self._results.get(key)
+        if results is not None:
+            self._results.move_to_end(key)
+        return results
+
+    def put(self, key: t.Hashable, results: list[tuple[int, str]]) -> None:
+        """Cache results and evict the least recently used entry if the cache is full.
+
+        :param key: Key of the code block
+        :param results: List of tuples of line number and message
+        """
+        self._results[key] = results
+        self._results.move_to_end(key)
+        if len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+
+_code_block_result_cache: contextvars.ContextVar[CodeBlockResultCache | None] = (
+    contextvars.ContextVar("code_block_result_cache", default=None)
+)
+
+
+@contextlib.contextmanager
+def cache_code_block_results(
+    cache: CodeBlockResultCache | None = None,
+) -> t.Generator[CodeBlockResultCache, None, None]:
+    """Contextmanager to cache the results of code block checks.
+
+    Inside the context identical code blocks are only checked once. Nested rst code blocks are
+    never cached, as their results depend on the ignore settings.
+
+    :param cache: Cache to use; defaults to :py:obj:`None` which creates a new one
+    :return: :py:obj:`None`
+    :yield: The used cache
+    """
+    cache = cache if cache is not None else CodeBlockResultCache()
+    token = _code_block_result_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _code_block_result_cache.reset(token)
+
+
+_subprocess_timeout: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "subprocess_timeout", default=None
+)
+
+
+@contextlib.contextmanager
+def subprocess_timeout(timeout: float | None) -> t.Generator[None, None, None]:
+    """Contextmanager to limit the run time of the subprocesses checking code blocks.
+
+    Inside the context the subprocesses checking bash, C and C++ code blocks are killed after
+    ``timeout`` seconds. The timeout is reported as an issue of the code block instead of its
+    check results.
+
+    :param timeout: Seconds a subprocess may run; :py:obj:`None` means no limit
+    :raises ValueError: If the timeout is not positive
+    :return: :py:obj:`None`
+    :yield: :py:obj:`None`
+    """
+    if timeout is not None and timeout <= 0:
+        msg = f"Subprocess timeout must be positive, got {timeout}."
+        raise ValueError(msg)
+    token = _subprocess_timeout.set(timeout)
+    try:
+        yield
+    finally:
+        _subprocess_timeout.reset(token)
+
+
+_cancel_check: contextvars.ContextVar[t.Callable[[], bool] | None] = contextvars.ContextVar(
+    "cancel_check", default=None
+)
+
+
+class CheckCancelledError(Exception):
+    """The check was cancelled; see :py:func:`cancel_check_when`."""
+
+
+@contextlib.contextmanager
+def cancel_check_when(is_cancelled: t.Callable[[], bool]) -> t.Generator[None, None, None]:
+    """Contextmanager to cancel checks whose results are no longer needed.
+
+    Inside the context ``is_cancelled`` is called before each subprocess checking a bash, C or C++
+    code block is started. If it returns :py:obj:`True` the check is aborted with a
+    :py:class:`CheckCancelledError` instead of starting the subprocess.
+
+    :param is_cancelled: Function telling if the running check is cancelled
+    :return: :py:obj:`None`
+    :yield: :py:obj:`None`
+    """
+    token = _cancel_check.set(is_cancelled)
+    try:
+        yield
+    finally:
+        _cancel_check.reset(token)
+
+
+def _raise_if_check_cancelled() -> None:
+    """Raise if the running check was cancelled (Helper function).
+
+    :raises CheckCancelledError: If the check was cancelled; see :py:func:`cancel_check_when`
+    """
+    is_cancelled = _cancel_check.get()
+    if is_cancelled is not None and is_cancelled():
+        raise CheckCancelledError
+
+
+class _SubprocessTimeoutError(Exception):
+    """The subprocess checking a code block exceeded its timeout."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__(f"Check timed out after {timeout:g} seconds.")
+
+
 class CodeBlockChecker:
     """Checker for code blocks with different languages."""
 
     def __init__(
         self,
         source_origin: types.SourceFileOrString,
-        ignores: types.IgnoreDict | None = None,
+        ignores: types.IgnoreDict | types.Ignores | None = None,
         report_level: config.ReportLevel = config.DEFAULT_REPORT_LEVEL,
         sphinx_source_dir: pathlib.Path | None = None,
         *,
@@ -667,9 +1544,144 @@ class CodeBlockChecker:
         if checker is None:
             return None
 
-        yield from checker(source_code)
+        cache = _code_block_result_cache.get()
+        try:
+            if cache is None or language in _UNCACHEABLE_LANGUAGES:
+                yield from checker(source_code)
+                return None
+
+            key = self._get_cache_key(source_code, language)
+            results = cache.get(key)
+            if results is None:
+                results = [(e["line_number"], e["message"]) for e in checker(source_code)]
+                cache.put(key, results)
+        except _SubprocessTimeoutError as exc:
+            yield from self._create_errors([(1, str(exc))])
+            return None
+
+        yield from self._create_errors(results)
         return None
 
+    async def check_async(
+        self,
+        source_code: str,
+        language: str,
+        subprocess_semaphore: asyncio.Semaphore | None = None,
+    ) -> list[types.LintError]:
+        """Check the source like :py:meth:`CodeBlockChecker.check` without blocking the event loop.
+
+        Languages checked by external programs (bash, C and C++) run via
+        :py:func:`asyncio.create_subprocess_exec`. All other languages are checked in-process.
+
+        :param source_code: Source code to check
+        :param language: Language of the source code
+        :param subprocess_semaphore: Semaphore limiting the number of concurrent subprocesses;
+            defaults to :py:obj:`None` which means the default limit of the running event loop;
+            see :py:data:`DEFAULT_MAX_SUBPROCESSES`
+        :return: Found issues
+        """
+        command = self._get_subprocess_command(source_code, language)
+        if command is None:
+            return list(self.check(source_code, language))
+
+        cache = _code_block_result_cache.get()
+        key = self._get_cache_key(source_code, language)
+        results = cache.get(key) if cache is not None else None
+        if results is None:
+            try:
+                result = await self._run_in_subprocess_async(
+                    *command, subprocess_semaphore or _get_default_subprocess_semaphore()
+                )
+            except _SubprocessTimeoutError as exc:
+                return list(self._create_errors([(1, str(exc))]))
+            results = [
+                (e["line_number"], e["message"])
+                for e in self._parse_subprocess_output(result, language)
+            ]
+            if cache is not None:
+                cache.put(key, results)
+
+        return list(self._create_errors(results))
+
+    def _get_cache_key(self, source_code: str, language: str) -> tuple[str, ...]:
+        """Get the key of the code block for the :py:class:`CodeBlockResultCache`.
+
+        :param source_code: Source code of the code block
+        :param language: Language of the source code
+        :return: Cache key
+        """
+        key: tuple[str, ...] = (language, source_code)
+        if language in _DIRECTORY_DEPENDENT_LANGUAGES:
+            key = (*key, str(pathlib.Path(self.source_origin).parent.absolute()))
+        return key
+
+    def _create_errors(self, results: list[tuple[int, str]]) -> types.YieldedLintError:
+        """Create errors for this checker's source origin from cached results.
+
+        :param results: List of tuples of line number and message
+        :return: :py:obj:`None`
+        :yield: Issues
+        """
+        for line_number, message in results:
+            yield types.LintError(
+                source_origin=self.source_origin, line_number=line_number, message=message
+            )
+
+    def _get_subprocess_command(
+        self, source_code: str, language: str
+    ) -> tuple[str, str, list[str]] | None:
+        """Get the command for languages checked by an external program.
+
+        Used by the checks in :py:meth:`CodeBlockChecker.check` and
+        :py:meth:`CodeBlockChecker.check_async` alike.
+
+        :param source_code: Source code to check
+        :param language: Language of the source code
+        :return: Tuple of the code to write to the temporary file, its suffix and the command or
+            :py:obj:`None` if the language is checked in-process
+        """
+        if language == "bash":
+            return (source_code, ".bash", ["bash", "-n"])
+        if language == "c":
+            return (source_code, ".c", [*_get_c_arguments(), *_GCC_SYNTAX_CHECK_ARGUMENTS])
+        if language == "cpp":
+            # Add a newline to ignore "no newline at end of file" errors
+            # that are reported using clang (e.g. on macOS).
+            return (
+                source_code + "\n",
+                ".cpp",
+                [*_get_cpp_arguments(), *_GCC_SYNTAX_CHECK_ARGUMENTS],
+            )
+        return None
+
+    def _parse_subprocess_output(
+        self, result: tuple[str, pathlib.Path] | None, language: str
+    ) -> types.YieldedLintError:
+        """Parse the output of the external program checking the language (Helper function).
+
+        :param result: Result of :py:meth:`CodeBlockChecker._run_in_subprocess`
+        :param language: Language of the checked source code
+        :return: :py:obj:`None`
+        :yield: Found issues
+        """
+        if language == "bash":
+            yield from self._parse_bash_output(result)
+        else:
+            yield from self._parse_gcc_output(result)
+
+    def _check_in_subprocess(self, source_code: str, language: str) -> types.YieldedLintError:
+        """Check the source with the external program of its language (Helper function).
+
+        :param source_code: Source code to check
+        :param language: Language of the source code; one checked by an external program
+        :return: :py:obj:`None`
+        :yield: Found issues
+        """
+        command = self._get_subprocess_command(source_code, language)
+        if command is None:  # pragma: no cover # NOTE: Only called for bash, C and C++
+            return
+        yield from self._parse_subprocess_output(self._run_in_subprocess(*command), language)
+
     def check_python(self, source_code: str) -> types.YieldedLintError:
         """Check python source for syntax errors.
 
@@ -799,8 +1811,15 @@ class CodeBlockChecker:
         :yield: Found issues
         """
         logger.debug("Check bash source.")
-        result = self._run_in_subprocess(source_code, ".bash", ["bash", "-n"])
+        yield from self._check_in_subprocess(source_code, "bash")
+
+    def _parse_bash_output(self, result: tuple[str, pathlib.Path] | None) -> types.YieldedLintError:
+        """Parse the output of ``bash -n`` (Helper function).
 
+        :param result: Result of :py:meth:`CodeBlockChecker._run_in_subprocess`
+        :return: :py:obj:`None`
+        :yield: Found issues
+        """
         if result:
             (output, filename) = result
             prefix = str(filename) + ": line "
@@ -823,17 +1842,7 @@ class CodeBlockChecker:
         :yield: Found issues
         """
         logger.debug("Check C source.")
-        return self._gcc_checker(
-            source_code,
-            ".c",
-            [
-                os.getenv("CC", "gcc"),
-                *shlex.split(os.getenv("CFLAGS", "")),
-                *shlex.split(os.getenv("CPPFLAGS", "")),
-                "-I.",
-                "-I..",
-            ],
-        )
+        return self._check_in_subprocess(source_code, "c")
 
     def check_cpp(self, source_code: str) -> types.YieldedLintError:
         """Check C++ source for syntax errors.
@@ -843,19 +1852,7 @@ class CodeBlockChecker:
         :yield: Found issues
         """
         logger.debug("Check C++ source.")
-        yield from self._gcc_checker(
-            # Add a newline to ignore "no newline at end of file" errors
-            # that are reported using clang (e.g. on macOS).
-            source_code + "\n",
-            ".cpp",
-            [
-                os.getenv("CXX", "g++"),
-                *shlex.split(os.getenv("CXXFLAGS", "")),
-                *shlex.split(os.getenv("CPPFLAGS", "")),
-                "-I.",
-                "-I..",
-            ],
-        )
+        yield from self._check_in_subprocess(source_code, "cpp")
 
     def _gcc_checker(
         self, source_code: str, filename_suffix: str, arguments: list[str]
@@ -869,9 +1866,17 @@ class CodeBlockChecker:
         :yield: Found issues
         """
         result = self._run_in_subprocess(
-            source_code, filename_suffix, [*arguments, "-pedantic", "-fsyntax-only"]
+            source_code, filename_suffix, [*arguments, *_GCC_SYNTAX_CHECK_ARGUMENTS]
         )
+        yield from self._parse_gcc_output(result)
+
+    def _parse_gcc_output(self, result: tuple[str, pathlib.Path] | None) -> types.YieldedLintError:
+        """Parse the output of a GCC-style compiler (Helper function).
 
+        :param result: Result of :py:meth:`CodeBlockChecker._run_in_subprocess`
+        :return: :py:obj:`None`
+        :yield: Found issues
+        """
         if result:
             (output, temp_file_name) = result
             for line in output.splitlines():
@@ -893,38 +1898,153 @@ class CodeBlockChecker:
         :param source_code: Source code to check
         :param filename_suffix: File suffix for language of the source code
         :param arguments: Command and arguments to run
+        :raises _SubprocessTimeoutError: If the subprocess exceeds the timeout set with
+            :py:func:`subprocess_timeout`
+        :raises CheckCancelledError: If the check was cancelled before the subprocess started
         :return: :py:obj:`None` if no issues were found else a tuple of the stderr and temp-file
             name
         """
+        _raise_if_check_cancelled()
         encoding = locale.getpreferredencoding() or sys.getdefaultencoding()
+        language = _get_subprocess_language(filename_suffix)
+        timeout = _subprocess_timeout.get()
 
         source_origin_path = self.source_origin
         if isinstance(source_origin_path, str):
             source_origin_path = pathlib.Path(source_origin_path)
+        # NOTE: Sources from archives have no directory on the file system.
+        working_dir = source_origin_path.parent if source_origin_path.parent.is_dir() else None
 
         # NOTE: On windows a file cannot be opened twice.
         # Therefore close it before using it in subprocess.
         with tempfile.NamedTemporaryFile(
             mode="wb", suffix=filename_suffix, delete=False
         ) as temporary_file:
+            stats.count(f"{stats.COUNTER_TEMP_FILE_CREATED}:{language}")
             temporary_file_path = pathlib.Path(temporary_file.name)
             try:
                 temporary_file.write(code.encode("utf-8"))
                 temporary_file.flush()
                 temporary_file.close()
 
-                subprocess.run(  # noqa: S603
-                    [*arguments, temporary_file.name],
-                    capture_output=True,
-                    cwd=source_origin_path.parent,
-                    check=True,
-                )
+                stats.count(f"{stats.COUNTER_SUBPROCESS_SPAWNED}:{language}")
+                with stats.span(f"{stats.PHASE_SUBPROCESS}:{language}"):
+                    subprocess.run(  # noqa: S603
+                        [*arguments, temporary_file.name],
+                        capture_output=True,
+                        cwd=working_dir,
+                        check=True,
+                        timeout=timeout,
+                    )
             except subprocess.CalledProcessError as exc:
                 return (exc.stderr.decode(encoding), temporary_file_path)
+            except subprocess.TimeoutExpired as exc:
+                logger.warning("Subprocess timed out: '%s'.", " ".join(arguments))
+                raise _SubprocessTimeoutError(exc.timeout) from exc
+
+        return None
+
+    async def _run_in_subprocess_async(
+        self,
+        code: str,
+        filename_suffix: str,
+        arguments: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[str, pathlib.Path] | None:
+        """Run checker in a subprocess without blocking the event loop (Helper function).
+
+        :param code: Source code to check
+        :param filename_suffix: File suffix for language of the source code
+        :param arguments: Command and arguments to run
+        :param semaphore: Semaphore limiting the number of concurrent subprocesses
+        :raises _SubprocessTimeoutError: If the subprocess exceeds the timeout set with
+            :py:func:`subprocess_timeout`
+        :raises CheckCancelledError: If the check was cancelled before the subprocess started
+        :return: :py:obj:`None` if no issues were found else a tuple of the stderr and temp-file
+            name
+        """
+        _raise_if_check_cancelled()
+        encoding = locale.getpreferredencoding() or sys.getdefaultencoding()
+        language = _get_subprocess_language(filename_suffix)
+        timeout = _subprocess_timeout.get()
 
+        source_origin_path = self.source_origin
+        if isinstance(source_origin_path, str):
+            source_origin_path = pathlib.Path(source_origin_path)
+        # NOTE: Sources from archives have no directory on the file system.
+        working_dir = source_origin_path.parent if source_origin_path.parent.is_dir() else None
+
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=filename_suffix, delete=False
+        ) as temporary_file:
+            stats.count(f"{stats.COUNTER_TEMP_FILE_CREATED}:{language}")
+            temporary_file_path = pathlib.Path(temporary_file.name)
+            temporary_file.write(code.encode("utf-8"))
+
+        async with semaphore:
+            stats.count(f"{stats.COUNTER_SUBPROCESS_SPAWNED}:{language}")
+            with stats.span(f"{stats.PHASE_SUBPROCESS}:{language}"):
+                process = await asyncio.create_subprocess_exec(
+                    *arguments,
+                    str(temporary_file_path),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=working_dir,
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                except asyncio.TimeoutError as exc:  # noqa: UP041
+                    logger.warning("Subprocess timed out: '%s'.", " ".join(arguments))
+                    process.kill()
+                    await process.wait()
+                    raise _SubprocessTimeoutError(timeout or 0) from exc
+
+        if process.returncode:
+            return (stderr.decode(encoding), temporary_file_path)
         return None
 
 
+def _get_subprocess_language(filename_suffix: str) -> str:
+    """Get the language of a code block checked in a subprocess from its file suffix.
+
+    :param filename_suffix: File suffix for language of the source code, e.g. ``.cpp``
+    :return: Language, e.g. ``cpp``
+    """
+    return filename_suffix.lstrip(".")
+
+
+_GCC_SYNTAX_CHECK_ARGUMENTS = ("-pedantic", "-fsyntax-only")
+"""Arguments of GCC-style compilers to only check the syntax of C and C++ code blocks."""
+
+
+def _get_c_arguments() -> list[str]:
+    """Get the C compiler command with the flags from the environment.
+
+    :return: Command and arguments
+    """
+    return [
+        os.getenv("CC", "gcc"),
+        *shlex.split(os.getenv("CFLAGS", "")),
+        *shlex.split(os.getenv("CPPFLAGS", "")),
+        "-I.",
+        "-I..",
+    ]
+
+
+def _get_cpp_arguments() -> list[str]:
+    """Get the C++ compiler command with the flags from the environment.
+
+    :return: Command and arguments
+    """
+    return [
+        os.getenv("CXX", "g++"),
+        *shlex.split(os.getenv("CXXFLAGS", "")),
+        *shlex.split(os.getenv("CPPFLAGS", "")),
+        "-I.",
+        "-I..",
+    ]
+
+
 def _parse_gcc_style_error_message(
     message: str,
     source_origin: types.SourceFileOrString,
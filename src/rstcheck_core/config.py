@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import configparser
-import contextlib
 import enum
 import logging
 import pathlib
-import re
 import typing as t
 
-import pydantic
+from . import _extras, types
 
-from . import _extras
+if t.TYPE_CHECKING:
+    # NOTE: Re-exported for type checkers; at runtime the models are loaded by ``__getattr__``.
+    from ._config_models import (
+        RstcheckConfig as RstcheckConfig,  # noqa: PLC0414
+        RstcheckConfigFile as RstcheckConfigFile,  # noqa: PLC0414
+    )
 
 tomllib_imported = False
 try:
@@ -79,137 +82,56 @@ def _split_str_validator(value: t.Any) -> list[str] | None:  # noqa: ANN401
     raise TypeError(msg)
 
 
-class RstcheckConfigFile(pydantic.BaseModel):
-    """Rstcheck config file.
-
-    :raises ValueError: If setting has incorrect value or type
-    :raises pydantic.ValidationError: If setting is not parsable into correct type
-    """
-
-    report_level: ReportLevel | None = None
-    ignore_directives: list[str] | None = None
-    ignore_roles: list[str] | None = None
-    ignore_substitutions: list[str] | None = None
-    ignore_languages: list[str] | None = None
-    ignore_messages: t.Pattern[str] | None = None
-    sphinx_source_dir: pathlib.Path | None = None
-
-    @pydantic.field_validator("report_level", mode="before")
-    @classmethod
-    def valid_report_level(cls, value: t.Any) -> ReportLevel | None:  # noqa: ANN401
-        """Validate the report_level setting.
-
-        :param value: Value to validate
-        :raises ValueError: If ``value`` is not a valid docutils report level
-        :return: Instance of :py:class:`ReportLevel` or None if empty string.
-        """
-        if value is None:
-            return None
-
-        if isinstance(value, ReportLevel):
-            return value
-
-        if value == "":
-            return DEFAULT_REPORT_LEVEL
-
-        if isinstance(value, bool):
-            msg = "Invalid report level"
-            raise TypeError(msg)
-
-        if isinstance(value, str):
-            if value.casefold() in set(ReportLevelMap):
-                return ReportLevel(ReportLevelMap[value.casefold()])
-
-            with contextlib.suppress(ValueError):
-                value = int(value)
-
-        max_report_lvl = 5
-        min_report_lvl = 1
-        if isinstance(value, int) and min_report_lvl <= value <= max_report_lvl:
-            return ReportLevel(value)
-
-        msg = "Invalid report level"
-        raise TypeError(msg)
-
-    @pydantic.field_validator(
-        "ignore_directives",
-        "ignore_roles",
-        "ignore_substitutions",
-        "ignore_languages",
-        mode="before",
-    )
-    @classmethod
-    def split_str(cls, value: t.Any) -> list[str] | None:  # noqa: ANN401
-        """Validate and parse the following ignore_* settings.
-
-        - ignore_directives
-        - ignore_roles
-        - ignore_substitutions
-        - ignore_languages
-
-        Comma separated strings are split into a list.
-
-        :param value: Value to validate
-        :raises ValueError: If not a :py:class:`str` or :py:class:`list` of :py:class:`str`
-        :return: List of things to ignore in the respective category
-        """
-        return _split_str_validator(value)
-
-    @pydantic.field_validator("ignore_messages", mode="before")
-    @classmethod
-    def join_regex_str(cls, value: t.Any) -> str | t.Pattern[str] | None:  # noqa: ANN401
-        """Validate and concatenate the ignore_messages setting to a RegEx string.
-
-        If a list is given, the entries are concatenated with "|" to create an or RegEx.
-
-        :param value: Value to validate
-        :raises ValueError: If not a :py:class:`str` or :py:class:`list` of :py:class:`str`
-        :return: A RegEx string with messages to ignore or :py:class:`typing.Pattern` if it is one
-            already
-        """
-        if value is None:
-            return None
-
-        if isinstance(value, re.Pattern):
-            return value
-
-        if isinstance(value, list) and all(isinstance(v, str) for v in value):
-            return r"|".join(value)
+_config_file_cache: dict[
+    tuple[pathlib.Path, pathlib.Path, bool, bool],
+    tuple[tuple[int, int], RstcheckConfigFile | None],
+] = {}
+"""Parsed config files with the ``mtime_ns`` and size they were parsed at.
 
-        if isinstance(value, str):
-            return value
+The key is the resolved and the passed path with the logging options of the parse.
+"""
 
-        msg = "Not a string or list of strings"
-        raise TypeError(msg)
 
+def clear_config_file_cache() -> None:
+    """Drop all parsed config files.
 
-class RstcheckConfig(RstcheckConfigFile):
-    """Rstcheck config.
-
-    :raises ValueError: If setting has incorrect value or type
-    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    Changed config files are parsed again automatically. Clearing is only needed, if a file is
+    changed without changing its size within the timestamp resolution of the file system.
     """
-
-    config_path: pathlib.Path | None = None
-    recursive: bool | None = None
-    warn_unknown_settings: bool | None = None
+    _config_file_cache.clear()
 
 
-class _RstcheckConfigINIFile(pydantic.BaseModel):
-    """Type for [rstcheck] section in INI file.
+def _load_config_file_cached(
+    config_file: pathlib.Path,
+    resolved_file: pathlib.Path,
+    parse: t.Callable[[], RstcheckConfigFile | None],
+    *,
+    log_missing_section_as_warning: bool,
+    warn_unknown_settings: bool,
+) -> RstcheckConfigFile | None:
+    """Parse the config file or get it from the cache if it did not change since.
 
-    The types apply to the file's data before the parsing by :py:class:`RstcheckConfig` is done.
+    A file counts as changed if its ``mtime_ns`` or size changed. The warnings of a parse are only
+    logged once per file state.
 
-    :raises pydantic.ValidationError: If setting is not parsable into correct type
+    :param config_file: Path of the config file as passed
+    :param resolved_file: Resolved path of the config file
+    :param parse: Function parsing the config file
+    :param log_missing_section_as_warning: Logging option the ``parse`` function uses
+    :param warn_unknown_settings: Logging option the ``parse`` function uses
+    :return: Copy of the parsed config, so that callers may change it
     """
-
-    report_level: str | int | None = None
-    ignore_directives: str | None = None
-    ignore_roles: str | None = None
-    ignore_substitutions: str | None = None
-    ignore_languages: str | None = None
-    ignore_messages: str | None = None
-    sphinx_source_dir: pathlib.Path | None = None
+    stat_result = resolved_file.stat()
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    key = (resolved_file, config_file, log_missing_section_as_warning, warn_unknown_settings)
+    cached = _config_file_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        logger.debug("Use cached config from file: '%s'.", config_file)
+        file_config = cached[1]
+    else:
+        file_config = parse()
+        _config_file_cache[key] = (signature, file_config)
+    return file_config.model_copy(deep=True) if file_config is not None else None
 
 
 def _load_config_from_ini_file(
@@ -220,6 +142,8 @@ def _load_config_from_ini_file(
 ) -> RstcheckConfigFile | None:
     """Load, parse and validate rstcheck config from a ini file.
 
+    The parsed config is cached until the file changes.
+
     :param ini_file: INI file to load config from
     :param log_missing_section_as_warning: If a missing [tool.rstcheck] section should be logged at
         WARNING (:py:obj:`True`) or ``INFO`` (:py:obj:`False`) level;
@@ -243,9 +167,44 @@ def _load_config_from_ini_file(
         msg = f"{resolved_file}"
         raise FileNotFoundError(msg)
 
-    parser = configparser.ConfigParser()
-    parser.read(resolved_file)
+    def parse() -> RstcheckConfigFile | None:
+        parser = configparser.ConfigParser()
+        parser.read(resolved_file)
+        return _parse_config_from_ini_parser(
+            parser,
+            ini_file,
+            log_missing_section_as_warning=log_missing_section_as_warning,
+            warn_unknown_settings=warn_unknown_settings,
+        )
+
+    return _load_config_file_cached(
+        ini_file,
+        resolved_file,
+        parse,
+        log_missing_section_as_warning=log_missing_section_as_warning,
+        warn_unknown_settings=warn_unknown_settings,
+    )
 
+
+def _parse_config_from_ini_parser(
+    parser: configparser.ConfigParser,
+    ini_file: pathlib.Path,
+    *,
+    log_missing_section_as_warning: bool = True,
+    warn_unknown_settings: bool = False,
+) -> RstcheckConfigFile | None:
+    """Parse and validate rstcheck config from a read INI file.
+
+    :param parser: Parser the INI file was read with
+    :param ini_file: INI file the config was read from
+    :param log_missing_section_as_warning: If a missing [tool.rstcheck] section should be logged at
+        WARNING (:py:obj:`True`) or ``INFO`` (:py:obj:`False`) level;
+        defaults to :py:obj:`True`
+    :param warn_unknown_settings: If a warning should be logged for unknown settings in config file;
+        defaults to :py:obj:`False`
+    :return: instance of :py:class:`RstcheckConfigFile` or :py:class:`None` on missing config
+        section
+    """
     if not parser.has_section("rstcheck"):
         if log_missing_section_as_warning:
             logger.warning(
@@ -259,9 +218,11 @@ def _load_config_from_ini_file(
         )
         return None
 
+    from . import _config_models  # noqa: PLC0415
+
     config_values_raw = dict(parser.items("rstcheck"))
     if warn_unknown_settings:
-        known_settings = _RstcheckConfigINIFile().model_dump().keys()
+        known_settings = _config_models.RstcheckConfigINIFile().model_dump().keys()
         unknown = [s for s in config_values_raw if s not in known_settings]
         if unknown:
             logger.warning(
@@ -270,7 +231,7 @@ def _load_config_from_ini_file(
                 ini_file,
             )
 
-    config_values_checked = _RstcheckConfigINIFile(**config_values_raw)
+    config_values_checked = _config_models.RstcheckConfigINIFile(**config_values_raw)
     if (
         config_values_checked.sphinx_source_dir is not None
         and not config_values_checked.sphinx_source_dir.is_absolute()
@@ -279,24 +240,7 @@ def _load_config_from_ini_file(
         logger.info(
             f"Relative sphinx 'source' dir path resolved to: {config_values_checked.sphinx_source_dir}"
         )
-    return RstcheckConfigFile(**config_values_checked.model_dump())
-
-
-class _RstcheckConfigTOMLFile(pydantic.BaseModel):
-    """Type for [tool.rstcheck] section in TOML file.
-
-    The types apply to the file's data before the parsing by :py:class:`RstcheckConfig` is done.
-
-    :raises pydantic.ValidationError: If setting is not parsable into correct type
-    """
-
-    report_level: str | int | None = None
-    ignore_directives: list[str] | None = None
-    ignore_roles: list[str] | None = None
-    ignore_substitutions: list[str] | None = None
-    ignore_languages: list[str] | None = None
-    ignore_messages: list[str] | str | None = None
-    sphinx_source_dir: pathlib.Path | None = None
+    return _config_models.RstcheckConfigFile(**config_values_checked.model_dump())
 
 
 def _load_config_from_toml_file(
@@ -312,6 +256,8 @@ def _load_config_from_toml_file(
         Needs tomli installed for python versions before 3.11!
         Use toml extra.
 
+    The parsed config is cached until the file changes.
+
     :param toml_file: TOML file to load config from
     :param log_missing_section_as_warning: If a missing [tool.rstcheck] section should be logged at
         WARNING (:py:obj:`True`) or ``INFO`` (:py:obj:`False`) level;
@@ -342,9 +288,43 @@ def _load_config_from_toml_file(
         msg = "File is not a TOML file"
         raise ValueError(msg)
 
-    with pathlib.Path(resolved_file).open("rb") as toml_file_handle:
-        toml_dict = tomllib.load(toml_file_handle)
+    def parse() -> RstcheckConfigFile | None:
+        with pathlib.Path(resolved_file).open("rb") as toml_file_handle:
+            toml_dict = tomllib.load(toml_file_handle)
+        return _parse_config_from_toml_dict(
+            toml_dict,
+            toml_file,
+            log_missing_section_as_warning=log_missing_section_as_warning,
+            warn_unknown_settings=warn_unknown_settings,
+        )
+
+    return _load_config_file_cached(
+        toml_file,
+        resolved_file,
+        parse,
+        log_missing_section_as_warning=log_missing_section_as_warning,
+        warn_unknown_settings=warn_unknown_settings,
+    )
+
+
+def _parse_config_from_toml_dict(
+    toml_dict: dict[str, t.Any],
+    toml_file: pathlib.Path,
+    *,
+    log_missing_section_as_warning: bool = True,
+    warn_unknown_settings: bool = False,
+) -> RstcheckConfigFile | None:
+    """Parse and validate rstcheck config from a loaded TOML file.
 
+    :param toml_dict: Content of the TOML file
+    :param toml_file: TOML file the config was loaded from
+    :param log_missing_section_as_warning: If a missing [tool.rstcheck] section should be logged at
+        WARNING (:py:obj:`True`) or ``INFO`` (:py:obj:`False`) level;
+        defaults to :py:obj:`True`
+    :param warn_unknown_settings: If a warning should be logged for unknown settings in config file;
+        defaults to :py:obj:`False`
+    :return: instance of :py:class:`RstcheckConfigFile` or :py:obj:`None` on missing config section
+    """
     rstcheck_section: dict[str, t.Any] | None = toml_dict.get("tool", {}).get("rstcheck")
 
     if rstcheck_section is None:
@@ -360,8 +340,10 @@ def _load_config_from_toml_file(
         )
         return None
 
+    from . import _config_models  # noqa: PLC0415
+
     if warn_unknown_settings:
-        known_settings = _RstcheckConfigTOMLFile().model_dump().keys()
+        known_settings = _config_models.RstcheckConfigTOMLFile().model_dump().keys()
         unknown = [s for s in rstcheck_section if s not in known_settings]
         if unknown:
             logger.warning(
@@ -370,7 +352,7 @@ def _load_config_from_toml_file(
                 toml_file,
             )
 
-    config_values_checked = _RstcheckConfigTOMLFile(**rstcheck_section)
+    config_values_checked = _config_models.RstcheckConfigTOMLFile(**rstcheck_section)
     if (
         config_values_checked.sphinx_source_dir is not None
         and not config_values_checked.sphinx_source_dir.is_absolute()
@@ -381,7 +363,7 @@ def _load_config_from_toml_file(
         logger.info(
             f"Relative sphinx 'source' dir path resolved to: {config_values_checked.sphinx_source_dir}"
         )
-    return RstcheckConfigFile(**config_values_checked.model_dump())
+    return _config_models.RstcheckConfigFile(**config_values_checked.model_dump())
 
 
 def load_config_file(
@@ -426,6 +408,53 @@ def load_config_file(
     )
 
 
+def load_config_file_content(
+    content: str,
+    file_path: pathlib.Path,
+    *,
+    log_missing_section_as_warning: bool = True,
+    warn_unknown_settings: bool = False,
+) -> RstcheckConfigFile | None:
+    """Parse and validate rstcheck config from the content of a config file.
+
+    Like :py:func:`load_config_file` for config files not on the file system, e.g. inside of
+    archives.
+
+    .. caution::
+
+        If a TOML file is passed this function need tomli installed for python versions before 3.11!
+        Use toml extra or install manually.
+
+    :param content: Content of the config file
+    :param file_path: Path of the config file; its suffix selects the format
+    :param log_missing_section_as_warning: If a missing config section should be logged at
+        WARNING (:py:obj:`True`) or ``INFO`` (:py:obj:`False`) level;
+        defaults to :py:obj:`True`
+    :param warn_unknown_settings: If a warning should be logged for unknown settings in config file;
+        defaults to :py:obj:`False`
+    :return: instance of :py:class:`RstcheckConfigFile` or :py:obj:`None` on missing config section
+    """
+    logger.debug("Try loading config from content of file: '%s'.", file_path)
+
+    if file_path.suffix.casefold() == ".toml":
+        _extras.install_guard_tomli(tomllib_imported=tomllib_imported)
+        return _parse_config_from_toml_dict(
+            tomllib.loads(content),
+            file_path,
+            log_missing_section_as_warning=log_missing_section_as_warning,
+            warn_unknown_settings=warn_unknown_settings,
+        )
+
+    parser = configparser.ConfigParser()
+    parser.read_string(content, source=str(file_path))
+    return _parse_config_from_ini_parser(
+        parser,
+        file_path,
+        log_missing_section_as_warning=log_missing_section_as_warning,
+        warn_unknown_settings=warn_unknown_settings,
+    )
+
+
 def load_config_file_from_dir(
     dir_path: pathlib.Path,
     *,
@@ -607,6 +636,8 @@ def merge_configs(
         defaults to :py:obj:`True`
     :return: New merged config
     """
+    from . import _config_models  # noqa: PLC0415
+
     logger.debug("Merging configs.")
     sub_config: RstcheckConfig | RstcheckConfigFile = config_base
     sub_config_dict = sub_config.model_dump()
@@ -625,4 +656,175 @@ def merge_configs(
 
     merged_config_dict = {**sub_config_dict, **dom_config_dict}
 
-    return RstcheckConfig(**merged_config_dict)
+    return _config_models.RstcheckConfig(**merged_config_dict)
+
+
+_LAZY_MODELS = ("RstcheckConfigFile", "RstcheckConfig")
+"""Pydantic models which are loaded on first access."""
+
+
+def __getattr__(name: str) -> t.Any:  # noqa: ANN401
+    """Load the pydantic config models on first access.
+
+    Callers only checking sources with explicit ignores and report level never import pydantic.
+
+    :param name: Name of the attribute
+    :raises AttributeError: If the attribute does not exist
+    :return: The pydantic model
+    """
+    if name not in _LAZY_MODELS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    from . import _config_models  # noqa: PLC0415
+
+    model = getattr(_config_models, name)
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes including the not yet loaded pydantic models."""
+    return sorted({*globals(), *_LAZY_MODELS})
+
+
+class RunConfig(t.NamedTuple):
+    """Frozen snapshot of the settings a check runs with.
+
+    Derived from the pydantic configs once per file, so that the checks need no pydantic models.
+    Snapshots are hashable and can be used as cache keys.
+    """
+
+    report_level: ReportLevel = DEFAULT_REPORT_LEVEL
+    ignores: types.Ignores = types.Ignores()
+    sphinx_source_dir: pathlib.Path | None = None
+    warn_unknown_settings: bool = False
+
+    @classmethod
+    def from_config(
+        cls,
+        rstcheck_config: RstcheckConfig | RstcheckConfigFile,
+        file_config: RstcheckConfigFile | None = None,
+        *,
+        config_add_is_dominant: bool = True,
+    ) -> RunConfig:
+        """Create a snapshot of the config merged with a file config.
+
+        The configs are merged like :py:func:`merge_configs` does, but without creating and
+        validating a new pydantic model.
+
+        :param rstcheck_config: Base config
+        :param file_config: Config merged into the ``rstcheck_config``;
+            defaults to :py:obj:`None` which means the ``rstcheck_config`` is used as is
+        :param config_add_is_dominant: If the ``file_config`` overwrites values of the
+            ``rstcheck_config``; defaults to :py:obj:`True`
+        :return: Snapshot of the merged config
+        """
+        configs = [rstcheck_config] if file_config is None else [rstcheck_config, file_config]
+        if not config_add_is_dominant:
+            configs.reverse()
+
+        def get_setting(name: str) -> t.Any:  # noqa: ANN401
+            """Get the setting from the dominant config which has it set."""
+            for config in reversed(configs):
+                value = getattr(config, name, None)
+                if value is not None:
+                    return value
+            return None
+
+        return cls(
+            report_level=get_setting("report_level") or DEFAULT_REPORT_LEVEL,
+            ignores=types.Ignores(
+                messages=get_setting("ignore_messages"),
+                languages=frozenset(get_setting("ignore_languages") or ()),
+                directives=frozenset(get_setting("ignore_directives") or ()),
+                roles=frozenset(get_setting("ignore_roles") or ()),
+                substitutions=frozenset(get_setting("ignore_substitutions") or ()),
+            ),
+            sphinx_source_dir=get_setting("sphinx_source_dir"),
+            warn_unknown_settings=get_setting("warn_unknown_settings") or False,
+        )
+
+
+class RunConfigCache:
+    """Cache of run configs resolved per directory for long running processes.
+
+    A run config is the base config merged with the config file found in the directory tree of the
+    checked file. With an explicit ``config_path`` in the base config it is used as is.
+
+    The config file found for a directory is remembered for all directories searched on the way,
+    so each directory is searched at most once. Directories sharing a config file share the same
+    run config object.
+    """
+
+    def __init__(self, rstcheck_config: RstcheckConfig, *, overwrite_config: bool = True) -> None:
+        """Initialize the :py:class:`RunConfigCache`.
+
+        :param rstcheck_config: Base configuration config from e.g. the CLI.
+        :param overwrite_config: If file config overwrites current config; defaults to True
+        """
+        self.config = rstcheck_config
+        self.overwrite_config = overwrite_config
+        self._run_configs: dict[pathlib.Path, RstcheckConfig] = {}
+        self._file_configs: dict[pathlib.Path, RstcheckConfigFile | None] = {}
+        self._merged_configs: dict[int, RstcheckConfig] = {}
+
+    def __len__(self) -> int:
+        """Get the number of cached run configs."""
+        return len(self._run_configs)
+
+    def clear(self) -> None:
+        """Drop all cached run configs, e.g. after config files changed."""
+        self._run_configs.clear()
+        self._file_configs.clear()
+        self._merged_configs.clear()
+
+    def get(self, directory: pathlib.Path) -> RstcheckConfig:
+        """Get the run config for files in the directory.
+
+        :param directory: Directory of the file to check
+        :return: Base config merged with the config file found for the directory
+        """
+        resolved_directory = directory.resolve()
+        run_config = self._run_configs.get(resolved_directory)
+        if run_config is not None:
+            return run_config
+
+        run_config = self.config
+        if self.config.config_path is None:
+            file_config = self._find_file_config(resolved_directory)
+            if file_config is not None:
+                merged_config = self._merged_configs.get(id(file_config))
+                if merged_config is None:
+                    merged_config = merge_configs(
+                        self.config, file_config, config_add_is_dominant=self.overwrite_config
+                    )
+                    self._merged_configs[id(file_config)] = merged_config
+                run_config = merged_config
+        self._run_configs[resolved_directory] = run_config
+        return run_config
+
+    def _find_file_config(self, directory: pathlib.Path) -> RstcheckConfigFile | None:
+        """Search the directory tree like :py:func:`load_config_file_from_dir_tree`.
+
+        The search stops at the first directory searched before and reuses its result.
+
+        :param directory: Resolved directory to start the search in
+        :return: Config file found in the directory tree or :py:obj:`None`
+        """
+        searched_dirs = []
+        search_dir = directory
+        while True:
+            if search_dir in self._file_configs:
+                file_config = self._file_configs[search_dir]
+                break
+
+            searched_dirs.append(search_dir)
+            file_config = load_config_file_from_dir(search_dir)
+            if file_config is not None or search_dir.parent == search_dir:
+                break
+            search_dir = search_dir.parent
+
+        for searched_dir in searched_dirs:
+            self._file_configs[searched_dir] = file_config
+        return file_config
@@ -0,0 +1,186 @@
+"""Framing of multiple documents in one stream, e.g. stdin.
+
+Two framings are supported:
+
+``nul``
+    The documents are separated by NUL bytes. They are named ``<stdin:1>``, ``<stdin:2>``, etc.
+``length``
+    Each document is preceded by a header line with its length in bytes and optionally its name
+    separated by a space, e.g. ``42 docs/index.rst``. Documents without name are named like for
+    the ``nul`` framing.
+
+The documents must be UTF-8 encoded. Each document is yielded as soon as it is complete, so that
+producers can keep the stream open and write documents as they are generated.
+
+Example usage:
+
+.. code-block:: python
+
+    import sys
+
+    from rstcheck_core import checker, config, framing
+
+    documents = framing.read_documents(sys.stdin.buffer, "length")
+    for name, errors in checker.check_sources(documents, config.RstcheckConfig()):
+        print(name, errors)
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+
+Framing = t.Literal["nul", "length"]
+FRAMINGS: tuple[Framing, ...] = ("nul", "length")
+
+CHUNK_SIZE = 64 * 1024
+"""Maximal number of bytes read at once from NUL separated streams."""
+
+
+def read_documents(
+    stream: t.BinaryIO, framing: Framing
+) -> t.Generator[tuple[str, str], None, None]:
+    """Read framed documents from a stream.
+
+    :param stream: Binary stream to read from
+    :param framing: Framing of the documents
+    :raises ValueError: On unknown framing or malformed frames
+    :return: :py:obj:`None`
+    :yield: Tuples of name and source of the documents
+    """
+    _validate_framing(framing)
+    if framing == "nul":
+        return _read_nul_separated_documents(stream)
+    return _read_length_prefixed_documents(stream)
+
+
+def frame_document(source: str, framing: Framing, name: str | None = None) -> bytes:
+    """Frame a document for a stream read with :py:func:`read_documents`.
+
+    :param source: Source of the document
+    :param framing: Framing of the document
+    :param name: Name of the document; only used by the ``length`` framing;
+        defaults to :py:obj:`None`
+    :raises ValueError: On unknown framing or if the document or name cannot be framed
+    :return: Framed document
+    """
+    _validate_framing(framing)
+    data = source.encode("utf-8")
+    if framing == "nul":
+        if b"\0" in data:
+            msg = "Documents with NUL characters cannot be NUL separated."
+            raise ValueError(msg)
+        return data + b"\0"
+
+    if name is not None and ("\n" in name or "\r" in name):
+        msg = f"Document names must not contain line breaks: {name!r}"
+        raise ValueError(msg)
+    header = f"{len(data)} {name}" if name else str(len(data))
+    return f"{header}\n".encode() + data
+
+
+def _validate_framing(framing: str) -> None:
+    """Validate the framing.
+
+    :param framing: Framing to validate
+    :raises ValueError: On unknown framing
+    """
+    if framing not in FRAMINGS:
+        msg = f"Unknown framing: '{framing}'. Valid framings are: {', '.join(FRAMINGS)}."
+        raise ValueError(msg)
+
+
+def _read_nul_separated_documents(
+    stream: t.BinaryIO,
+) -> t.Generator[tuple[str, str], None, None]:
+    """Read NUL separated documents.
+
+    :param stream: Binary stream to read from
+    :return: :py:obj:`None`
+    :yield: Tuples of name and source of the documents
+    """
+    # NOTE: read1 returns what is available instead of blocking until the chunk is full.
+    read = getattr(stream, "read1", stream.read)
+    pending = bytearray()
+    number = 0
+    while chunk := read(CHUNK_SIZE):
+        search_start = len(pending)
+        pending += chunk
+        frame_start = 0
+        while (frame_end := pending.find(b"\0", search_start)) != -1:
+            number += 1
+            yield (_get_default_name(number), _decode(pending[frame_start:frame_end]))
+            frame_start = search_start = frame_end + 1
+        del pending[:frame_start]
+
+    if pending:
+        yield (_get_default_name(number + 1), _decode(pending))
+
+
+def _read_length_prefixed_documents(
+    stream: t.BinaryIO,
+) -> t.Generator[tuple[str, str], None, None]:
+    """Read length prefixed documents.
+
+    :param stream: Binary stream to read from
+    :raises ValueError: On malformed headers or incomplete documents
+    :return: :py:obj:`None`
+    :yield: Tuples of name and source of the documents
+    """
+    number = 0
+    while header_line := stream.readline():
+        header = header_line.decode("utf-8").strip()
+        if not header:
+            continue
+
+        number += 1
+        (length, _, name) = header.partition(" ")
+        if not length.isdigit():
+            msg = f"Invalid frame header of document {number}: {header!r}"
+            raise ValueError(msg)
+
+        data = _read_exactly(stream, int(length))
+        if data is None:
+            msg = f"Stream ended within document {number}."
+            raise ValueError(msg)
+        yield (name.strip() or _get_default_name(number), _decode(data))
+
+
+def _read_exactly(stream: t.BinaryIO, size: int) -> bytes | None:
+    """Read exactly the given number of bytes.
+
+    :param stream: Binary stream to read from
+    :param size: Number of bytes to read
+    :return: Bytes read or :py:obj:`None` if the stream ended before
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+def _decode(data: bytes | bytearray) -> str:
+    """Decode a document with universal newlines like stdin in text mode.
+
+    :param data: Raw document
+    :return: Decoded document
+    """
+    source = data.decode("utf-8")
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+
+def _get_default_name(number: int) -> str:
+    """Get the name of a document without name.
+
+    :param number: One-based number of the document in the stream
+    :return: Name
+    """
+    return f"<stdin:{number}>"
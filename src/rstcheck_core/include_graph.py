@@ -0,0 +1,359 @@
+"""Dependency graph of ``include`` directives.
+
+The graph records which files include which other files. It is the base for incremental checks:
+when an included file changes only the files including it (directly or transitively) need to be
+checked again.
+
+Example usage:
+
+.. code-block:: python
+
+    import pathlib
+
+    from rstcheck_core import include_graph
+
+    graph_file = pathlib.Path(".rstcheck-include-graph.json")
+    graph = include_graph.IncludeGraph.load(graph_file)
+    changed_files = graph.changed_files()
+    files_to_check = graph.affected_files(changed_files)
+    graph.refresh_files(changed_files)
+    graph.save(graph_file)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import typing as t
+
+from . import _sphinx_workarounds
+
+logger = logging.getLogger(__name__)
+
+
+GRAPH_FORMAT_VERSION = 1
+"""Version of the persisted graph format. Files with another version are ignored on load."""
+
+
+FileSignature = tuple[int, int]
+"""Signature of a file's state made of its ``mtime_ns`` and size."""
+
+
+def normalize_path(path: pathlib.Path) -> pathlib.Path:
+    """Make the path absolute and collapse ``..`` parts without resolving symlinks.
+
+    :param path: Path to normalize
+    :return: Normalized path
+    """
+    return pathlib.Path(os.path.normpath(path.absolute()))
+
+
+def get_file_signature(path: pathlib.Path) -> FileSignature | None:
+    """Get the signature of a file.
+
+    :param path: Path of the file
+    :return: Signature or :py:obj:`None` if the file does not exist
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def existing_files(paths: t.Iterable[pathlib.Path]) -> set[pathlib.Path]:
+    """Check the existence of many files at once.
+
+    Instead of one ``stat`` call per path every directory is scanned only once, see
+    :py:func:`rstcheck_core._sphinx_workarounds.is_listed_file`.
+
+    :param paths: Normalized paths to check
+    :return: The paths which exist and are files
+    """
+    paths_by_directory: dict[pathlib.Path, list[pathlib.Path]] = {}
+    for path in paths:
+        paths_by_directory.setdefault(path.parent, []).append(path)
+
+    found: set[pathlib.Path] = set()
+    for directory, directory_paths in paths_by_directory.items():
+        file_names = _sphinx_workarounds.list_directory_files(directory)
+        found.update(
+            p for p in directory_paths if _sphinx_workarounds.is_listed_file(p, file_names)
+        )
+    return found
+
+
+class _GraphNode(t.TypedDict):
+    """Persisted information about a single file in the graph."""
+
+    signature: list[int] | None
+    includes: list[str]
+    document: bool
+
+
+class IncludeGraph:
+    """Dependency graph of ``include`` directives between files.
+
+    All paths stored in the graph are normalized with :py:func:`normalize_path`.
+    """
+
+    def __init__(self, sphinx_source_dir: pathlib.Path | None = None) -> None:
+        """Initialize an empty :py:class:`IncludeGraph`.
+
+        :param sphinx_source_dir: Sphinx ``source`` directory used to resolve absolute include
+            paths; defaults to :py:obj:`None` which means it is searched for
+        """
+        self.sphinx_source_dir = sphinx_source_dir
+        self._includes: dict[pathlib.Path, set[pathlib.Path]] = {}
+        self._included_by: dict[pathlib.Path, set[pathlib.Path]] = {}
+        self._signatures: dict[pathlib.Path, FileSignature | None] = {}
+        self._documents: set[pathlib.Path] = set()
+
+    @property
+    def documents(self) -> frozenset[pathlib.Path]:
+        """Files added as documents to check via :py:meth:`IncludeGraph.update_file`."""
+        return frozenset(self._documents)
+
+    @property
+    def files(self) -> frozenset[pathlib.Path]:
+        """All files known to the graph; documents and included files."""
+        return frozenset(self._signatures)
+
+    def includes(self, path: pathlib.Path) -> frozenset[pathlib.Path]:
+        """Get the files directly included by the given file.
+
+        :param path: Including file
+        :return: Included files
+        """
+        return frozenset(self._includes.get(normalize_path(path), ()))
+
+    def includers(self, path: pathlib.Path, *, transitive: bool = True) -> frozenset[pathlib.Path]:
+        """Get the files including the given file.
+
+        :param path: Included file
+        :param transitive: If files including the given file indirectly via other included files
+            should be returned too; defaults to :py:obj:`True`
+        :return: Including files
+        """
+        start = normalize_path(path)
+        found: set[pathlib.Path] = set()
+        pending = [start]
+        while pending:
+            current = pending.pop()
+            for includer in self._included_by.get(current, ()):
+                if includer in found or includer == start:
+                    continue
+                found.add(includer)
+                if transitive:
+                    pending.append(includer)
+        return frozenset(found)
+
+    def update_file(
+        self,
+        path: pathlib.Path,
+        source: str | None = None,
+        *,
+        document: bool = True,
+    ) -> None:
+        """Parse the include directives of a file and update its edges.
+
+        Included files which exist and are not yet known are parsed too, so that nested includes
+        are part of the graph.
+
+        :param path: File to update
+        :param source: Content of the file; read from ``path`` if :py:obj:`None`;
+            defaults to :py:obj:`None`
+        :param document: If the file is a document to check and not only included;
+            defaults to :py:obj:`True`
+        """
+        pending: list[tuple[pathlib.Path, str | None]] = [(normalize_path(path), source)]
+        if document:
+            self._documents.add(pending[0][0])
+
+        while pending:
+            current, current_source = pending.pop()
+            targets = self._parse_includes(current, current_source)
+            self._set_edges(current, targets)
+            for target in targets - self._signatures.keys():
+                if target.is_file():
+                    pending.append((target, None))
+                else:
+                    self._signatures[target] = None
+
+    def update_files(self, paths: t.Iterable[pathlib.Path]) -> None:
+        """Update multiple documents; see :py:meth:`IncludeGraph.update_file`.
+
+        :param paths: Documents to update
+        """
+        for path in paths:
+            self.update_file(path)
+
+    def remove_file(self, path: pathlib.Path) -> None:
+        """Remove a file and its outgoing edges from the graph.
+
+        Edges from other files to it are kept, as they still reference it.
+
+        :param path: File to remove
+        """
+        normalized = normalize_path(path)
+        self._set_edges(normalized, set())
+        self._documents.discard(normalized)
+        if normalized in self._included_by:
+            self._signatures[normalized] = None
+        else:
+            self._signatures.pop(normalized, None)
+
+    def refresh_files(self, paths: t.Iterable[pathlib.Path]) -> None:
+        """Parse the given known files again, e.g. the ones from :py:meth:`changed_files`.
+
+        Deleted files are removed; see :py:meth:`remove_file`.
+
+        :param paths: Files to refresh
+        """
+        for path in paths:
+            normalized = normalize_path(path)
+            if normalized.is_file():
+                self.update_file(normalized, document=normalized in self._documents)
+            else:
+                self.remove_file(normalized)
+
+    def changed_files(self, paths: t.Iterable[pathlib.Path] | None = None) -> set[pathlib.Path]:
+        """Get the known files whose signature changed since they were last parsed.
+
+        Created and deleted files count as changed.
+
+        :param paths: Only check these files; defaults to :py:obj:`None` which means all files
+        :return: Changed files
+        """
+        candidates = (
+            self._signatures.keys()
+            if paths is None
+            else {normalize_path(p) for p in paths} & self._signatures.keys()
+        )
+        return {path for path in candidates if get_file_signature(path) != self._signatures[path]}
+
+    def affected_files(self, changed: t.Iterable[pathlib.Path]) -> set[pathlib.Path]:
+        """Get the documents which need to be checked again because of the changed files.
+
+        These are the changed documents themselves and all documents including a changed file.
+
+        :param changed: Changed files
+        :return: Documents to check again
+        """
+        affected: set[pathlib.Path] = set()
+        for path in changed:
+            normalized = normalize_path(path)
+            if normalized in self._documents:
+                affected.add(normalized)
+            affected.update(self.includers(normalized) & self._documents)
+        return affected
+
+    def missing_includes(self) -> dict[pathlib.Path, frozenset[pathlib.Path]]:
+        """Get the included files which do not exist, checked in one batch.
+
+        :return: Map of missing included files to the files including them directly
+        """
+        targets = set(self._included_by)
+        found = existing_files(targets)
+        return {target: frozenset(self._included_by[target]) for target in sorted(targets - found)}
+
+    def save(self, graph_file: pathlib.Path) -> None:
+        """Persist the graph as JSON.
+
+        :param graph_file: File to write the graph to
+        """
+        logger.debug("Save include graph to '%s'.", graph_file)
+        nodes: dict[str, _GraphNode] = {
+            str(path): _GraphNode(
+                signature=list(signature) if signature is not None else None,
+                includes=sorted(str(p) for p in self._includes.get(path, ())),
+                document=path in self._documents,
+            )
+            for path, signature in self._signatures.items()
+        }
+        graph_file.write_text(
+            json.dumps({"version": GRAPH_FORMAT_VERSION, "files": nodes}), encoding="utf-8"
+        )
+
+    @classmethod
+    def load(
+        cls, graph_file: pathlib.Path, sphinx_source_dir: pathlib.Path | None = None
+    ) -> IncludeGraph:
+        """Load a graph persisted with :py:meth:`IncludeGraph.save`.
+
+        A missing, unreadable or outdated file results in an empty graph.
+
+        :param graph_file: File to load the graph from
+        :param sphinx_source_dir: Sphinx ``source`` directory; see :py:class:`IncludeGraph`;
+            defaults to :py:obj:`None`
+        :return: Loaded graph
+        """
+        graph = cls(sphinx_source_dir)
+        try:
+            data = json.loads(graph_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.info("No usable include graph found at '%s'.", graph_file)
+            return graph
+
+        if not isinstance(data, dict) or data.get("version") != GRAPH_FORMAT_VERSION:
+            logger.info("Include graph at '%s' has an unsupported format.", graph_file)
+            return graph
+
+        graph._add_nodes(data["files"])
+        return graph
+
+    def _add_nodes(self, nodes: dict[str, _GraphNode]) -> None:
+        """Add persisted nodes to the graph.
+
+        :param nodes: Map of paths to their persisted information
+        """
+        for raw_path, node in nodes.items():
+            path = pathlib.Path(raw_path)
+            signature = node["signature"]
+            self._signatures[path] = (signature[0], signature[1]) if signature is not None else None
+            if node["document"]:
+                self._documents.add(path)
+            self._set_edges(path, {pathlib.Path(p) for p in node["includes"]})
+
+    def _parse_includes(self, path: pathlib.Path, source: str | None) -> set[pathlib.Path]:
+        """Read the file if needed, store its signature and return its resolved include targets.
+
+        :param path: Normalized path of the file
+        :param source: Content of the file or :py:obj:`None` to read it
+        :return: Normalized paths of the included files
+        """
+        self._signatures[path] = get_file_signature(path)
+        if source is None:
+            try:
+                source = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                logger.info("Could not read file for include graph: '%s'.", path)
+                return set()
+
+        return {
+            normalize_path(include_path)
+            for _, include_path in _sphinx_workarounds.find_include_paths(
+                source, path, self.sphinx_source_dir
+            )
+            if include_path is not None
+        }
+
+    def _set_edges(self, path: pathlib.Path, targets: set[pathlib.Path]) -> None:
+        """Replace the outgoing edges of a file.
+
+        :param path: Normalized path of the including file
+        :param targets: Normalized paths of the included files
+        """
+        for old_target in self._includes.pop(path, set()) - targets:
+            includers = self._included_by.get(old_target)
+            if includers is not None:
+                includers.discard(path)
+                if not includers:
+                    del self._included_by[old_target]
+
+        if targets:
+            self._includes[path] = targets
+        for target in targets:
+            self._included_by.setdefault(target, set()).add(path)
@@ -0,0 +1,527 @@
+"""Language server frontend speaking the Language Server Protocol (LSP) over stdio.
+
+The server publishes the issues found by :py:func:`rstcheck_core.checker.yield_file_errors` as
+diagnostics while the document is edited:
+
+- Documents are synced incrementally; ``didChange`` notifications only carry the edited ranges.
+- Checks are debounced, so fast typing does not trigger a check per key stroke.
+- A check running for an outdated document version is cancelled before its next code block
+  subprocess and its results are dropped.
+- Sphinx, the docutils directives and roles, the resolved configs and the results of code block
+  checks are kept warm between checks.
+
+All checks run in a single worker thread, because docutils' directive and role registries are
+global.
+
+Example usage:
+
+.. code-block:: python
+
+    from rstcheck_core import config, lsp
+
+    lsp.serve_stdio(config.RstcheckConfig())
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import pathlib
+import re
+import sys
+import threading
+import time
+import typing as t
+import urllib.parse
+import urllib.request
+
+from . import _sphinx, checker, config, types
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DEBOUNCE = 0.3
+"""Default time in seconds to wait after the last change of a document before checking it."""
+
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+"""LSP ``TextDocumentSyncKind`` for incremental changes."""
+
+_METHOD_NOT_FOUND = -32601
+_INVALID_REQUEST = -32600
+_SERVER_NOT_INITIALIZED = -32002
+
+_SEVERITIES = {"INFO": 3, "WARNING": 2, "ERROR": 1, "SEVERE": 1}
+_ERROR_LEVEL_REGEX = re.compile(r"\(([A-Z]+)/[0-9]+\) ")
+_CONFIG_FILE_NAMES = frozenset((*config.CONFIG_FILES, "pyproject.toml"))
+
+Message = dict[str, t.Any]
+"""JSON-RPC message."""
+
+
+def read_message(stream: t.BinaryIO) -> Message | None:
+    """Read a single message framed with a ``Content-Length`` header.
+
+    :param stream: Stream to read from
+    :raises ValueError: If the header is invalid
+    :return: Decoded message or :py:obj:`None` on end of the stream
+    """
+    content_length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().casefold() == "content-length":
+            content_length = int(value.strip())
+
+    if content_length is None:
+        msg = "Message header without 'Content-Length'."
+        raise ValueError(msg)
+
+    message: Message = json.loads(stream.read(content_length).decode("utf-8"))
+    return message
+
+
+def write_message(stream: t.BinaryIO, message: Message) -> None:
+    """Write a single message framed with a ``Content-Length`` header.
+
+    :param stream: Stream to write to
+    :param message: Message to write
+    """
+    body = json.dumps(message).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> pathlib.Path | None:
+    """Convert a ``file`` URI into a path.
+
+    :param uri: URI to convert
+    :return: Path or :py:obj:`None` for other schemes like ``untitled``
+    """
+    parsed = urllib.parse.urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    return pathlib.Path(urllib.request.url2pathname(parsed.path))
+
+
+def _utf16_offset_to_index(line: str, character: int) -> int:
+    """Convert an offset in UTF-16 code units into an index into the line.
+
+    :param line: Line the offset belongs to
+    :param character: Offset in UTF-16 code units as used by LSP positions
+    :return: Index of the character
+    """
+    if line.isascii():
+        return min(character, len(line))
+
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1  # noqa: PLR2004
+    return len(line)
+
+
+class TextDocument:
+    """Text of an open document synced from the client."""
+
+    def __init__(self, uri: str, text: str, version: int) -> None:
+        """Initialize the :py:class:`TextDocument`.
+
+        :param uri: URI of the document
+        :param text: Full text of the document
+        :param version: Version of the text
+        """
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.text = text
+        self.version = version
+
+    def offset_at(self, position: dict[str, int]) -> int:
+        """Convert a LSP position into an index into the text.
+
+        :param position: Position with zero based ``line`` and ``character`` in UTF-16 code units
+        :return: Index into the text
+        """
+        line_start = 0
+        for _ in range(position["line"]):
+            line_end = self.text.find("\n", line_start)
+            if line_end == -1:
+                return len(self.text)
+            line_start = line_end + 1
+
+        line_end = self.text.find("\n", line_start)
+        line = self.text[line_start : len(self.text) if line_end == -1 else line_end]
+        return line_start + _utf16_offset_to_index(line.removesuffix("\r"), position["character"])
+
+    def apply_changes(self, changes: list[dict[str, t.Any]], version: int) -> None:
+        """Apply content changes from a ``didChange`` notification in order.
+
+        :param changes: Changes; with a ``range`` they are incremental else they replace the text
+        :param version: New version of the text
+        """
+        for change in changes:
+            change_range = change.get("range")
+            if change_range is None:
+                self.text = change["text"]
+                continue
+            start = self.offset_at(change_range["start"])
+            end = self.offset_at(change_range["end"])
+            self.text = self.text[:start] + change["text"] + self.text[end:]
+        self.version = version
+
+
+def create_diagnostic(error: types.LintError) -> dict[str, t.Any]:
+    """Convert a :py:class:`rstcheck_core.types.LintError` into a LSP diagnostic.
+
+    Errors without docutils level, e.g. from code block checks, are errors.
+
+    :param error: Error to convert
+    :return: Diagnostic spanning the error's line
+    """
+    message = error["message"]
+    severity = 1
+    level_match = _ERROR_LEVEL_REGEX.match(message)
+    if level_match is not None:
+        severity = _SEVERITIES.get(level_match.group(1), 1)
+        message = message[level_match.end() :]
+
+    line = max(error["line_number"] - 1, 0)
+    return {
+        "range": {
+            "start": {"line": line, "character": 0},
+            "end": {"line": line + 1, "character": 0},
+        },
+        "severity": severity,
+        "source": "rstcheck",
+        "message": message,
+    }
+
+
+class LanguageServer:
+    """Language server checking open rst documents."""
+
+    def __init__(
+        self,
+        rstcheck_config: config.RstcheckConfig,
+        *,
+        overwrite_config: bool = True,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        """Initialize the :py:class:`LanguageServer` with a base config.
+
+        :param rstcheck_config: Base configuration config from e.g. the CLI.
+        :param overwrite_config: If file config overwrites current config; defaults to True
+        :param debounce: Time in seconds to wait after the last change of a document before
+            checking it; defaults to :py:data:`DEFAULT_DEBOUNCE`
+        """
+        self.config = rstcheck_config
+        self.debounce = debounce
+        self.run_configs = config.RunConfigCache(rstcheck_config, overwrite_config=overwrite_config)
+        self.code_block_cache = checker.CodeBlockResultCache()
+        self.documents: dict[str, TextDocument] = {}
+        self._pending: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._output: t.BinaryIO | None = None
+        self._initialized = False
+        self._shutdown_requested = False
+        self._stopped = False
+
+    def run(self, input_stream: t.BinaryIO, output_stream: t.BinaryIO) -> int:
+        """Read and answer messages until the client sends ``exit`` or closes the stream.
+
+        :param input_stream: Stream to read messages from
+        :param output_stream: Stream to write messages to
+        :return: Exit code; 0 if the client requested a shutdown before the exit else 1
+        """
+        self._output = output_stream
+        self._stopped = False
+        worker = threading.Thread(target=self._check_worker, name="rstcheck-lsp", daemon=True)
+        worker.start()
+        try:
+            while True:
+                message = read_message(input_stream)
+                if message is None or message.get("method") == "exit":
+                    break
+                self.handle_message(message)
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+            worker.join()
+        return 0 if self._shutdown_requested else 1
+
+    def handle_message(self, message: Message) -> None:
+        """Handle a single request or notification.
+
+        :param message: Decoded JSON-RPC message
+        """
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+
+        if request_id is not None:
+            self._handle_request(request_id, method)
+            return
+
+        if not self._initialized or self._shutdown_requested:
+            return
+
+        if method == "textDocument/didOpen":
+            document = params["textDocument"]
+            self.documents[document["uri"]] = TextDocument(
+                document["uri"], document["text"], document.get("version", 0)
+            )
+            self.schedule_check(document["uri"], delay=0)
+        elif method == "textDocument/didChange":
+            document = self.documents.get(params["textDocument"]["uri"])
+            if document is not None:
+                with self._condition:
+                    document.apply_changes(
+                        params["contentChanges"], params["textDocument"].get("version", 0)
+                    )
+                self.schedule_check(document.uri)
+        elif method == "textDocument/didSave":
+            self._handle_did_save(params["textDocument"]["uri"])
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            with self._condition:
+                self.documents.pop(uri, None)
+                self._pending.pop(uri, None)
+            self._publish_diagnostics(uri, None, [])
+        elif method in {"workspace/didChangeConfiguration", "workspace/didChangeWatchedFiles"}:
+            self.reload()
+
+    def schedule_check(self, uri: str, *, delay: float | None = None) -> None:
+        """Schedule a check of an open document; a pending check of it is postponed.
+
+        :param uri: URI of the document
+        :param delay: Time in seconds to wait; defaults to :py:obj:`None` which means the debounce
+            time
+        """
+        with self._condition:
+            self._pending[uri] = time.monotonic() + (self.debounce if delay is None else delay)
+            self._condition.notify_all()
+
+    def reload(self) -> None:
+        """Drop the cached configs and check all open documents again."""
+        logger.info("Drop cached configs.")
+        self.run_configs.clear()
+        for uri in list(self.documents):
+            self.schedule_check(uri, delay=0)
+
+    def check_document(self, uri: str, text: str, version: int) -> list[types.LintError] | None:
+        """Check a snapshot of a document.
+
+        :param uri: URI of the document
+        :param text: Text of the document to check
+        :param version: Version of the text
+        :return: Found issues or :py:obj:`None` if the check was cancelled because the document
+            changed or was closed meanwhile
+        """
+        path = uri_to_path(uri)
+        if path is None:
+            source_file = pathlib.Path("-")
+            run_config = self.config
+        else:
+            source_file = path
+            run_config = self.run_configs.get(path.parent)
+
+        def is_outdated() -> bool:
+            return self._is_outdated(uri, version)
+
+        if is_outdated():
+            return None
+
+        errors: list[types.LintError] = []
+        error_generator = checker.yield_file_errors(
+            source_file, run_config, search_file_config=False, source=text
+        )
+        try:
+            with checker.cancel_check_when(is_outdated):
+                for error in error_generator:
+                    if is_outdated():
+                        logger.debug("Cancel check of outdated document '%s'.", uri)
+                        return None
+                    errors.append(error)
+        except checker.CheckCancelledError:
+            logger.debug("Cancel check of outdated document '%s'.", uri)
+            return None
+        finally:
+            error_generator.close()
+
+        if self._is_outdated(uri, version):
+            return None
+        return errors
+
+    def _handle_request(self, request_id: int | str, method: str | None) -> None:
+        """Answer a request.
+
+        :param request_id: ID of the request
+        :param method: Requested method
+        """
+        if method == "initialize":
+            self._initialized = True
+            self._send_response(
+                request_id,
+                result={
+                    "capabilities": {
+                        "textDocumentSync": {
+                            "openClose": True,
+                            "change": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                            "save": {"includeText": False},
+                        }
+                    },
+                    "serverInfo": {"name": "rstcheck"},
+                },
+            )
+        elif not self._initialized:
+            self._send_response(
+                request_id, error={"code": _SERVER_NOT_INITIALIZED, "message": "Not initialized."}
+            )
+        elif method == "shutdown":
+            self._shutdown_requested = True
+            with self._condition:
+                self._pending.clear()
+            self._send_response(request_id, result=None)
+        elif self._shutdown_requested:
+            self._send_response(
+                request_id, error={"code": _INVALID_REQUEST, "message": "Shutdown requested."}
+            )
+        else:
+            self._send_response(
+                request_id,
+                error={"code": _METHOD_NOT_FOUND, "message": f"Method not found: {method}"},
+            )
+
+    def _handle_did_save(self, uri: str) -> None:
+        """Check the saved document again or reload all configs on a saved config file.
+
+        :param uri: URI of the saved document
+        """
+        path = uri_to_path(uri)
+        if path is not None and path.name in _CONFIG_FILE_NAMES:
+            self.reload()
+        elif uri in self.documents:
+            self.schedule_check(uri, delay=0)
+
+    def _is_outdated(self, uri: str, version: int) -> bool:
+        """Check if the document was changed or closed since the given version.
+
+        :param uri: URI of the document
+        :param version: Version to compare with
+        :return: If the version is outdated
+        """
+        with self._condition:
+            document = self.documents.get(uri)
+            return self._stopped or document is None or document.version != version
+
+    def _next_check(self) -> tuple[str, str, int] | None:
+        """Wait for the next due check.
+
+        :return: Snapshot of the document to check or :py:obj:`None` if the server stopped
+        """
+        with self._condition:
+            while not self._stopped:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+                uri, due = min(self._pending.items(), key=lambda item: item[1])
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                del self._pending[uri]
+                document = self.documents.get(uri)
+                if document is not None:
+                    return (uri, document.text, document.version)
+        return None
+
+    def _check_worker(self) -> None:
+        """Check the scheduled documents with warm state until the server stops."""
+        with (
+            _sphinx.load_sphinx_warm(),
+            checker.cache_code_block_results(self.code_block_cache),
+        ):
+            while True:
+                snapshot = self._next_check()
+                if snapshot is None:
+                    return
+                uri, text, version = snapshot
+                try:
+                    errors = self.check_document(uri, text, version)
+                except Exception:
+                    logger.exception("Error while checking '%s'.", uri)
+                    continue
+                if errors is not None:
+                    self._publish_diagnostics(uri, version, errors)
+
+    def _publish_diagnostics(
+        self, uri: str, version: int | None, errors: list[types.LintError]
+    ) -> None:
+        """Send the issues of a document to the client.
+
+        :param uri: URI of the document
+        :param version: Checked version of the document
+        :param errors: Found issues
+        """
+        params: Message = {"uri": uri, "diagnostics": [create_diagnostic(e) for e in errors]}
+        if version is not None:
+            params["version"] = version
+        self._send(
+            {"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics", "params": params}
+        )
+
+    def _send_response(
+        self,
+        request_id: int | str,
+        *,
+        result: t.Any = None,  # noqa: ANN401
+        error: dict[str, t.Any] | None = None,
+    ) -> None:
+        """Send a response to a request.
+
+        :param request_id: ID of the request
+        :param result: Result on success; defaults to :py:obj:`None`
+        :param error: Error on failure; defaults to :py:obj:`None`
+        """
+        response: Message = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        self._send(response)
+
+    def _send(self, message: Message) -> None:
+        """Write a message to the client.
+
+        :param message: Message to write
+        """
+        if self._output is None:
+            return
+        with self._write_lock:
+            write_message(self._output, message)
+
+
+def serve_stdio(
+    rstcheck_config: config.RstcheckConfig,
+    *,
+    overwrite_config: bool = True,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> int:  # pragma: no cover
+    """Run a :py:class:`LanguageServer` on stdin and stdout.
+
+    :param rstcheck_config: Base configuration config from e.g. the CLI.
+    :param overwrite_config: If file config overwrites current config; defaults to True
+    :param debounce: See :py:class:`LanguageServer`; defaults to :py:data:`DEFAULT_DEBOUNCE`
+    :return: Exit code
+    """
+    language_server = LanguageServer(
+        rstcheck_config, overwrite_config=overwrite_config, debounce=debounce
+    )
+    return language_server.run(sys.stdin.buffer, sys.stdout.buffer)
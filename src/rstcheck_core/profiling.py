@@ -0,0 +1,151 @@
+"""Profiling of the checks of single files with :py:mod:`cProfile` and :py:mod:`tracemalloc`.
+
+For each checked file the artifacts are written to the output directory of the
+:py:class:`ProfileSettings`. This also works for checks in the worker processes of
+:py:class:`rstcheck_core.runner.RstcheckMainRunner`, as each worker writes its own files:
+
+- ``<name>-<hash>.prof``: :py:mod:`cProfile` stats loadable with :py:class:`pstats.Stats`
+- ``<name>-<hash>.tracemalloc``: :py:class:`tracemalloc.Snapshot` loadable with
+  :py:meth:`tracemalloc.Snapshot.load`
+
+``<name>`` is the stem of the checked file and ``<hash>`` is derived from its absolute path.
+The runner merges the CPU profiles of all checked files into ``merged.prof``.
+
+Example usage:
+
+.. code-block:: python
+
+    import pathlib
+
+    from rstcheck_core import checker, config, profiling
+
+    settings = profiling.ProfileSettings(pathlib.Path("profiles"), memory=True)
+    checker.check_file(pathlib.Path("index.rst"), config.RstcheckConfig(), profile=settings)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import hashlib
+import logging
+import pstats
+import tracemalloc
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+logger = logging.getLogger(__name__)
+
+
+CPU_PROFILE_SUFFIX = ".prof"
+MEMORY_SNAPSHOT_SUFFIX = ".tracemalloc"
+MERGED_PROFILE_NAME = "merged.prof"
+
+
+class ProfileSettings(t.NamedTuple):
+    """Settings for profiling the checks of files."""
+
+    output_dir: pathlib.Path
+    """Directory to write the artifacts to; created if missing."""
+    cpu: bool = True
+    """If the checks are profiled with :py:mod:`cProfile`."""
+    memory: bool = False
+    """If a :py:mod:`tracemalloc` snapshot is taken after each check."""
+
+
+def get_artifact_stem(source_file: pathlib.Path) -> str:
+    """Get the unique base name of the artifacts for a checked file.
+
+    :param source_file: Checked file; ``-`` for stdin
+    :return: Base name without suffix
+    """
+    if source_file.name == "-":
+        return "stdin"
+    digest = hashlib.sha1(
+        str(source_file.absolute()).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    return f"{source_file.stem}-{digest[:10]}"
+
+
+def get_cpu_profile_path(source_file: pathlib.Path, output_dir: pathlib.Path) -> pathlib.Path:
+    """Get the path of the CPU profile for a checked file.
+
+    :param source_file: Checked file
+    :param output_dir: Directory of the artifacts
+    :return: Path of the profile
+    """
+    return output_dir / f"{get_artifact_stem(source_file)}{CPU_PROFILE_SUFFIX}"
+
+
+def get_memory_snapshot_path(source_file: pathlib.Path, output_dir: pathlib.Path) -> pathlib.Path:
+    """Get the path of the memory snapshot for a checked file.
+
+    :param source_file: Checked file
+    :param output_dir: Directory of the artifacts
+    :return: Path of the snapshot
+    """
+    return output_dir / f"{get_artifact_stem(source_file)}{MEMORY_SNAPSHOT_SUFFIX}"
+
+
+@contextlib.contextmanager
+def profile_file(
+    source_file: pathlib.Path, settings: ProfileSettings
+) -> t.Generator[None, None, None]:
+    """Contextmanager to profile the check of a file and write its artifacts.
+
+    If another profiler is already active, the CPU profile is skipped. If :py:mod:`tracemalloc` is
+    already tracing, it is left running.
+
+    :param source_file: Checked file
+    :param settings: Profile settings
+    :return: :py:obj:`None`
+    :yield: :py:obj:`None`
+    """
+    settings.output_dir.mkdir(parents=True, exist_ok=True)
+
+    profiler: cProfile.Profile | None = None
+    if settings.cpu:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            logger.warning("Another profiler is active. Skip CPU profile for '%s'.", source_file)
+            profiler = None
+
+    started_tracing = settings.memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(get_cpu_profile_path(source_file, settings.output_dir))
+        if settings.memory:
+            tracemalloc.take_snapshot().dump(
+                str(get_memory_snapshot_path(source_file, settings.output_dir))
+            )
+            if started_tracing:
+                tracemalloc.stop()
+
+
+def merge_cpu_profiles(
+    profile_files: t.Iterable[pathlib.Path], merged_file: pathlib.Path
+) -> pathlib.Path | None:
+    """Merge CPU profiles into one.
+
+    :param profile_files: Profiles to merge; missing ones are skipped
+    :param merged_file: File to write the merged profile to
+    :return: The merged file or :py:obj:`None` if there was no profile to merge
+    """
+    existing_files = [str(f) for f in profile_files if f.is_file()]
+    if not existing_files:
+        return None
+
+    logger.debug("Merge %s CPU profiles into '%s'.", len(existing_files), merged_file)
+    merged_stats = pstats.Stats(*existing_files)
+    merged_stats.dump_stats(merged_file)
+    return merged_file
@@ -2,35 +2,122 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import contextlib
+import functools
+import hashlib
 import logging
 import multiprocessing
+import multiprocessing.connection
+import multiprocessing.pool
 import os
 import pathlib
 import re
 import sys
+import time
 import typing as t
+import uuid
 
-from . import _sphinx, checker, config, types
+from . import (
+    _sphinx,
+    _sphinx_workarounds,
+    _watch,
+    archive,
+    checker,
+    config,
+    framing,
+    profiling,
+    stats,
+    types,
+)
+
+if t.TYPE_CHECKING:
+    import concurrent.futures
 
 logger = logging.getLogger(__name__)
 
+_ItemT = t.TypeVar("_ItemT")
+_ResultT = t.TypeVar("_ResultT")
+
+
+_PATH_DEPENDENT_SOURCE_REGEX = re.compile(
+    rb"include::|:file:|^[ \t]*\.\.[ \t]+(?:code|code-block|sourcecode)::[ \t]*(?:bash|c|cpp)[ \t]*$",
+    flags=re.MULTILINE,
+)
+"""Regex for content whose issues depend on the directory of the file, like included files."""
+
 
 class RstcheckMainRunner:
     """Main runner of rstcheck_core."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         check_paths: list[pathlib.Path],
         rstcheck_config: config.RstcheckConfig,
         *,
         overwrite_config: bool = True,
+        collect_stats: bool = False,
+        profile: profiling.ProfileSettings | None = None,
+        stdin_framing: framing.Framing | None = None,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        file_timeout: float | None = None,
+        code_block_timeout: float | None = None,
+        max_tasks_per_worker: int | None = None,
+        max_worker_rss: int | None = None,
+        deduplicate: bool = False,
     ) -> None:
         """Initialize the :py:class:`RstcheckMainRunner` with a base config.
 
         :param check_paths: Files to check.
         :param rstcheck_config: Base configuration config from e.g. the CLI.
         :param overwrite_config: If file config overwrites current config; defaults to True
+        :param collect_stats: If the timings of the check phases are collected into
+            :py:attr:`RstcheckMainRunner.stats`; defaults to False
+        :param profile: Settings to profile the check of each file; the CPU profiles are merged
+            after each check; defaults to None; see :py:mod:`rstcheck_core.profiling`
+        :param stdin_framing: Framing of multiple documents on stdin; used by
+            :py:meth:`RstcheckMainRunner.run` if stdin is the input; defaults to None which means
+            stdin is a single document; see :py:mod:`rstcheck_core.framing`
+        :param fail_fast: If the checks stop at the first issue; same as ``max_errors=1``;
+            defaults to False
+        :param max_errors: Stop the checks once this many issues are found; pending files are
+            not checked and the worker pool is terminated; defaults to None which means no limit
+        :param file_timeout: Seconds the check of a single file may take; a worker exceeding it
+            is killed and replaced and the timeout is reported as an issue of the file; files are
+            always checked in worker processes if set; defaults to None which means no limit
+        :param code_block_timeout: Seconds a subprocess checking a bash, C or C++ code block may
+            run; see :py:func:`rstcheck_core.checker.subprocess_timeout`; defaults to None which
+            means no limit
+        :param max_tasks_per_worker: Number of files a pool worker checks before it is replaced by
+            a new one; defaults to None which means workers live as long as the pool
+        :param max_worker_rss: Resident memory in bytes a pool worker may use; a worker
+            exceeding it after a file is replaced before its next file; defaults to None which
+            means no limit
+        :param deduplicate: If byte-identical files with the same run config are checked only
+            once and their issues are copied to the other files; files whose issues depend on
+            their directory, e.g. with ``include`` directives, are only deduplicated within their
+            directory; defaults to False
+        :raises ValueError: If ``max_errors``, ``max_tasks_per_worker`` or ``max_worker_rss`` is
+            less than 1 or a timeout is not positive
         """
+        for name, limit in (
+            ("max_errors", max_errors),
+            ("max_tasks_per_worker", max_tasks_per_worker),
+            ("max_worker_rss", max_worker_rss),
+        ):
+            if limit is not None and limit < 1:
+                msg = f"{name} must be at least 1, got {limit}."
+                raise ValueError(msg)
+        for name, timeout in (
+            ("file_timeout", file_timeout),
+            ("code_block_timeout", code_block_timeout),
+        ):
+            if timeout is not None and timeout <= 0:
+                msg = f"{name} must be positive, got {timeout}."
+                raise ValueError(msg)
+
         self.config = rstcheck_config
         self.overwrite_config = overwrite_config
         if rstcheck_config.config_path:
@@ -41,6 +128,7 @@ class RstcheckMainRunner:
 
         self.check_paths = check_paths
         self._files_to_check: list[pathlib.Path] = []
+        self._archives_to_check: list[pathlib.Path] = []
         self._nonexisting_paths: list[pathlib.Path] = []
         self.update_file_list()
 
@@ -49,6 +137,15 @@ class RstcheckMainRunner:
         self._pool_size = pool_size if sys.platform != "win32" else min(pool_size, 61)
 
         self.errors: list[types.LintError] = []
+        self.stats: stats.RunStats | None = stats.RunStats() if collect_stats else None
+        self.profile = profile
+        self.stdin_framing = stdin_framing
+        self.max_errors = 1 if fail_fast else max_errors
+        self.file_timeout = file_timeout
+        self.code_block_timeout = code_block_timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss = max_worker_rss
+        self.deduplicate = deduplicate
 
     @property
     def files_to_check(self) -> list[pathlib.Path]:
@@ -58,6 +155,15 @@ class RstcheckMainRunner:
         """
         return self._files_to_check
 
+    @property
+    def archives_to_check(self) -> list[pathlib.Path]:
+        """List of zip and tar archives whose rst members are checked.
+
+        Only archives passed explicitly are checked; they are not searched for in directories.
+        This list is updated via the :py:meth:`RstcheckMainRunner.update_file_list` method.
+        """
+        return self._archives_to_check
+
     @property
     def nonexisting_paths(self) -> list[pathlib.Path]:
         """List of paths which do not exist.
@@ -112,6 +218,7 @@ class RstcheckMainRunner:
         logger.debug("Updating list of files to check.")
         paths = list(self.check_paths)
         self._files_to_check = []
+        self._archives_to_check = []
 
         if len(paths) == 1 and paths[0].name == "-":
             logger.info("'-' detected. Using stdin for input.'")
@@ -123,6 +230,11 @@ class RstcheckMainRunner:
         def checkable_rst_file(f: pathlib.Path) -> bool:
             return f.is_file() and not f.name.startswith(".") and f.suffix.casefold() == ".rst"
 
+        for path in list(paths):
+            if archive.is_archive(path) and path.resolve().is_file():
+                paths.remove(path)
+                self._archives_to_check.append(path)
+
         while paths:
             path = paths.pop(0)
             resolved_path = path.resolve()
@@ -184,10 +296,7 @@ class RstcheckMainRunner:
         """
         logger.debug("Runnning checks synchronically.")
         with _sphinx.load_sphinx_if_available():
-            return [
-                checker.check_file(file, self.config, self.overwrite_config)
-                for file in self._files_to_check
-            ]
+            return self._check_files_and_archives()
 
     def _run_checks_parallel(self) -> list[list[types.LintError]]:
         """Check all files from the file list in parallel and return the errors.
@@ -198,11 +307,200 @@ class RstcheckMainRunner:
             "Runnning checks in parallel with pool size of %s.",
             self._pool_size,
         )
-        with _sphinx.load_sphinx_if_available(), multiprocessing.Pool(self._pool_size) as pool:
-            return pool.starmap(
-                checker.check_file,
-                [(file, self.config, self.overwrite_config) for file in self._files_to_check],
+        with _sphinx.load_sphinx_if_available(), self._create_worker_pool() as pool:
+            return self._check_files_and_archives(pool)
+
+    @contextlib.contextmanager
+    def _create_worker_pool(self) -> t.Generator[_WorkerPool, None, None]:
+        """Contextmanager to create the pool of worker processes with the configured limits.
+
+        The processes are started on first use and terminated on exit.
+
+        :return: :py:obj:`None`
+        :yield: The pool
+        """
+        pool = _WorkerPool(
+            self._pool_size,
+            max_tasks_per_worker=self.max_tasks_per_worker,
+            max_worker_rss=self.max_worker_rss,
+            file_timeout=self.file_timeout,
+        )
+        try:
+            yield pool
+        finally:
+            pool.terminate()
+
+    def _check_files_and_archives(
+        self, pool: _WorkerPool | None = None
+    ) -> list[list[types.LintError]]:
+        """Check the files and archives from the file list and return the errors.
+
+        Stops once :py:attr:`RstcheckMainRunner.max_errors` issues are found.
+
+        :param pool: Pool to check in parallel;
+            defaults to :py:obj:`None` which means the checks run synchronously
+        :return: List of lists of errors found per file and archive member
+        """
+        results = self._check_files(self._files_to_check, pool, max_errors=self.max_errors)
+        max_errors = self.max_errors
+        if max_errors is not None:
+            max_errors -= sum(len(errors) for errors in results)
+            if max_errors <= 0:
+                return results
+        return results + self._check_archives(pool, max_errors=max_errors)
+
+    def _check_files(
+        self,
+        files: list[pathlib.Path],
+        pool: _WorkerPool | None = None,
+        *,
+        max_errors: int | None = None,
+    ) -> list[list[types.LintError]]:
+        """Check the given files and return the errors.
+
+        Sphinx must already be loaded by the caller. With
+        :py:attr:`RstcheckMainRunner.deduplicate` identical files are checked only once.
+
+        :param files: Files to check
+        :param pool: Pool to check the files in parallel;
+            defaults to :py:obj:`None` which means the files are checked synchronously
+        :param max_errors: Stop checking further files once this many issues are found;
+            defaults to :py:obj:`None` which means all files are checked
+        :return: List of lists of errors found per checked file
+        """
+        config_cache = config.RunConfigCache(self.config, overwrite_config=self.overwrite_config)
+        if not self.deduplicate or len(files) <= 1:
+            return self._check_each_file(files, config_cache, pool, max_errors=max_errors)
+
+        groups = _group_identical_files(files, config_cache)
+        logger.info("Check %s unique of %s files.", len(groups), len(files))
+        unique_results = self._check_each_file(
+            [group[0] for group in groups], config_cache, pool, max_errors=max_errors
+        )
+
+        results: dict[pathlib.Path, list[types.LintError]] = {}
+        for group, errors in zip(groups, unique_results, strict=False):
+            results[group[0]] = errors
+            for file in group[1:]:
+                results[file] = [
+                    types.LintError(
+                        source_origin=file,
+                        line_number=error["line_number"],
+                        message=error["message"],
+                    )
+                    for error in errors
+                ]
+
+        checked_results = []
+        for file in files:
+            if file not in results:
+                # NOTE: The checks stopped early because of ``max_errors``.
+                break
+            checked_results.append(results[file])
+        return checked_results
+
+    def _check_each_file(
+        self,
+        files: list[pathlib.Path],
+        config_cache: config.RunConfigCache,
+        pool: _WorkerPool | None = None,
+        *,
+        max_errors: int | None = None,
+    ) -> list[list[types.LintError]]:
+        """Check each of the given files and return the errors.
+
+        The run configs of the files are resolved before the files are dispatched, so that the
+        checks do not search the directory trees for config files.
+
+        :param files: Files to check
+        :param config_cache: Cache resolving the run configs of the files
+        :param pool: Pool to check the files in parallel;
+            defaults to :py:obj:`None` which means the files are checked synchronously
+        :param max_errors: Stop checking further files once this many issues are found;
+            defaults to :py:obj:`None` which means all files are checked
+        :return: List of lists of errors found per checked file
+        """
+        file_checks = _resolve_file_checks(files, config_cache)
+        # NOTE: The include lookups are cached per call, also across the files of a pool worker.
+        with_lookup_cache = functools.partial(_call_with_include_lookup_cache, uuid.uuid4().hex)
+        if (
+            self.stats is None
+            and self.profile is None
+            and max_errors is None
+            and self.file_timeout is None
+            and self.code_block_timeout is None
+            and self.max_worker_rss is None
+        ):
+            arguments = [
+                (file, run_config, self.overwrite_config) for file, run_config in file_checks
+            ]
+            check_file = functools.partial(with_lookup_cache, checker.check_file)
+            if pool is None or len(files) <= 1:
+                return [check_file(*file_arguments) for file_arguments in arguments]
+            return pool.pool.starmap(check_file, arguments)
+
+        results_iter: t.Iterable[tuple[list[types.LintError], stats.CheckStats | None]]
+        check = functools.partial(
+            with_lookup_cache,
+            functools.partial(
+                _check_file_instrumented,
+                collect_stats=self.stats is not None,
+                profile=self.profile,
+                max_errors=max_errors,
+                code_block_timeout=self.code_block_timeout,
+            ),
+        )
+        if pool is not None and (self.file_timeout is not None or self.max_worker_rss is not None):
+            timeout = self.file_timeout or 0
+            results_iter = pool.imap_supervised(
+                check,
+                file_checks,
+                lambda file_check: ([_create_timeout_error(file_check.source_file, timeout)], None),
             )
+        elif pool is None or len(files) <= 1:
+            results_iter = map(check, file_checks)
+        elif max_errors is None:
+            results_iter = pool.pool.map(check, file_checks)
+        else:
+            # NOTE: imap yields the results in order as soon as they are ready, so that the
+            # remaining tasks can be dropped with the pool once the limit is reached.
+            results_iter = pool.pool.imap(check, file_checks)
+        results = _take_until_max_errors(results_iter, lambda result: len(result[0]), max_errors)
+        files = files[: len(results)]
+
+        if self.stats is not None:
+            for file, (_, file_stats) in zip(files, results, strict=True):
+                if file_stats is not None:
+                    self.stats.add_file(file, file_stats)
+        if self.profile is not None and self.profile.cpu:
+            profiling.merge_cpu_profiles(
+                (profiling.get_cpu_profile_path(f, self.profile.output_dir) for f in files),
+                self.profile.output_dir / profiling.MERGED_PROFILE_NAME,
+            )
+        return [errors for errors, _ in results]
+
+    def _check_archives(
+        self, pool: _WorkerPool | None = None, *, max_errors: int | None = None
+    ) -> list[list[types.LintError]]:
+        """Check the rst members of the archives and return the errors.
+
+        :param pool: Pool to check the members in parallel;
+            defaults to :py:obj:`None` which means the members are checked synchronously
+        :param max_errors: Stop checking further members once this many issues are found;
+            defaults to :py:obj:`None` which means all members are checked
+        :return: List of lists of errors found per checked archive member
+        """
+        results_iter = (
+            errors
+            for archive_path in self._archives_to_check
+            for _, errors in archive.check_archive(
+                archive_path,
+                self.config,
+                overwrite_config=self.overwrite_config,
+                pool=pool.pool if pool is not None else None,
+            )
+        )
+        return _take_until_max_errors(results_iter, len, max_errors)
 
     def _update_results(self, results: list[list[types.LintError]]) -> None:
         """Take results and update error cache.
@@ -218,17 +516,113 @@ class RstcheckMainRunner:
     def check(self) -> None:
         """Check all files in the file list and save the errors.
 
-        Multiple files are run in parallel.
+        Multiple files are run in parallel. With :py:attr:`RstcheckMainRunner.max_errors` set
+        only the first issues up to the limit are saved.
 
         A new call overwrite the old cached errors.
         """
         logger.info("Run checks for all files.")
-        results = (
-            self._run_checks_parallel()
-            if len(self._files_to_check) > 1
-            else self._run_checks_sync()
-        )
+        with self._collect_run_stats():
+            results = (
+                self._run_checks_parallel()
+                if len(self._files_to_check) > 1
+                or self._archives_to_check
+                or self.file_timeout is not None
+                else self._run_checks_sync()
+            )
         self._update_results(results)
+        if self.max_errors is not None:
+            del self.errors[self.max_errors :]
+
+    async def check_async(
+        self,
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        subprocess_semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Check all files in the file list without blocking the event loop and save the errors.
+
+        The files are checked concurrently with :py:func:`rstcheck_core.checker.check_file_async`.
+        Archives, framed stdin and the options limiting the checks or the pool workers are only
+        supported by :py:meth:`RstcheckMainRunner.check`.
+
+        A new call overwrite the old cached errors.
+
+        :param executor: Thread based executor for the blocking parts of the checks;
+            defaults to :py:obj:`None` which means the event loop's default executor
+        :param subprocess_semaphore: Semaphore limiting the number of concurrent subprocesses;
+            defaults to :py:obj:`None`; see :py:func:`rstcheck_core.checker.check_file_async`
+        :raises ValueError: If archives are to be checked or an option unsupported by async
+            checks is set
+        """
+        unsupported = [
+            name
+            for name, is_set in (
+                ("archives", bool(self._archives_to_check)),
+                (
+                    "stdin_framing",
+                    self.stdin_framing is not None and self._files_to_check == [pathlib.Path("-")],
+                ),
+                ("fail_fast/max_errors", self.max_errors is not None),
+                ("file_timeout", self.file_timeout is not None),
+                ("max_tasks_per_worker", self.max_tasks_per_worker is not None),
+                ("max_worker_rss", self.max_worker_rss is not None),
+                ("deduplicate", self.deduplicate),
+            )
+            if is_set
+        ]
+        if unsupported:
+            msg = (
+                f"Async checks do not support {', '.join(unsupported)}; "
+                "use the synchronous check instead."
+            )
+            raise ValueError(msg)
+
+        logger.info("Run checks for all files asynchronously.")
+
+        async def check_file(file: pathlib.Path) -> list[types.LintError]:
+            """Check a single file and record its stats if collected."""
+            if self.stats is None:
+                return await checker.check_file_async(
+                    file,
+                    self.config,
+                    self.overwrite_config,
+                    executor=executor,
+                    subprocess_semaphore=subprocess_semaphore,
+                )
+
+            with stats.collect_stats() as file_stats:
+                errors = await checker.check_file_async(
+                    file,
+                    self.config,
+                    self.overwrite_config,
+                    executor=executor,
+                    subprocess_semaphore=subprocess_semaphore,
+                )
+            self.stats.add_file(file, file_stats)
+            return errors
+
+        with self._collect_run_stats(), checker.subprocess_timeout(self.code_block_timeout):
+            results = await asyncio.gather(*(check_file(file) for file in self._files_to_check))
+        self._update_results(list(results))
+
+    @contextlib.contextmanager
+    def _collect_run_stats(self) -> t.Generator[None, None, None]:
+        """Contextmanager to start new run stats if stats are collected.
+
+        The phases of the run outside of single file checks are recorded into the run stats.
+        """
+        if self.stats is None:
+            yield
+            return
+
+        self.stats = stats.RunStats()
+        start = time.perf_counter()
+        try:
+            with stats.collect_stats(self.stats.run):
+                yield
+        finally:
+            self.stats.wall_time = time.perf_counter() - start
 
     def print_result(self, output_file: t.TextIO | None = None) -> int:
         """Print all cached error messages and return exit code.
@@ -240,17 +634,122 @@ class RstcheckMainRunner:
             print("Success! No issues detected.", file=output_file or sys.stdout)
             return 0
 
-        err_msg_regex = re.compile(r"\([A-Z]+/[0-9]+\)")
-
         for error in self.errors:
-            err_msg = error["message"]
-            if not err_msg_regex.match(err_msg):
-                err_msg = "(ERROR/3) " + err_msg
+            print(_format_error(error), file=output_file or sys.stderr)
 
-            message = f"{error['source_origin']}:{error['line_number']}: {err_msg}"
+        print("Error! Issues detected.", file=output_file or sys.stderr)
+        return 1
 
-            print(message, file=output_file or sys.stderr)
+    def watch(
+        self,
+        interval: float = 1.0,
+        *,
+        debounce: float = 0.2,
+        output_file: t.TextIO | None = None,
+        max_iterations: int | None = None,
+    ) -> int:
+        """Check all files and then re-check changed files until interrupted.
 
+        The paths specified on initialization are polled for changes every ``interval`` seconds.
+        Only files whose content changed and files including them are checked again. Docutils and
+        Sphinx are set up once, in this process like in
+        :py:meth:`rstcheck_core.server.RstcheckServer.serve` and in each pool worker when it
+        starts, and the worker pool and the results of code block checks are kept between checks.
+        After each check the new and resolved issues are printed, prefixed with ``+`` and ``-``
+        respectively.
+
+        Stops on :py:exc:`KeyboardInterrupt`.
+
+        :param interval: Seconds between two polls; defaults to ``1.0``
+        :param debounce: Seconds without further changes to wait for before checking;
+            defaults to ``0.2``
+        :param output_file: file to print to; defaults to sys.stdout (if ``None``)
+        :param max_iterations: Stop after this many polls;
+            defaults to :py:obj:`None` which means no limit
+        :raises ValueError: If stdin is used for input
+        :return: exit code 0 if no error is present at the end; 1 if any error is present
+        """
+        if any(path.name == "-" for path in self.check_paths):
+            msg = "Watch mode does not support stdin as input."
+            raise ValueError(msg)
+
+        logger.info("Watch files for changes.")
+        watcher = _watch.FileWatcher(
+            self.check_paths,
+            recursive=bool(self.config.recursive),
+            sphinx_source_dir=self.config.sphinx_source_dir,
+        )
+        results: dict[pathlib.Path, list[types.LintError]] = {}
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(_sphinx.load_sphinx_warm())
+            stack.enter_context(checker.cache_code_block_results())
+            pool = stack.enter_context(self._create_worker_pool())
+
+            def check_changed(changed: set[pathlib.Path], removed: set[pathlib.Path]) -> None:
+                files = sorted(changed)
+                old_errors = [e for path in changed | removed for e in results.pop(path, [])]
+                new_results = self._check_files(files, pool)
+                results.update(zip(files, new_results, strict=True))
+                self._files_to_check = watcher.files
+                self._update_results([results[file] for file in self._files_to_check])
+                _print_error_diff(
+                    old_errors, [e for errors in new_results for e in errors], output_file
+                )
+
+            check_changed(set(watcher.start()), set())
+
+            iteration = 0
+            try:
+                while max_iterations is None or iteration < max_iterations:
+                    iteration += 1
+                    time.sleep(interval)
+                    (changed, removed) = watcher.poll()
+                    while changed or removed:
+                        time.sleep(debounce)
+                        (more_changed, more_removed) = watcher.poll()
+                        if not more_changed and not more_removed:
+                            logger.info("Re-check %s changed file(s).", len(changed))
+                            check_changed(changed - removed, removed)
+                            break
+                        changed = (changed - more_removed) | more_changed
+                        removed = (removed - more_changed) | more_removed
+            except KeyboardInterrupt:
+                logger.info("Watch mode interrupted.")
+
+        return 1 if self.errors else 0
+
+    def check_framed_stream(
+        self,
+        input_stream: t.BinaryIO,
+        framing_kind: framing.Framing,
+        output_file: t.TextIO | None = None,
+    ) -> int:
+        """Check a stream of framed documents and print the issues of each document once checked.
+
+        The config is resolved once for the current working directory like for stdin. Sphinx is
+        set up once for all documents; see :py:func:`rstcheck_core.checker.check_sources`.
+
+        :param input_stream: Binary stream to read the documents from
+        :param framing_kind: Framing of the documents; see :py:mod:`rstcheck_core.framing`
+        :param output_file: file to print to; defaults to sys.stderr (if ``None``)
+        :return: exit code 0 if no error is printed; 1 if any error is printed
+        """
+        logger.info("Check framed documents from stream.")
+        run_config = config.RunConfigCache(self.config, overwrite_config=self.overwrite_config).get(
+            pathlib.Path()
+        )
+        self.errors = []
+        documents = framing.read_documents(input_stream, framing_kind)
+        for _, errors in checker.check_sources(documents, run_config):
+            for error in errors:
+                print(_format_error(error), file=output_file or sys.stderr)
+            (output_file or sys.stderr).flush()
+            self.errors += errors
+
+        if not self.errors:
+            print("Success! No issues detected.", file=output_file or sys.stdout)
+            return 0
         print("Error! Issues detected.", file=output_file or sys.stderr)
         return 1
 
@@ -259,6 +758,492 @@ class RstcheckMainRunner:
 
         :return: exit code 0 if no error is printed; 1 if any error is printed
         """
+        if self.stdin_framing is not None and self._files_to_check == [pathlib.Path("-")]:
+            logger.info("Run checks for framed documents from stdin and print results.")
+            return self.check_framed_stream(sys.stdin.buffer, self.stdin_framing)
+
         logger.info("Run checks and print results.")
         self.check()
         return self.print_result()
+
+    async def run_async(self) -> int:
+        """Run checks asynchronously, print error messages and return the result.
+
+        See :py:meth:`RstcheckMainRunner.check_async` for the supported options.
+
+        :raises ValueError: If an option unsupported by async checks is set
+        :return: exit code 0 if no error is printed; 1 if any error is printed
+        """
+        logger.info("Run checks asynchronously and print results.")
+        await self.check_async()
+        return self.print_result()
+
+
+class _FileCheck(t.NamedTuple):
+    """File to check with its run config resolved before the dispatch to the pool workers."""
+
+    source_file: pathlib.Path
+    run_config: config.RunConfig
+
+
+def _check_file_instrumented(
+    file_check: _FileCheck,
+    *,
+    collect_stats: bool,
+    profile: profiling.ProfileSettings | None,
+    max_errors: int | None = None,
+    code_block_timeout: float | None = None,
+) -> tuple[list[types.LintError], stats.CheckStats | None]:
+    """Check the file like :py:func:`rstcheck_core.checker.check_file` with instrumentation.
+
+    Module level function to be usable in pool workers.
+
+    :param file_check: File to check with its resolved run config
+    :param collect_stats: If the stats of the check are collected
+    :param profile: Settings to profile the check or :py:obj:`None`
+    :param max_errors: Stop the check after this many issues; defaults to :py:obj:`None`
+    :param code_block_timeout: Timeout of the code block subprocesses;
+        defaults to :py:obj:`None`
+    :return: Tuple of the found issues and the stats of the check if collected
+    """
+    with checker.subprocess_timeout(code_block_timeout):
+        return _check_file_with_stats(
+            file_check.source_file,
+            file_check.run_config,
+            collect_stats=collect_stats,
+            profile=profile,
+            max_errors=max_errors,
+        )
+
+
+def _check_file_with_stats(
+    source_file: pathlib.Path,
+    run_config: config.RunConfig,
+    *,
+    collect_stats: bool,
+    profile: profiling.ProfileSettings | None,
+    max_errors: int | None,
+) -> tuple[list[types.LintError], stats.CheckStats | None]:
+    """Check the file and collect its stats if requested (Helper function).
+
+    :param source_file: Path to file to check
+    :param run_config: Run config resolved for the file
+    :param collect_stats: If the stats of the check are collected
+    :param profile: Settings to profile the check or :py:obj:`None`
+    :param max_errors: Stop the check after this many issues or :py:obj:`None`
+    :return: Tuple of the found issues and the stats of the check if collected
+    """
+    if not collect_stats:
+        errors = checker.check_file(source_file, run_config, profile=profile, max_errors=max_errors)
+        return (errors, None)
+
+    with stats.collect_stats() as file_stats:
+        errors = checker.check_file(source_file, run_config, profile=profile, max_errors=max_errors)
+    return (errors, file_stats)
+
+
+class _WorkerPool:
+    """Pool of worker processes which replaces workers exceeding their limits.
+
+    The :py:class:`multiprocessing.pool.Pool` is created on first use and replaces its workers
+    after ``max_tasks_per_worker`` tasks. Each worker sets up Sphinx once when it starts, so that
+    workers are warm before their first check, also after they were replaced.
+
+    Limits the parent has to enforce per worker, i.e. the file timeout and the resident memory,
+    need :py:meth:`_WorkerPool.imap_supervised`, whose tasks run in :py:class:`_SupervisedWorker`
+    processes.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        *,
+        max_tasks_per_worker: int | None = None,
+        max_worker_rss: int | None = None,
+        file_timeout: float | None = None,
+    ) -> None:
+        """Initialize the :py:class:`_WorkerPool`.
+
+        :param processes: Number of worker processes
+        :param max_tasks_per_worker: Number of tasks after which a worker is replaced;
+            defaults to :py:obj:`None` which means no limit
+        :param max_worker_rss: Resident memory in bytes after which a worker of
+            :py:meth:`_WorkerPool.imap_supervised` is replaced;
+            defaults to :py:obj:`None` which means no limit
+        :param file_timeout: Seconds a task of :py:meth:`_WorkerPool.imap_supervised` may take;
+            workers exceeding it are killed and replaced;
+            defaults to :py:obj:`None` which means no limit
+        """
+        self.processes = processes
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss = max_worker_rss
+        self.file_timeout = file_timeout
+        self._stack = contextlib.ExitStack()
+        self._pool: multiprocessing.pool.Pool | None = None
+        self._idle_workers: list[_SupervisedWorker] = []
+
+    def terminate(self) -> None:
+        """Terminate the pool without waiting for its tasks."""
+        self._stack.close()
+        self._pool = None
+        while self._idle_workers:
+            self._idle_workers.pop().kill()
+
+    @property
+    def pool(self) -> multiprocessing.pool.Pool:
+        """The current pool; created if not running."""
+        if self._pool is None:
+            logger.debug("Start pool with %s worker processes.", self.processes)
+            self._pool = self._stack.enter_context(
+                multiprocessing.Pool(
+                    self.processes,
+                    initializer=_init_warm_worker,
+                    maxtasksperchild=self.max_tasks_per_worker,
+                )
+            )
+        return self._pool
+
+    def imap_supervised(
+        self,
+        function: t.Callable[[_ItemT], _ResultT],
+        items: list[_ItemT],
+        on_timeout: t.Callable[[_ItemT], _ResultT],
+    ) -> t.Generator[_ResultT, None, None]:
+        """Map the function over the items in supervised workers and kill workers running late.
+
+        The parent knows which worker runs which item. A worker exceeding the file timeout is
+        killed and replaced, and the result of its item is created with ``on_timeout``; the other
+        workers keep running. Workers which ran ``max_tasks_per_worker`` items or use more than
+        ``max_worker_rss`` bytes of resident memory after an item are replaced before their next
+        item. Workers still running when the generator is closed early are killed.
+
+        :param function: Function to call with each item; must be picklable
+        :param items: Items to call the function with
+        :param on_timeout: Function creating the result of an item whose call timed out
+        :raises RuntimeError: If a worker exits while calling the function
+        :return: :py:obj:`None`
+        :yield: Results in the order of the items
+        """
+        pending = collections.deque(enumerate(items))
+        running: dict[
+            multiprocessing.connection.Connection,
+            tuple[_SupervisedWorker, int, _ItemT, float | None],
+        ] = {}
+        results: dict[int, _ResultT] = {}
+        next_index = 0
+        try:
+            while pending or running:
+                while pending and len(running) < self.processes:
+                    index, item = pending.popleft()
+                    worker = self._idle_workers.pop() if self._idle_workers else _SupervisedWorker()
+                    worker.connection.send((function, item))
+                    deadline = (
+                        time.monotonic() + self.file_timeout
+                        if self.file_timeout is not None
+                        else None
+                    )
+                    running[worker.connection] = (worker, index, item, deadline)
+
+                deadlines = [deadline for *_, deadline in running.values() if deadline is not None]
+                wait_timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                for connection in multiprocessing.connection.wait(list(running), wait_timeout):
+                    worker, index, _, _ = running.pop(connection)  # type: ignore[call-overload]
+                    results[index] = self._receive_result(worker)
+
+                now = time.monotonic()
+                for connection, (worker, index, item, deadline) in list(running.items()):
+                    if deadline is not None and deadline <= now:
+                        logger.warning("Worker %s timed out; replace it.", worker.process.pid)
+                        del running[connection]
+                        worker.kill()
+                        results[index] = on_timeout(item)
+
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+        finally:
+            for worker, *_ in running.values():
+                worker.kill()
+
+    def _receive_result(self, worker: _SupervisedWorker) -> t.Any:  # noqa: ANN401
+        """Receive the result of the worker's task and keep or replace the worker.
+
+        :param worker: Worker which finished its task
+        :raises RuntimeError: If the worker exited while running its task
+        :raises Exception: Exception raised by the task
+        :return: Result of the task
+        """
+        try:
+            succeeded, result, rss = worker.connection.recv()
+        except EOFError as exc:
+            worker.kill()
+            msg = f"Worker {worker.process.pid} exited unexpectedly."
+            raise RuntimeError(msg) from exc
+
+        worker.tasks += 1
+        if self.max_worker_rss is not None and rss is not None and rss > self.max_worker_rss:
+            logger.info(
+                "Worker %s uses %s bytes of resident memory, more than the limit of %s bytes.",
+                worker.process.pid,
+                rss,
+                self.max_worker_rss,
+            )
+            worker.stop()
+        elif self.max_tasks_per_worker is not None and worker.tasks >= self.max_tasks_per_worker:
+            worker.stop()
+        else:
+            self._idle_workers.append(worker)
+        if not succeeded:
+            raise result
+        return result
+
+
+class _SupervisedWorker:
+    """Worker process running one task at a time, which the parent can kill at any time.
+
+    Unlike the anonymous workers of a :py:class:`multiprocessing.pool.Pool` the parent knows the
+    task each worker runs, so that a worker running late is killed without affecting other tasks.
+    The worker sets up Sphinx once when it starts.
+    """
+
+    def __init__(self) -> None:
+        """Start the worker process."""
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_run_supervised_worker, args=(worker_connection,), daemon=True
+        )
+        self.process.start()
+        worker_connection.close()
+        self.tasks = 0
+
+    def stop(self) -> None:
+        """Let the idle worker exit and wait for it."""
+        with contextlib.suppress(OSError):
+            self.connection.send(None)
+        self.connection.close()
+        self.process.join()
+
+    def kill(self) -> None:
+        """Kill the worker without waiting for its task."""
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _run_supervised_worker(connection: multiprocessing.connection.Connection) -> None:
+    """Run the tasks received from the parent until it sends :py:obj:`None` or hangs up.
+
+    Each result is sent with the resident memory of the worker after the task.
+
+    Module level function to be usable as target of worker processes.
+
+    :param connection: Connection to receive the tasks from and send the results to
+    """
+    _init_warm_worker()
+    with connection:
+        while True:
+            try:
+                task = connection.recv()
+            except EOFError:
+                return
+            if task is None:
+                return
+            function, item = task
+            try:
+                result = (True, function(item))
+            except Exception as exc:  # noqa: BLE001
+                result = (False, exc)
+            connection.send((*result, _get_rss()))
+
+
+_worker_contexts = contextlib.ExitStack()
+"""Contexts kept open for the lifetime of a pool worker."""
+
+
+def _init_warm_worker() -> None:
+    """Set up Sphinx once for the lifetime of a pool worker.
+
+    Module level function to be usable as pool initializer.
+    """
+    _worker_contexts.enter_context(_sphinx.load_sphinx_warm())
+
+
+_include_lookup_caches: dict[str, _sphinx_workarounds.IncludeLookupCache] = {}
+"""Include lookup cache of the latest check call by its ID, kept between the tasks of a worker."""
+
+
+def _call_with_include_lookup_cache(  # noqa: UP047
+    call_id: str, function: t.Callable[..., _ResultT], *args: object
+) -> _ResultT:
+    """Call the function with the include lookup cache of the check call.
+
+    The cache is shared by all files of the check call checked in this process. A new check call
+    replaces the cache, so that files changed in between are seen.
+
+    Module level function to be usable in pool workers.
+
+    :param call_id: ID of the check call
+    :param function: Function to call
+    :param args: Arguments to call the function with
+    :return: Result of the function
+    """
+    cache = _include_lookup_caches.get(call_id)
+    if cache is None:
+        _include_lookup_caches.clear()
+        cache = _include_lookup_caches[call_id] = _sphinx_workarounds.IncludeLookupCache()
+    with _sphinx_workarounds.cache_include_lookups(cache):
+        return function(*args)
+
+
+def _get_rss() -> int | None:
+    """Get the current resident memory of the process.
+
+    Uses ``/proc`` where available, otherwise the peak resident memory.
+
+    :return: Resident memory in bytes or :py:obj:`None` if not measurable, e.g. on Windows
+    """
+    with contextlib.suppress(OSError, ValueError, IndexError):
+        statm = pathlib.Path("/proc/self/statm").read_text(encoding="utf-8")
+        return int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: ``ru_maxrss`` is in bytes on macOS and in kibibytes elsewhere.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _resolve_file_checks(
+    files: list[pathlib.Path], config_cache: config.RunConfigCache
+) -> list[_FileCheck]:
+    """Resolve the run config of each file.
+
+    Files whose directories share a config file get the same run config object, so that it is
+    pickled only once per chunk of tasks sent to a pool worker.
+
+    :param files: Files to check
+    :param config_cache: Cache resolving the run configs of the files
+    :return: Files with their run configs in the order of the files
+    """
+    run_configs: dict[int, config.RunConfig] = {}
+    file_checks = []
+    for file in files:
+        rstcheck_config = config_cache.get(file.parent)
+        run_config = run_configs.get(id(rstcheck_config))
+        if run_config is None:
+            run_config = config.RunConfig.from_config(rstcheck_config)
+            run_configs[id(rstcheck_config)] = run_config
+        file_checks.append(_FileCheck(file, run_config))
+    return file_checks
+
+
+def _group_identical_files(
+    files: list[pathlib.Path], config_cache: config.RunConfigCache
+) -> list[list[pathlib.Path]]:
+    """Group the files with identical content and run config.
+
+    Run configs are compared by their object cached in the ``config_cache``, so that no run config
+    is converted per file. Files whose issues depend on their directory are only grouped with files
+    in the same directory. Files which cannot be read form their own group.
+
+    :param files: Files to group
+    :param config_cache: Cache resolving the run configs of the files
+    :return: Groups of files ordered by their first file
+    """
+    groups: dict[t.Hashable, list[pathlib.Path]] = {}
+    for file in files:
+        try:
+            content = file.read_bytes()
+        except OSError:
+            groups[file] = [file]
+            continue
+        directory = file.parent.resolve() if _PATH_DEPENDENT_SOURCE_REGEX.search(content) else None
+        # NOTE: Directories sharing a config file share the cached run config object.
+        run_config_id = id(config_cache.get(file.parent))
+        key = (hashlib.blake2b(content).digest(), run_config_id, directory)
+        groups.setdefault(key, []).append(file)
+    return list(groups.values())
+
+
+def _create_timeout_error(source_file: pathlib.Path, timeout: float) -> types.LintError:
+    """Create the issue reported for a file whose check timed out.
+
+    :param source_file: Path to the file
+    :param timeout: Exceeded timeout in seconds
+    :return: Issue
+    """
+    return types.LintError(
+        source_origin=source_file,
+        line_number=0,
+        message=f"(SEVERE/4) Check timed out after {timeout:g} seconds.",
+    )
+
+
+def _take_until_max_errors(  # noqa: UP047
+    results: t.Iterable[_ResultT],
+    count_errors: t.Callable[[_ResultT], int],
+    max_errors: int | None,
+) -> list[_ResultT]:
+    """Take results until they contain at least ``max_errors`` issues.
+
+    :param results: Results to take from; consumed lazily
+    :param count_errors: Function counting the issues of a result
+    :param max_errors: Number of issues to stop at or :py:obj:`None` to take all results
+    :return: Taken results
+    """
+    if max_errors is None:
+        return list(results)
+
+    taken: list[_ResultT] = []
+    error_count = 0
+    for result in results:
+        taken.append(result)
+        error_count += count_errors(result)
+        if error_count >= max_errors:
+            logger.info("Stop checks after finding %s issue(s).", error_count)
+            break
+    return taken
+
+
+_ERR_MSG_REGEX = re.compile(r"\([A-Z]+/[0-9]+\)")
+
+
+def _format_error(error: types.LintError) -> str:
+    """Format an error for printing.
+
+    :param error: Error to format
+    :return: Formatted error message
+    """
+    err_msg = error["message"]
+    if not _ERR_MSG_REGEX.match(err_msg):
+        err_msg = "(ERROR/3) " + err_msg
+
+    return f"{error['source_origin']}:{error['line_number']}: {err_msg}"
+
+
+def _print_error_diff(
+    old_errors: list[types.LintError],
+    new_errors: list[types.LintError],
+    output_file: t.TextIO | None = None,
+) -> None:
+    """Print the issues added and resolved between two checks.
+
+    :param old_errors: Errors of the previous check
+    :param new_errors: Errors of the current check
+    :param output_file: file to print to; defaults to sys.stdout (if ``None``)
+    """
+    old_messages = {_format_error(error) for error in old_errors}
+    new_messages = {_format_error(error) for error in new_errors}
+
+    for message in sorted(new_messages - old_messages):
+        print(f"+ {message}", file=output_file or sys.stdout)
+    for message in sorted(old_messages - new_messages):
+        print(f"- {message}", file=output_file or sys.stdout)
+
+    print(
+        f"{len(new_messages - old_messages)} new issue(s), "
+        f"{len(old_messages - new_messages)} resolved issue(s).",
+        file=output_file or sys.stdout,
+    )
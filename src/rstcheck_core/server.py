@@ -0,0 +1,318 @@
+"""Local check server and client communicating over a Unix domain socket.
+
+The server keeps ``rstcheck-core`` loaded with warm state between checks: Sphinx and the docutils
+directives and roles are set up once, resolved configs are cached per directory and results of
+code block checks are cached. Clients like editor plugins or pre-commit hooks then only pay for a
+socket round-trip instead of the start-up of python, docutils and Sphinx.
+
+.. note::
+
+    Unix domain sockets are not available on Windows.
+
+The protocol is line based. Each line sent by a client is a JSON object with an ``action`` key.
+The server answers each line with one line containing a JSON object with an ``ok`` key and on
+success the result or on failure an ``error`` key with a message.
+
+``{"action": "check", "path": "docs/index.rst"}``
+    Check the file. An additional ``source`` key can hold the content to check instead of the
+    content on disk, e.g. from an unsaved editor buffer. Without ``path`` the ``source`` is checked
+    like input from stdin with the base config. The response holds the found issues as list under
+    ``errors``.
+``{"action": "reload"}``
+    Drop the cached configs and code block results.
+``{"action": "ping"}``
+    Check if the server is alive.
+``{"action": "shutdown"}``
+    Stop the server after answering.
+
+Example usage:
+
+.. code-block:: python
+
+    import pathlib
+
+    from rstcheck_core import config, server
+
+    socket_path = pathlib.Path("/tmp/rstcheck.sock")
+
+    # In the daemon process
+    server.RstcheckServer(socket_path, config.RstcheckConfig()).serve()
+
+    # In the client process
+    errors = server.check_with_server(socket_path, path=pathlib.Path("docs/index.rst"))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import pathlib
+import socket
+import socketserver
+import sys
+import typing as t
+
+from . import _sphinx, checker, config, types
+
+logger = logging.getLogger(__name__)
+
+
+ServerResponse = dict[str, t.Any]
+"""JSON object sent as answer by the server."""
+
+
+def serialize_lint_error(error: types.LintError) -> dict[str, t.Any]:
+    """Convert a :py:class:`rstcheck_core.types.LintError` into a JSON compatible dict.
+
+    :param error: Error to convert
+    :return: JSON compatible dict
+    """
+    return {
+        "source_origin": str(error["source_origin"]),
+        "line_number": error["line_number"],
+        "message": error["message"],
+    }
+
+
+def deserialize_lint_error(data: dict[str, t.Any]) -> types.LintError:
+    """Convert a dict created by :py:func:`serialize_lint_error` back.
+
+    :param data: Dict to convert
+    :return: Error
+    """
+    source_origin: types.SourceFileOrString
+    if data["source_origin"] in {"<string>", "<stdin>"}:
+        source_origin = data["source_origin"]
+    else:
+        source_origin = pathlib.Path(data["source_origin"])
+    return types.LintError(
+        source_origin=source_origin, line_number=data["line_number"], message=data["message"]
+    )
+
+
+class RstcheckServer:
+    """Server checking rst files and sources on request."""
+
+    def __init__(
+        self,
+        socket_path: pathlib.Path,
+        rstcheck_config: config.RstcheckConfig,
+        *,
+        overwrite_config: bool = True,
+    ) -> None:
+        """Initialize the :py:class:`RstcheckServer` with a base config.
+
+        :param socket_path: Path of the Unix domain socket to listen on
+        :param rstcheck_config: Base configuration config from e.g. the CLI.
+        :param overwrite_config: If file config overwrites current config; defaults to True
+        """
+        self.socket_path = socket_path
+        self.config = rstcheck_config
+        self.overwrite_config = overwrite_config
+        self.code_block_cache = checker.CodeBlockResultCache()
+        self.run_configs = config.RunConfigCache(rstcheck_config, overwrite_config=overwrite_config)
+        self._shutdown_requested = False
+
+    @property
+    def shutdown_requested(self) -> bool:
+        """If a client requested the server to shut down."""
+        return self._shutdown_requested
+
+    def serve(self) -> None:  # pragma: no cover
+        """Listen on the socket and answer requests until a shutdown is requested.
+
+        A stale socket file from a crashed server is replaced.
+
+        :raises OSError: If another server is already listening on the socket
+        """
+        if sys.platform == "win32":
+            msg = "Unix domain sockets are not supported on Windows."
+            raise OSError(msg)
+
+        if self.socket_path.exists():
+            if _server_is_alive(self.socket_path):
+                msg = f"A server is already listening on '{self.socket_path}'."
+                raise OSError(msg)
+            logger.info("Remove stale socket file '%s'.", self.socket_path)
+            self.socket_path.unlink()
+
+        logger.info("Start rstcheck server on '%s'.", self.socket_path)
+        self._shutdown_requested = False
+        try:
+            with (
+                _sphinx.load_sphinx_warm(),
+                checker.cache_code_block_results(self.code_block_cache),
+                _UnixStreamServer(str(self.socket_path), _RequestHandler) as unix_server,
+            ):
+                unix_server.rstcheck_server = self
+                while not self._shutdown_requested:
+                    unix_server.handle_request()
+        except KeyboardInterrupt:
+            logger.info("Rstcheck server interrupted.")
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+        logger.info("Rstcheck server stopped.")
+
+    def handle_request(self, request: t.Any) -> ServerResponse:  # noqa: ANN401
+        """Answer a single request.
+
+        :param request: Decoded JSON request
+        :return: Response to send back
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request must be a JSON object."}
+
+        action = request.get("action")
+        if action == "ping":
+            return {"ok": True}
+        if action == "reload":
+            logger.info("Drop cached configs and code block results.")
+            self.run_configs.clear()
+            self.code_block_cache.clear()
+            return {"ok": True}
+        if action == "shutdown":
+            self._shutdown_requested = True
+            return {"ok": True}
+        if action == "check":
+            return self._handle_check_request(request)
+        return {"ok": False, "error": f"Unknown action: {action!r}."}
+
+    def get_run_config(self, directory: pathlib.Path) -> config.RstcheckConfig:
+        """Get the config for files in the directory; cached per directory.
+
+        :param directory: Directory of the file to check
+        :return: Base config merged with the config file found for the directory
+        """
+        return self.run_configs.get(directory)
+
+    def _handle_check_request(self, request: dict[str, t.Any]) -> ServerResponse:
+        """Answer a check request.
+
+        :param request: Decoded JSON request with ``action`` "check"
+        :return: Response with the found issues
+        """
+        path = request.get("path")
+        source = request.get("source")
+        if not isinstance(path, str | None) or not isinstance(source, str | None):
+            return {"ok": False, "error": "'path' and 'source' must be strings."}
+
+        if path is None and source is None:
+            return {"ok": False, "error": "Either 'path' or 'source' is required."}
+
+        if path is None:
+            source_file = pathlib.Path("-")
+            run_config = self.config
+        else:
+            source_file = pathlib.Path(path)
+            if source is None and not source_file.is_file():
+                return {"ok": False, "error": f"File not found: '{path}'."}
+            run_config = self.get_run_config(source_file.parent)
+
+        errors = checker.check_file(
+            source_file, run_config, search_file_config=False, source=source
+        )
+        return {"ok": True, "errors": [serialize_lint_error(e) for e in errors]}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer all requests sent over one connection."""
+
+    server: _UnixStreamServer
+
+    def handle(self) -> None:  # pragma: no cover
+        """Read requests line by line and write the responses."""
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response: ServerResponse = {"ok": False, "error": "Invalid JSON."}
+            else:
+                try:
+                    response = self.server.rstcheck_server.handle_request(request)
+                except Exception as exc:
+                    logger.exception("Error while handling request.")
+                    response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if self.server.rstcheck_server.shutdown_requested:
+                return
+
+
+if sys.platform != "win32":
+
+    class _UnixStreamServer(socketserver.UnixStreamServer):
+        """Unix stream server with a reference to the :py:class:`RstcheckServer`."""
+
+        rstcheck_server: RstcheckServer
+
+
+def _server_is_alive(socket_path: pathlib.Path) -> bool:
+    """Check if a server answers on the socket.
+
+    :param socket_path: Path of the socket
+    :return: If a server answered
+    """
+    try:
+        send_request(socket_path, {"action": "ping"}, timeout=1.0)
+    except OSError:
+        return False
+    return True
+
+
+def send_request(
+    socket_path: pathlib.Path, request: dict[str, t.Any], *, timeout: float | None = None
+) -> ServerResponse:
+    """Send a single request to a running server and return its response.
+
+    :param socket_path: Path of the socket the server listens on
+    :param request: Request to send
+    :param timeout: Timeout in seconds for connecting and waiting for the response;
+        defaults to :py:obj:`None` which means no timeout
+    :raises OSError: If the server cannot be reached or closes the connection early
+    :return: Decoded response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as response_file:
+            response_line = response_file.readline()
+
+    if not response_line:
+        msg = "Server closed the connection without response."
+        raise ConnectionError(msg)
+    response: ServerResponse = json.loads(response_line)
+    return response
+
+
+def check_with_server(
+    socket_path: pathlib.Path,
+    *,
+    path: pathlib.Path | None = None,
+    source: str | None = None,
+    timeout: float | None = None,
+) -> list[types.LintError]:
+    """Check a file or source with a running server.
+
+    :param socket_path: Path of the socket the server listens on
+    :param path: File to check; defaults to :py:obj:`None`
+    :param source: Source to check instead of the file's content;
+        defaults to :py:obj:`None`
+    :param timeout: Timeout in seconds; defaults to :py:obj:`None` which means no timeout
+    :raises OSError: If the server cannot be reached
+    :raises RuntimeError: If the server could not handle the request
+    :return: Found issues
+    """
+    request: dict[str, t.Any] = {"action": "check"}
+    if path is not None:
+        request["path"] = str(path.absolute())
+    if source is not None:
+        request["source"] = source
+
+    response = send_request(socket_path, request, timeout=timeout)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "Unknown server error."))
+    return [deserialize_lint_error(e) for e in response["errors"]]
@@ -0,0 +1,247 @@
+"""Optional instrumentation of the phases of checks.
+
+Inside :py:func:`collect_stats` the checks record how long their phases take; outside of it the
+instrumentation does nothing. The phases are:
+
+``config``
+    Resolution of the config for a file; see :py:func:`rstcheck_core.checker.check_file`.
+``read``
+    Reading the source.
+``registry_reset``
+    Resetting docutils' directives and roles.
+``sphinx_load``
+    Setting up Sphinx and registering its directives and roles to ignore.
+``docutils_parse``
+    Parsing the source with docutils.
+``code_block:<language>``
+    Checking a code block of the language.
+``error_parsing``
+    Parsing docutils' error messages.
+``subprocess:<language>``
+    Running the external program checking a code block of the language.
+
+Timings are inclusive, e.g. the parsing of a nested rst code block is part of its
+``code_block:rst`` timing as well as of the ``docutils_parse`` timing.
+
+Besides the timings, counters per language are recorded:
+
+``code_block.seen:<language>``
+    Code blocks found in the sources.
+``code_block.skipped.ignored_language:<language>``
+    Code blocks skipped because the language is ignored.
+``code_block.skipped.ignore_comment:<language>``
+    Code blocks skipped because of an ``ignore-next-code-block`` comment.
+``code_block.skipped.unsupported:<language>``
+    Code blocks skipped because the language cannot be checked.
+``subprocess.spawned:<language>``
+    External programs run to check code blocks.
+``temp_file.created:<language>``
+    Temporary files written for the external programs.
+
+Example usage:
+
+.. code-block:: python
+
+    import pathlib
+
+    from rstcheck_core import checker, config, stats
+
+    with stats.collect_stats() as check_stats:
+        checker.check_file(pathlib.Path("index.rst"), config.RstcheckConfig())
+    print(check_stats.to_dict())
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import logging
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+logger = logging.getLogger(__name__)
+
+
+PHASE_CONFIG = "config"
+PHASE_READ = "read"
+PHASE_REGISTRY_RESET = "registry_reset"
+PHASE_SPHINX_LOAD = "sphinx_load"
+PHASE_DOCUTILS_PARSE = "docutils_parse"
+PHASE_CODE_BLOCK = "code_block"
+PHASE_ERROR_PARSING = "error_parsing"
+PHASE_SUBPROCESS = "subprocess"
+
+COUNTER_CODE_BLOCK_SEEN = "code_block.seen"
+COUNTER_CODE_BLOCK_IGNORED_LANGUAGE = "code_block.skipped.ignored_language"
+COUNTER_CODE_BLOCK_IGNORE_COMMENT = "code_block.skipped.ignore_comment"
+COUNTER_CODE_BLOCK_UNSUPPORTED = "code_block.skipped.unsupported"
+COUNTER_SUBPROCESS_SPAWNED = "subprocess.spawned"
+COUNTER_TEMP_FILE_CREATED = "temp_file.created"
+
+
+class PhaseTiming(t.TypedDict):
+    """Aggregated timing of a phase."""
+
+    count: int
+    seconds: float
+
+
+class CheckStats:
+    """Timings of checks aggregated by phase and counters of events."""
+
+    def __init__(self) -> None:
+        """Initialize empty :py:class:`CheckStats`."""
+        self.timings: dict[str, PhaseTiming] = {}
+        self.counters: dict[str, int] = {}
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        """Record a single run of a phase.
+
+        :param phase: Name of the phase
+        :param seconds: Duration of the run
+        """
+        timing = self.timings.setdefault(phase, PhaseTiming(count=0, seconds=0.0))
+        timing["count"] += 1
+        timing["seconds"] += seconds
+
+    def add_count(self, counter: str, amount: int = 1) -> None:
+        """Increase a counter.
+
+        :param counter: Name of the counter
+        :param amount: Amount to increase by; defaults to 1
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def merge(self, other: CheckStats) -> None:
+        """Add the timings and counters of other stats to these.
+
+        :param other: Stats to add
+        """
+        for phase, other_timing in other.timings.items():
+            timing = self.timings.setdefault(phase, PhaseTiming(count=0, seconds=0.0))
+            timing["count"] += other_timing["count"]
+            timing["seconds"] += other_timing["seconds"]
+        for counter, amount in other.counters.items():
+            self.add_count(counter, amount)
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """Convert the stats into a JSON compatible dict.
+
+        :return: Dict with the timings sorted by phase and the counters sorted by name
+        """
+        return {
+            "timings": {phase: dict(self.timings[phase]) for phase in sorted(self.timings)},
+            "counters": {counter: self.counters[counter] for counter in sorted(self.counters)},
+        }
+
+
+class RunStats:
+    """Stats of a run over multiple files."""
+
+    def __init__(self) -> None:
+        """Initialize empty :py:class:`RunStats`."""
+        self.files: dict[pathlib.Path, CheckStats] = {}
+        self.run = CheckStats()
+        """Phases of the run itself outside of the checks of single files."""
+        self.wall_time = 0.0
+
+    @property
+    def total(self) -> CheckStats:
+        """Stats of all files and the run itself aggregated."""
+        total = CheckStats()
+        total.merge(self.run)
+        for file_stats in self.files.values():
+            total.merge(file_stats)
+        return total
+
+    def add_file(self, path: pathlib.Path, file_stats: CheckStats) -> None:
+        """Set the stats of a checked file; replaces older stats of the file.
+
+        :param path: Checked file
+        :param file_stats: Stats of the check
+        """
+        self.files[path] = file_stats
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """Convert the stats into a JSON compatible dict.
+
+        :return: Dict with the wall time, the totals, the run's own phases and the files' stats
+        """
+        return {
+            "wall_time": self.wall_time,
+            "total": self.total.to_dict(),
+            "run": self.run.to_dict(),
+            "files": {str(path): self.files[path].to_dict() for path in sorted(self.files)},
+        }
+
+    def dump(self, output_file: pathlib.Path) -> None:
+        """Write the stats as JSON.
+
+        :param output_file: File to write to
+        """
+        logger.debug("Write stats to '%s'.", output_file)
+        output_file.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+_active_stats: contextvars.ContextVar[CheckStats | None] = contextvars.ContextVar(
+    "active_stats", default=None
+)
+
+
+@contextlib.contextmanager
+def collect_stats(check_stats: CheckStats | None = None) -> t.Generator[CheckStats, None, None]:
+    """Contextmanager to record the phases of checks inside the context.
+
+    :param check_stats: Stats to record into; defaults to :py:obj:`None` which creates new ones
+    :return: :py:obj:`None`
+    :yield: The stats recorded into
+    """
+    check_stats = check_stats if check_stats is not None else CheckStats()
+    token = _active_stats.set(check_stats)
+    try:
+        yield check_stats
+    finally:
+        _active_stats.reset(token)
+
+
+def get_active_stats() -> CheckStats | None:
+    """Get the stats recorded into by the current context.
+
+    :return: Stats or :py:obj:`None` if no stats are collected
+    """
+    return _active_stats.get()
+
+
+def count(counter: str, amount: int = 1) -> None:
+    """Increase a counter if stats are collected.
+
+    :param counter: Name of the counter
+    :param amount: Amount to increase by; defaults to 1
+    """
+    check_stats = _active_stats.get()
+    if check_stats is not None:
+        check_stats.add_count(counter, amount)
+
+
+@contextlib.contextmanager
+def span(phase: str) -> t.Generator[None, None, None]:
+    """Contextmanager to time a phase if stats are collected.
+
+    :param phase: Name of the phase
+    :return: :py:obj:`None`
+    :yield: :py:obj:`None`
+    """
+    check_stats = _active_stats.get()
+    if check_stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        check_stats.add_timing(phase, time.perf_counter() - start)
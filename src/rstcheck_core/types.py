@@ -22,7 +22,10 @@ YieldedLintError = t.Generator[LintError, None, None]
 
 
 class IgnoreDict(t.TypedDict):
-    """Dict with ignore information."""
+    """Dict with ignore information.
+
+    Converted to :py:class:`Ignores` for the checks.
+    """
 
     messages: t.Pattern[str] | None
     languages: list[str]
@@ -59,6 +62,64 @@ def construct_ignore_dict(
     )
 
 
+class Ignores(t.NamedTuple):
+    """Immutable ignore information with set based lookups.
+
+    Derive variants with :py:meth:`Ignores.extend` instead of changing the ignores in place, so
+    that e.g. the ignores from inline config comments of one source do not leak into others.
+    """
+
+    messages: t.Pattern[str] | None = None
+    languages: frozenset[str] = frozenset()
+    directives: frozenset[str] = frozenset()
+    roles: frozenset[str] = frozenset()
+    substitutions: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_ignore_dict(cls, ignores: IgnoreDict | Ignores | None) -> Ignores:
+        """Create :py:class:`Ignores` from an :py:class:`IgnoreDict`.
+
+        :param ignores: Ignore information to convert; :py:class:`Ignores` are returned as is;
+            :py:obj:`None` results in empty ignores
+        :return: :py:class:`Ignores` with the values of the ``ignores``
+        """
+        if ignores is None:
+            return cls()
+        if isinstance(ignores, Ignores):
+            return ignores
+        return cls(
+            messages=ignores["messages"],
+            languages=frozenset(ignores["languages"]),
+            directives=frozenset(ignores["directives"]),
+            roles=frozenset(ignores["roles"]),
+            substitutions=frozenset(ignores["substitutions"]),
+        )
+
+    def extend(
+        self,
+        *,
+        languages: t.Iterable[str] = (),
+        directives: t.Iterable[str] = (),
+        roles: t.Iterable[str] = (),
+        substitutions: t.Iterable[str] = (),
+    ) -> Ignores:
+        """Derive new ignores with additional values.
+
+        :param languages: Languages to ignore additionally; defaults to none
+        :param directives: Directives to ignore additionally; defaults to none
+        :param roles: Roles to ignore additionally; defaults to none
+        :param substitutions: Substitutions to ignore additionally; defaults to none
+        :return: The extended ignores or these ignores if nothing was added
+        """
+        extended = self._replace(
+            languages=self.languages.union(languages),
+            directives=self.directives.union(directives),
+            roles=self.roles.union(roles),
+            substitutions=self.substitutions.union(substitutions),
+        )
+        return self if extended == self else extended
+
+
 CheckerRunFunction = t.Callable[..., YieldedLintError]
 """Function to run checks.
 
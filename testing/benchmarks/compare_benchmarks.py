@@ -0,0 +1,295 @@
+"""Compare two benchmark result sets of :py:mod:`run_benchmarks` and flag regressions.
+
+The timings of each scenario are summarized by their median and interquartile range (IQR). A
+scenario regressed when the candidate's median is slower than the baseline's median by more than
+the scenario's threshold *and* the candidate's first quartile is above the baseline's third
+quartile, so that noise within the spread of the repeated runs is not flagged.
+
+Thresholds are relative, e.g. ``0.1`` for 10%, and are set per scenario with glob patterns. The
+first matching pattern wins; ``--threshold`` applies to scenarios without a match.
+
+The exit code is ``1`` if any scenario regressed or a scenario of the baseline is missing from the
+candidate, so that dropping a gated scenario does not pass silently, and ``0`` otherwise. Missing
+scenarios are allowed with ``--allow-missing``, e.g. to compare only some scenarios.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import statistics
+import sys
+import typing as t
+from pathlib import Path
+
+import run_benchmarks
+
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_SCENARIO_THRESHOLDS = {
+    "check_source/10000-lines/*": 0.05,
+    "runner/1000-files/*": 0.05,
+}
+"""Tighter thresholds for the scenarios upgrades are gated on."""
+
+STATUS_OK = "ok"
+STATUS_REGRESSION = "REGRESSION"
+STATUS_IMPROVEMENT = "improvement"
+STATUS_MISSING = "missing"
+STATUS_NEW = "new"
+
+
+class Summary(t.NamedTuple):
+    """Summary of the timings of a scenario."""
+
+    median: float
+    q1: float
+    q3: float
+    runs: int
+
+    @property
+    def iqr(self) -> float:
+        """Interquartile range."""
+        return self.q3 - self.q1
+
+
+class Comparison(t.NamedTuple):
+    """Comparison of a scenario between baseline and candidate."""
+
+    scenario: str
+    baseline: Summary | None
+    candidate: Summary | None
+    threshold: float
+    status: str
+
+    @property
+    def delta(self) -> float | None:
+        """Relative change of the median; positive means slower."""
+        if self.baseline is None or self.candidate is None or not self.baseline.median:
+            return None
+        return self.candidate.median / self.baseline.median - 1
+
+
+def summarize(times: list[float]) -> Summary:
+    """Summarize the timings of repeated runs.
+
+    :param times: Durations of the runs
+    :raises ValueError: If there are no timings
+    :return: Summary
+    """
+    if not times:
+        msg = "No timings to summarize."
+        raise ValueError(msg)
+    if len(times) == 1:
+        return Summary(times[0], times[0], times[0], 1)
+    q1, median, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    return Summary(median, q1, q3, len(times))
+
+
+def get_threshold(
+    scenario: str, scenario_thresholds: dict[str, float], default_threshold: float
+) -> float:
+    """Get the threshold of a scenario.
+
+    :param scenario: Name of the scenario
+    :param scenario_thresholds: Map of glob patterns to thresholds; the first match wins
+    :param default_threshold: Threshold if no pattern matches
+    :return: Threshold
+    """
+    for pattern, threshold in scenario_thresholds.items():
+        if fnmatch.fnmatch(scenario, pattern):
+            return threshold
+    return default_threshold
+
+
+def compare_summaries(baseline: Summary, candidate: Summary, threshold: float) -> str:
+    """Compare the summaries of a scenario.
+
+    :param baseline: Summary of the baseline
+    :param candidate: Summary of the candidate
+    :param threshold: Relative threshold for a regression
+    :return: Status of the comparison
+    """
+    if candidate.median > baseline.median * (1 + threshold) and candidate.q1 > baseline.q3:
+        return STATUS_REGRESSION
+    if candidate.median < baseline.median * (1 - threshold) and candidate.q3 < baseline.q1:
+        return STATUS_IMPROVEMENT
+    return STATUS_OK
+
+
+def compare_results(
+    baseline: dict[str, t.Any],
+    candidate: dict[str, t.Any],
+    scenario_thresholds: dict[str, float],
+    default_threshold: float,
+) -> list[Comparison]:
+    """Compare the scenarios of two result sets.
+
+    :param baseline: Baseline results as written by :py:mod:`run_benchmarks`
+    :param candidate: Candidate results as written by :py:mod:`run_benchmarks`
+    :param scenario_thresholds: Map of glob patterns to thresholds; the first match wins
+    :param default_threshold: Threshold if no pattern matches
+    :return: Comparisons sorted by scenario
+    """
+    baseline_scenarios = baseline["scenarios"]
+    candidate_scenarios = candidate["scenarios"]
+    comparisons: list[Comparison] = []
+    for scenario in sorted(baseline_scenarios.keys() | candidate_scenarios.keys()):
+        threshold = get_threshold(scenario, scenario_thresholds, default_threshold)
+        baseline_summary = (
+            summarize(baseline_scenarios[scenario]["times"])
+            if scenario in baseline_scenarios
+            else None
+        )
+        candidate_summary = (
+            summarize(candidate_scenarios[scenario]["times"])
+            if scenario in candidate_scenarios
+            else None
+        )
+        if baseline_summary is None:
+            status = STATUS_NEW
+        elif candidate_summary is None:
+            status = STATUS_MISSING
+        else:
+            status = compare_summaries(baseline_summary, candidate_summary, threshold)
+        comparisons.append(
+            Comparison(scenario, baseline_summary, candidate_summary, threshold, status)
+        )
+    return comparisons
+
+
+def get_failures(comparisons: list[Comparison], *, allow_missing: bool = False) -> list[Comparison]:
+    """Get the comparisons failing the gate.
+
+    :param comparisons: Comparisons to check
+    :param allow_missing: If scenarios missing from the candidate pass; defaults to False
+    :return: Regressed and, unless allowed, missing scenarios
+    """
+    failing_statuses = {STATUS_REGRESSION} if allow_missing else {STATUS_REGRESSION, STATUS_MISSING}
+    return [comparison for comparison in comparisons if comparison.status in failing_statuses]
+
+
+def _format_summary(summary: Summary | None) -> str:
+    """Format a summary as median and IQR in milliseconds."""
+    if summary is None:
+        return "-"
+    return f"{summary.median * 1000:.1f} ± {summary.iqr * 1000:.1f}"
+
+
+def format_table(comparisons: list[Comparison]) -> str:
+    """Format comparisons as a plain text table.
+
+    :param comparisons: Comparisons to format
+    :return: Table with medians and IQRs in milliseconds
+    """
+    header = ("scenario", "baseline ms", "candidate ms", "delta", "limit", "status")
+    rows = [
+        (
+            comparison.scenario,
+            _format_summary(comparison.baseline),
+            _format_summary(comparison.candidate),
+            f"{comparison.delta:+.1%}" if comparison.delta is not None else "-",
+            f"{comparison.threshold:.0%}",
+            comparison.status,
+        )
+        for comparison in comparisons
+    ]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in (header, *rows)
+    )
+
+
+def load_results(path: Path) -> dict[str, t.Any]:
+    """Load a result set.
+
+    :param path: JSON file written by :py:mod:`run_benchmarks`
+    :raises ValueError: If the file has an unsupported format version
+    :return: Results
+    """
+    results: dict[str, t.Any] = json.loads(path.read_text(encoding="utf-8"))
+    if results.get("format_version") != run_benchmarks.FORMAT_VERSION:
+        msg = f"Unsupported format version in '{path}': {results.get('format_version')}"
+        raise ValueError(msg)
+    return results
+
+
+def _parse_scenario_threshold(value: str) -> tuple[str, float]:
+    """Parse a scenario threshold argument like ``runner/*=0.05``."""
+    pattern, _, threshold = value.rpartition("=")
+    if not pattern:
+        msg = f"Expected PATTERN=THRESHOLD: {value}"
+        raise argparse.ArgumentTypeError(msg)
+    try:
+        return pattern, float(threshold)
+    except ValueError as exc:
+        msg = f"Invalid threshold: {value}"
+        raise argparse.ArgumentTypeError(msg) from exc
+
+
+def _parser(argv: list[str] | None = None) -> argparse.Namespace:
+    """Create parser and return parsed args.
+
+    :param argv: Arguments to parse; defaults to :py:obj:`None` which means ``sys.argv``
+    :return: Parsed args
+    """
+    parser = argparse.ArgumentParser(description="Compare two rstcheck-core benchmark results.")
+    parser.add_argument("baseline", type=Path, help="Results of the baseline.")
+    parser.add_argument("candidate", type=Path, help="Results of the candidate.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative threshold for scenarios without a specific one; defaults to 0.1.",
+    )
+    parser.add_argument(
+        "--scenario-threshold",
+        dest="scenario_thresholds",
+        type=_parse_scenario_threshold,
+        action="append",
+        default=[],
+        help=(
+            "Threshold for scenarios matching the glob pattern like 'runner/*=0.05'; can be "
+            "given multiple times and takes precedence over the defaults."
+        ),
+    )
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Pass if scenarios of the baseline are missing from the candidate.",
+    )
+    return parser.parse_args(argv)
+
+
+def _main(argv: list[str] | None = None) -> int:
+    """Compare benchmarks main routine.
+
+    :param argv: Arguments to parse; defaults to :py:obj:`None` which means ``sys.argv``
+    :return: Exit code
+    """
+    args = _parser(argv)
+    scenario_thresholds = dict(args.scenario_thresholds)
+    for pattern, threshold in DEFAULT_SCENARIO_THRESHOLDS.items():
+        scenario_thresholds.setdefault(pattern, threshold)
+
+    comparisons = compare_results(
+        load_results(args.baseline),
+        load_results(args.candidate),
+        scenario_thresholds,
+        args.threshold,
+    )
+    print(format_table(comparisons))
+
+    failures = get_failures(comparisons, allow_missing=args.allow_missing)
+    if failures:
+        print(f"\n{len(failures)} of {len(comparisons)} scenarios regressed or are missing.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -0,0 +1,210 @@
+"""Generator for synthetic rst documents used by the benchmarks.
+
+The generated documents are valid rst with code blocks of the languages supported by
+``rstcheck-core``, include directives, inline config comments and nested rst code blocks. The
+share of each of these is configurable, so that a benchmark can focus on a single part of the
+checks. The same seed always generates the same corpus.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import typing as t
+from pathlib import Path
+
+CODE_BLOCKS = {
+    "python": "def add(a, b):\n    return a + b\n\nprint(add(1, 2))",
+    "doctest": ">>> 1 + 1\n2",
+    "json": '{\n    "name": "rstcheck",\n    "values": [1, 2, 3]\n}',
+    "yaml": "name: rstcheck\nvalues:\n  - 1\n  - 2",
+    "xml": '<root>\n    <item key="a">1</item>\n</root>',
+    "bash": 'for i in 1 2 3; do\n    echo "$i"\ndone',
+    "c": "int add(int a, int b)\n{\n    return a + b;\n}",
+    "cpp": "#include <vector>\n\nint size(const std::vector<int>& v)\n{\n    return v.size();\n}",
+}
+"""Valid code for each language with a code block checker."""
+
+DEFAULT_CODE_BLOCK_DENSITY = {"python": 0.1, "json": 0.05, "yaml": 0.02, "doctest": 0.03}
+"""Default probability per section to contain a code block of the language."""
+
+_WORDS = (
+    "rstcheck", "checks", "the", "syntax", "of", "restructured", "text", "documents", "and",
+    "code", "blocks", "nested", "within", "them", "docutils", "parses", "source", "while",
+    "sphinx", "adds", "directives", "roles",
+)  # fmt: skip
+
+INCLUDE_FRAGMENT_NAME = "_fragment.rst"
+"""Name of the file included by generated include directives."""
+
+
+class CorpusSettings(t.NamedTuple):
+    """Settings for the generated documents."""
+
+    lines: int = 1000
+    """Approximate number of lines per document."""
+    code_block_density: dict[str, float] = DEFAULT_CODE_BLOCK_DENSITY
+    """Probability per section to contain a code block of the language."""
+    include_density: float = 0.0
+    """Probability per section to contain an include directive."""
+    inline_config_density: float = 0.0
+    """Probability per section to contain an inline config comment."""
+    nested_rst_density: float = 0.0
+    """Probability per section to contain a nested rst code block."""
+    seed: int = 0
+    """Seed for the random generator."""
+
+
+def _paragraph(rng: random.Random) -> str:
+    """Create a paragraph of random words wrapped at 80 characters."""
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(20, 60))]
+    lines: list[str] = []
+    current: list[str] = []
+    for word in words:
+        if sum(len(w) + 1 for w in current) + len(word) > 80:  # noqa: PLR2004
+            lines.append(" ".join(current))
+            current = []
+        current.append(word)
+    lines.append(" ".join(current))
+    return "\n".join(lines).capitalize() + "."
+
+
+def _code_block(language: str, code: str) -> str:
+    """Create a code block directive."""
+    indented = "\n".join(f"    {line}" if line else "" for line in code.splitlines())
+    return f".. code-block:: {language}\n\n{indented}"
+
+
+def _section(rng: random.Random, number: int, settings: CorpusSettings) -> str:
+    """Create a section with a title, paragraphs and the randomly chosen extras."""
+    title = f"Section {number}"
+    parts = [f"{title}\n{'=' * len(title)}", _paragraph(rng)]
+
+    if rng.random() < settings.inline_config_density:
+        parts.append(".. rstcheck: ignore-languages=cpp")
+    if rng.random() < settings.include_density:
+        parts.append(f".. include:: {INCLUDE_FRAGMENT_NAME}")
+    for language, density in sorted(settings.code_block_density.items()):
+        if rng.random() < density:
+            parts.append(_code_block(language, CODE_BLOCKS[language]))
+    if rng.random() < settings.nested_rst_density:
+        nested = f"Nested\n======\n\n{_paragraph(rng)}\n\n{_code_block('python', 'x = 1')}"
+        parts.append(_code_block("rst", nested))
+
+    parts.append(_paragraph(rng))
+    return "\n\n".join(parts)
+
+
+def generate_document(settings: CorpusSettings, index: int = 0) -> str:
+    """Generate a single document.
+
+    :param settings: Settings for the document
+    :param index: Index of the document in the corpus; varies the content per document
+    :return: The rst source
+    """
+    rng = random.Random(f"{settings.seed}-{index}")  # noqa: S311
+    sections: list[str] = []
+    line_count = 0
+    while line_count < settings.lines:
+        section = _section(rng, len(sections) + 1, settings)
+        sections.append(section)
+        line_count += section.count("\n") + 2
+    return "\n\n".join(sections) + "\n"
+
+
+def generate_corpus(directory: Path, files: int, settings: CorpusSettings) -> list[Path]:
+    """Write a corpus of documents and the included fragment into a directory.
+
+    :param directory: Directory to write to; created if missing
+    :param files: Number of documents
+    :param settings: Settings for the documents
+    :return: Paths of the documents
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / INCLUDE_FRAGMENT_NAME).write_text(
+        "Included text with a ``literal``.\n", encoding="utf-8"
+    )
+    paths: list[Path] = []
+    for index in range(files):
+        path = directory / f"doc_{index:05d}.rst"
+        path.write_text(generate_document(settings, index), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def parse_density(value: str) -> dict[str, float]:
+    """Parse a code block density argument like ``python=0.1,bash=0.05``.
+
+    :param value: Argument value
+    :raises argparse.ArgumentTypeError: On unknown languages or invalid numbers
+    :return: Map of languages to densities
+    """
+    density: dict[str, float] = {}
+    for item in filter(None, value.split(",")):
+        language, _, number = item.partition("=")
+        if language not in CODE_BLOCKS:
+            msg = f"Unknown language: {language}"
+            raise argparse.ArgumentTypeError(msg)
+        try:
+            density[language] = float(number)
+        except ValueError as exc:
+            msg = f"Invalid density: {item}"
+            raise argparse.ArgumentTypeError(msg) from exc
+    return density
+
+
+def add_corpus_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments for :py:class:`CorpusSettings` to a parser.
+
+    :param parser: Parser to extend
+    """
+    parser.add_argument(
+        "--code-block-density",
+        type=parse_density,
+        default=DEFAULT_CODE_BLOCK_DENSITY,
+        help="Code block probability per section and language, e.g. 'python=0.1,bash=0.05'.",
+    )
+    parser.add_argument("--include-density", type=float, default=0.05)
+    parser.add_argument("--inline-config-density", type=float, default=0.05)
+    parser.add_argument("--nested-rst-density", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def settings_from_arguments(args: argparse.Namespace, lines: int) -> CorpusSettings:
+    """Create :py:class:`CorpusSettings` from parsed arguments.
+
+    :param args: Arguments parsed with a parser extended by :py:func:`add_corpus_arguments`
+    :param lines: Approximate number of lines per document
+    :return: Settings
+    """
+    return CorpusSettings(
+        lines=lines,
+        code_block_density=args.code_block_density,
+        include_density=args.include_density,
+        inline_config_density=args.inline_config_density,
+        nested_rst_density=args.nested_rst_density,
+        seed=args.seed,
+    )
+
+
+def _parser() -> argparse.Namespace:
+    """Create parser and return parsed args."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic rst corpus.")
+    parser.add_argument("directory", type=Path, help="Directory to write the corpus to.")
+    parser.add_argument("--files", type=int, default=10, help="Number of documents.")
+    parser.add_argument("--lines", type=int, default=1000, help="Lines per document.")
+    add_corpus_arguments(parser)
+    return parser.parse_args()
+
+
+def _main() -> int:
+    """Generate corpus main routine."""
+    args = _parser()
+    paths = generate_corpus(args.directory, args.files, settings_from_arguments(args, args.lines))
+    print(f"Generated {len(paths)} documents in '{args.directory}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -0,0 +1,252 @@
+"""Run timed benchmark scenarios over a synthetic corpus and write the results as JSON.
+
+Scenarios are named ``<target>/<size>/[<mode>/]<backend>``:
+
+``check_source/<lines>-lines/<backend>``
+    :py:func:`rstcheck_core.checker.check_source` on a single document.
+``check_file/<lines>-lines/<backend>``
+    :py:func:`rstcheck_core.checker.check_file` on a single document including config lookup.
+``runner/<files>-files/<sync|parallel>/<backend>``
+    :py:class:`rstcheck_core.runner.RstcheckMainRunner` over a directory of documents.
+``import/<module>``
+    Import of the module in a new interpreter, e.g. to track cold start times.
+
+``<backend>`` is ``sphinx`` if Sphinx is installed and ``docutils`` for plain docutils. The
+``docutils`` backend is also available with Sphinx installed, as the benchmark hides it for those
+scenarios.
+
+Each scenario is run ``--warmup`` times untimed and ``--repeat`` times timed. The raw timings are
+written, so that :py:mod:`compare_benchmarks` can aggregate them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime as dt
+import fnmatch
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import corpus
+
+from rstcheck_core import _extras, _sphinx, checker, config, runner
+
+FORMAT_VERSION = 1
+
+BACKENDS = ("docutils", "sphinx")
+
+IMPORT_MODULES = ("rstcheck_core.checker", "rstcheck_core.runner")
+
+
+class Scenario(t.NamedTuple):
+    """A benchmark scenario."""
+
+    name: str
+    params: dict[str, t.Any]
+    run: t.Callable[[], object]
+
+
+@contextlib.contextmanager
+def _backend(name: str) -> t.Generator[None, None, None]:
+    """Contextmanager to run checks with the given backend.
+
+    For ``docutils`` Sphinx is hidden from ``rstcheck_core``, even if it is installed.
+    """
+    sphinx_installed = _extras.SPHINX_INSTALLED
+    _extras.SPHINX_INSTALLED = sphinx_installed and name == "sphinx"
+    try:
+        yield
+    finally:
+        _extras.SPHINX_INSTALLED = sphinx_installed
+
+
+def _check_source_scenario(document: Path, lines: int, backend: str) -> Scenario:
+    """Create a ``check_source`` scenario for a document."""
+    source = document.read_text(encoding="utf-8")
+
+    def run() -> object:
+        with _sphinx.load_sphinx_if_available():
+            return list(checker.check_source(source, source_file=document))
+
+    return Scenario(f"check_source/{lines}-lines/{backend}", {"lines": lines}, run)
+
+
+def _check_file_scenario(document: Path, lines: int, backend: str) -> Scenario:
+    """Create a ``check_file`` scenario for a document."""
+
+    def run() -> object:
+        with _sphinx.load_sphinx_if_available():
+            return checker.check_file(document, config.RstcheckConfig())
+
+    return Scenario(f"check_file/{lines}-lines/{backend}", {"lines": lines}, run)
+
+
+def _runner_scenario(directory: Path, files: int, mode: str, backend: str) -> Scenario:
+    """Create a runner scenario over a corpus directory."""
+
+    def run() -> object:
+        main_runner = runner.RstcheckMainRunner([directory], config.RstcheckConfig(recursive=True))
+        if mode == "sync":
+            return main_runner._run_checks_sync()  # noqa: SLF001
+        return main_runner._run_checks_parallel()  # noqa: SLF001
+
+    return Scenario(f"runner/{files}-files/{mode}/{backend}", {"files": files, "mode": mode}, run)
+
+
+def _import_scenario(module: str) -> Scenario:
+    """Create a scenario importing a module in a new interpreter."""
+
+    def run() -> object:
+        return subprocess.run([sys.executable, "-c", f"import {module}"], check=True)  # noqa: S603
+
+    return Scenario(f"import/{module}", {"module": module}, run)
+
+
+def create_scenarios(
+    work_dir: Path, args: argparse.Namespace
+) -> t.Generator[tuple[str, Scenario], None, None]:
+    """Generate the corpora and yield the scenarios with their backend.
+
+    :param work_dir: Directory to write the corpora to
+    :param args: Parsed arguments
+    :yield: Backend and scenario
+    """
+    for module in IMPORT_MODULES:
+        yield args.backends[0], _import_scenario(module)
+
+    for lines in args.lines:
+        directory = work_dir / f"single-{lines}"
+        (document,) = corpus.generate_corpus(
+            directory, 1, corpus.settings_from_arguments(args, lines)
+        )
+        for backend in args.backends:
+            yield backend, _check_source_scenario(document, lines, backend)
+            yield backend, _check_file_scenario(document, lines, backend)
+
+    for files in args.files:
+        directory = work_dir / f"runner-{files}"
+        corpus.generate_corpus(
+            directory, files, corpus.settings_from_arguments(args, args.runner_lines)
+        )
+        for backend in args.backends:
+            for mode in ("sync", "parallel"):
+                yield backend, _runner_scenario(directory, files, mode, backend)
+
+
+def time_scenario(scenario: Scenario, repeat: int, warmup: int) -> list[float]:
+    """Run a scenario and time each timed run.
+
+    :param scenario: Scenario to run
+    :param repeat: Number of timed runs
+    :param warmup: Number of untimed runs before the timed ones
+    :return: Duration of each timed run in seconds
+    """
+    for _ in range(warmup):
+        scenario.run()
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scenario.run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _metadata() -> dict[str, t.Any]:
+    """Collect metadata of the environment."""
+    versions: dict[str, str | None] = {}
+    for package in ("rstcheck-core", "docutils", "sphinx"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "versions": versions,
+        "timestamp": dt.datetime.now(tz=dt.timezone.utc).isoformat(),  # noqa: UP017
+    }
+
+
+def _parse_sizes(value: str) -> list[int]:
+    """Parse a comma separated list of sizes."""
+    return [int(size) for size in value.split(",") if size]
+
+
+def _parser() -> argparse.Namespace:
+    """Create parser and return parsed args."""
+    parser = argparse.ArgumentParser(description="Run the rstcheck-core benchmarks.")
+    parser.add_argument("output", type=Path, help="JSON file to write the results to.")
+    parser.add_argument(
+        "--lines",
+        type=_parse_sizes,
+        default=[1000, 10000],
+        help="Comma separated document sizes for the single document scenarios.",
+    )
+    parser.add_argument(
+        "--files",
+        type=_parse_sizes,
+        default=[100, 1000],
+        help="Comma separated numbers of documents for the runner scenarios.",
+    )
+    parser.add_argument(
+        "--runner-lines", type=int, default=200, help="Lines per document for the runner."
+    )
+    parser.add_argument(
+        "--backend",
+        dest="backends",
+        action="append",
+        choices=BACKENDS,
+        help="Backend to benchmark; can be given multiple times; defaults to all available.",
+    )
+    parser.add_argument(
+        "--scenario",
+        dest="patterns",
+        action="append",
+        help="Only run scenarios matching the glob pattern; can be given multiple times.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per scenario.")
+    corpus.add_corpus_arguments(parser)
+    return parser.parse_args()
+
+
+def _main() -> int:
+    """Run benchmarks main routine."""
+    args = _parser()
+    if args.backends is None:
+        args.backends = [b for b in BACKENDS if b != "sphinx" or _extras.SPHINX_INSTALLED]
+    elif "sphinx" in args.backends and not _extras.SPHINX_INSTALLED:
+        print("Sphinx is not installed.")
+        return 1
+
+    results: dict[str, t.Any] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend, scenario in create_scenarios(Path(tmp_dir), args):
+            if args.patterns and not any(fnmatch.fnmatch(scenario.name, p) for p in args.patterns):
+                continue
+            with _backend(backend):
+                times = time_scenario(scenario, args.repeat, args.warmup)
+            results[scenario.name] = {"params": scenario.params, "times": times}
+            print(f"{scenario.name}: {min(times):.4f}s min of {len(times)}")
+
+    args.output.write_text(
+        json.dumps(
+            {"format_version": FORMAT_VERSION, "metadata": _metadata(), "scenarios": results},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -139,3 +139,24 @@ class TestRegisterCodeRirective:
         assert "code" not in docutils_directives._directives  # type: ignore[attr-defined]
         assert "code-block" not in docutils_directives._directives  # type: ignore[attr-defined]
         assert "sourcecode" in docutils_directives._directives  # type: ignore[attr-defined]
+
+
+class TestKeepDirectivesAndRolesWarm:
+    """Test ``keep_directives_and_roles_warm`` function."""
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_clean_restores_snapshot() -> None:
+        """Test cleaning inside the context restores the state from entering it."""
+        _docutils.ignore_directives_and_roles(["kept_directive"], ["kept_role"])
+
+        with _docutils.keep_directives_and_roles_warm():
+            _docutils.ignore_directives_and_roles(["dropped_directive"], ["dropped_role"])
+
+            _docutils.clean_docutils_directives_and_roles_cache()  # act
+
+            assert _docutils.registries_are_warm()
+            assert set(docutils_directives._directives) == {"kept_directive"}  # type: ignore[attr-defined]
+            assert set(docutils_roles._roles) == {"kept_role"}  # type: ignore[attr-defined]
+
+        assert not _docutils.registries_are_warm()
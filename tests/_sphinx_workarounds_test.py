@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import pathlib
 import re
+import typing as t
 
 import pytest
 
 from rstcheck_core import _extras, _sphinx_workarounds
 
+if t.TYPE_CHECKING:
+    import pytest_mock
+
 
 @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
 def test_yield_include_errors_no_errors(tmp_path: pathlib.Path) -> None:
@@ -218,3 +222,53 @@ def test_yield_include_errors_abs_path_with_passed_sphinx_source_dir(
     )
 
     assert not result
+
+
+def test_yield_include_errors_with_cached_lookups(
+    tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    """Test included files are looked up in one listing per directory inside the cache context."""
+    (tmp_path / "exists.rst").write_text("Hello\n")
+    source = ".. include:: exists.rst\n\n.. include:: missing.rst\n\n.. include:: exists.rst\n"
+    list_spy = mocker.spy(_sphinx_workarounds, "list_directory_files")
+
+    with _sphinx_workarounds.cache_include_lookups():
+        results = [
+            list(_sphinx_workarounds.yield_include_errors(source, tmp_path / f"{index}.rst"))
+            for index in range(2)
+        ]
+
+    assert list_spy.call_count == 1
+    for result in results:
+        (error,) = result
+        assert error["line_number"] == 3
+        assert "missing.rst" in error["message"]
+
+
+def test_include_lookup_cache_falls_back_to_stat(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test files missing from the listing, e.g. by case on macOS, are checked with ``stat``."""
+    (tmp_path / "Part.rst").write_text("Hello\n")
+    monkeypatch.setattr(
+        _sphinx_workarounds, "list_directory_files", lambda _: frozenset({"part.rst"})
+    )
+    cache = _sphinx_workarounds.IncludeLookupCache()
+
+    result = [cache.is_file(tmp_path / name) for name in ("Part.rst", "missing.rst")]
+
+    assert result == [True, False]
+
+
+def test_include_lookup_cache_caches_sphinx_source_dir(
+    tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    """Test the sphinx ``source`` directory is searched only once per directory."""
+    base_dir = tmp_path / "source" / "sub"
+    find_spy = mocker.spy(_sphinx_workarounds, "find_sphinx_source_dir")
+    cache = _sphinx_workarounds.IncludeLookupCache()
+
+    results = [cache.find_sphinx_source_dir(base_dir) for _ in range(2)]
+
+    assert results == [tmp_path / "source", tmp_path / "source"]
+    assert find_spy.call_count == 1
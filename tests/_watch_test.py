@@ -0,0 +1,129 @@
+"""Tests for ``_watch`` module."""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+import pytest
+
+from rstcheck_core import _watch
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+def _write_later(path: pathlib.Path, content: str) -> None:
+    """Write content and make sure the mtime differs from the previous one."""
+    old_mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, ns=(old_mtime_ns + 1_000_000_000, old_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("doc.rst", True), ("DOC.RST", True), (".hidden.rst", False), ("doc.txt", False)],
+)
+def test_is_checkable_rst_file_name(name: str, expected: bool) -> None:
+    """Test only visible rst files are checkable."""
+    result = _watch.is_checkable_rst_file_name(name)
+
+    assert result is expected
+
+
+def test_scan_rst_files(tmp_path: pathlib.Path) -> None:
+    """Test rst files are found recursively skipping hidden directories."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "a.rst").touch()
+    (tmp_path / "sub" / "b.rst").touch()
+    (tmp_path / ".hidden" / "c.rst").touch()
+    (tmp_path / "d.txt").touch()
+
+    result = _watch.scan_rst_files([tmp_path], recursive=True)
+
+    assert set(result) == {tmp_path / "a.rst", tmp_path / "sub" / "b.rst"}
+
+
+def test_scan_rst_files_not_recursive(tmp_path: pathlib.Path) -> None:
+    """Test directories are ignored when not recursive."""
+    (tmp_path / "a.rst").touch()
+
+    result = _watch.scan_rst_files([tmp_path, tmp_path / "a.rst"], recursive=False)
+
+    assert set(result) == {tmp_path / "a.rst"}
+
+
+class TestFileWatcher:
+    """Test ``FileWatcher`` class."""
+
+    @staticmethod
+    def test_no_changes(tmp_path: pathlib.Path) -> None:
+        """Test nothing is reported without changes."""
+        (tmp_path / "a.rst").write_text("Text\n")
+        watcher = _watch.FileWatcher([tmp_path], recursive=True)
+        watcher.start()
+
+        result = watcher.poll()
+
+        assert result == (set(), set())
+
+    @staticmethod
+    def test_touched_file_with_same_content_is_not_reported(tmp_path: pathlib.Path) -> None:
+        """Test a new mtime without a content change is not reported."""
+        doc = tmp_path / "a.rst"
+        doc.write_text("Text\n")
+        watcher = _watch.FileWatcher([tmp_path], recursive=True)
+        watcher.start()
+        _write_later(doc, "Text\n")
+
+        result = watcher.poll()
+
+        assert result == (set(), set())
+
+    @staticmethod
+    def test_changed_new_and_removed_files(tmp_path: pathlib.Path) -> None:
+        """Test changed, created and removed files are reported."""
+        changed = tmp_path / "changed.rst"
+        changed.write_text("Text\n")
+        removed = tmp_path / "removed.rst"
+        removed.write_text("Text\n")
+        watcher = _watch.FileWatcher([tmp_path], recursive=True)
+        watcher.start()
+        _write_later(changed, "Other text\n")
+        removed.unlink()
+        (tmp_path / "new.rst").write_text("Text\n")
+
+        result = watcher.poll()
+
+        assert result == ({changed, tmp_path / "new.rst"}, {removed})
+        assert watcher.files == [changed, tmp_path / "new.rst"]
+
+    @staticmethod
+    def test_changed_include_reports_includers(tmp_path: pathlib.Path) -> None:
+        """Test a changed included file reports only the files including it."""
+        fragment = tmp_path / "fragment.inc"
+        fragment.write_text("Fragment\n")
+        including = tmp_path / "including.rst"
+        including.write_text(".. include:: fragment.inc\n")
+        (tmp_path / "other.rst").write_text("Text\n")
+        watcher = _watch.FileWatcher([tmp_path], recursive=True)
+        watcher.start()
+        _write_later(fragment, "Changed fragment\n")
+
+        result = watcher.poll()
+
+        assert result == ({including}, set())
+
+    @staticmethod
+    def test_created_include_reports_includers(tmp_path: pathlib.Path) -> None:
+        """Test creating a missing included rst file reports the files including it."""
+        including = tmp_path / "including.rst"
+        including.write_text(".. include:: fragment.rst\n")
+        watcher = _watch.FileWatcher([tmp_path], recursive=True)
+        watcher.start()
+        (tmp_path / "fragment.rst").write_text("Fragment\n")
+
+        result = watcher.poll()
+
+        assert result == ({including, tmp_path / "fragment.rst"}, set())
@@ -0,0 +1,152 @@
+"""Tests for ``archive`` module."""
+
+from __future__ import annotations
+
+import io
+import pathlib
+import tarfile
+import typing as t
+import zipfile
+
+import pytest
+
+from rstcheck_core import archive, config
+
+
+def _write_zip(path: pathlib.Path, members: dict[str, str | bytes]) -> pathlib.Path:
+    with zipfile.ZipFile(path, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    return path
+
+
+def _write_tar(path: pathlib.Path, members: dict[str, str | bytes]) -> pathlib.Path:
+    with tarfile.open(path, "w:gz") as tar_file:
+        for name, content in members.items():
+            data = content.encode() if isinstance(content, str) else content
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(data)
+            tar_file.addfile(tar_info, io.BytesIO(data))
+    return path
+
+
+ARCHIVE_WRITERS = [
+    pytest.param(_write_zip, "docs.zip", id="zip"),
+    pytest.param(_write_tar, "docs.tar.gz", id="tar.gz"),
+]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("docs.zip", True), ("docs.TAR.GZ", True), ("docs.tgz", True), ("docs.rst", False)],
+)
+def test_is_archive(name: str, *, expected: bool) -> None:
+    """Test archives are detected by their suffix."""
+    result = archive.is_archive(pathlib.Path(name))
+
+    assert result is expected
+
+
+@pytest.mark.parametrize(("writer", "name"), ARCHIVE_WRITERS)
+def test_read_archive_index(tmp_path: pathlib.Path, writer: t.Any, name: str) -> None:  # noqa: ANN401
+    """Test all files are indexed and only config files are read."""
+    archive_path = writer(
+        tmp_path / name,
+        {"index.rst": "Text\n", "sub/setup.cfg": "[rstcheck]\n", "sub/other.txt": "x"},
+    )
+
+    result = archive.read_archive_index(archive_path)
+
+    assert result.files == {
+        pathlib.PurePosixPath("index.rst"),
+        pathlib.PurePosixPath("sub/setup.cfg"),
+        pathlib.PurePosixPath("sub/other.txt"),
+    }
+    assert result.config_files == {pathlib.PurePosixPath("sub/setup.cfg"): "[rstcheck]\n"}
+
+
+@pytest.mark.parametrize(("writer", "name"), ARCHIVE_WRITERS)
+def test_check_archive_reports_member_errors(
+    tmp_path: pathlib.Path,
+    writer: t.Any,  # noqa: ANN401
+    name: str,
+) -> None:
+    """Test issues are reported per rst member with the member as source origin."""
+    archive_path = writer(
+        tmp_path / name,
+        {
+            "good.rst": "Text\n",
+            "sub/bad.rst": "`broken\n",
+            ".hidden/bad.rst": "`broken\n",
+            "notes.txt": "`broken\n",
+        },
+    )
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+
+    result = dict(archive.check_archive(archive_path, init_config))
+
+    assert set(result) == {pathlib.PurePosixPath("good.rst"), pathlib.PurePosixPath("sub/bad.rst")}
+    assert not result[pathlib.PurePosixPath("good.rst")]
+    (error,) = result[pathlib.PurePosixPath("sub/bad.rst")]
+    assert error["source_origin"] == archive_path / "sub/bad.rst"
+    assert error["line_number"] == 1
+
+
+def test_check_archive_uses_config_files_in_archive(tmp_path: pathlib.Path) -> None:
+    """Test config files in the archive apply to the members below them."""
+    archive_path = _write_zip(
+        tmp_path / "docs.zip",
+        {
+            "quiet/.rstcheck.cfg": "[rstcheck]\nreport_level = severe\n",
+            "quiet/nested/bad.rst": "`broken\n",
+            "loud/bad.rst": "`broken\n",
+        },
+    )
+
+    result = dict(archive.check_archive(archive_path, config.RstcheckConfig()))
+
+    assert not result[pathlib.PurePosixPath("quiet/nested/bad.rst")]
+    assert len(result[pathlib.PurePosixPath("loud/bad.rst")]) == 1
+
+
+def test_check_archive_checks_includes_against_index(tmp_path: pathlib.Path) -> None:
+    """Test included files are looked up in the archive instead of the file system."""
+    archive_path = _write_zip(
+        tmp_path / "docs.zip",
+        {
+            "index.rst": ".. include:: part.inc\n\n.. include:: missing.inc\n",
+            "part.inc": "Text\n",
+        },
+    )
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+
+    result = dict(archive.check_archive(archive_path, init_config))
+
+    (error,) = result[pathlib.PurePosixPath("index.rst")]
+    assert error["line_number"] == 3
+    assert "missing.inc" in error["message"]
+
+
+def test_check_archive_normalizes_archive_path(tmp_path: pathlib.Path) -> None:
+    """Test includes from parent directories are found for archive paths with ``..`` parts."""
+    (tmp_path / "sub").mkdir()
+    _write_zip(
+        tmp_path / "docs.zip",
+        {"guide/index.rst": ".. include:: ../part.inc\n", "part.inc": "Text\n"},
+    )
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+
+    result = dict(archive.check_archive(tmp_path / "sub" / ".." / "docs.zip", init_config))
+
+    assert not result[pathlib.PurePosixPath("guide/index.rst")]
+
+
+def test_check_archive_reports_undecodable_members(tmp_path: pathlib.Path) -> None:
+    """Test members which are not UTF-8 are reported instead of failing the check."""
+    archive_path = _write_zip(tmp_path / "docs.zip", {"latin.rst": "Täxt\n".encode("latin-1")})
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+
+    result = dict(archive.check_archive(archive_path, init_config))
+
+    (error,) = result[pathlib.PurePosixPath("latin.rst")]
+    assert "UTF-8" in error["message"]
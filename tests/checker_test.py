@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import multiprocessing
 import os
 import pathlib
 import re
@@ -15,7 +18,7 @@ import docutils.nodes
 import docutils.utils
 import pytest
 
-from rstcheck_core import _extras, _sphinx, checker, config, types
+from rstcheck_core import _extras, _sphinx, checker, config, stats, types
 
 if t.TYPE_CHECKING:
     import pytest_mock
@@ -31,7 +34,7 @@ def test_check_file(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         checker,
         "check_source",
-        lambda _, source_file, ignores, report_level, sphinx_source_dir, warn_unknown_settings: (
+        lambda _, source_file, ignores, report_level, sphinx_source_dir, warn_unknown_settings, max_errors: (
             e for e in errors
         ),
     )
@@ -55,7 +58,7 @@ class TestRunConfigLoader:
 
         result = checker._load_run_config(pathlib.Path(), test_config)
 
-        assert result == test_config
+        assert result == config.RunConfig.from_config(test_config)
 
     @staticmethod
     def test_no_config_file_in_dir_tree(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -68,7 +71,7 @@ class TestRunConfigLoader:
 
         result = checker._load_run_config(pathlib.Path(), test_config)
 
-        assert result == test_config
+        assert result == config.RunConfig.from_config(test_config)
 
     @staticmethod
     def test_config_file_in_dir_tree(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -115,6 +118,75 @@ Test
 
         assert result == source
 
+    @staticmethod
+    @pytest.mark.parametrize("mmap_threshold", [0, checker.MMAP_THRESHOLD])
+    def test_bom_is_stripped_and_newlines_normalized(
+        mmap_threshold: int, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test UTF-8 files are read with and without memory-mapping like docutils reads them."""
+        monkeypatch.setattr(checker, "MMAP_THRESHOLD", mmap_threshold)
+        test_file = tmp_path / "testfile.rst"
+        test_file.write_bytes(b"\xef\xbb\xbfT\xc3\xa4st\r\n====\rText\n")
+
+        result = checker._get_source(test_file)
+
+        assert result == "Täst\n====\nText\n"
+
+    @staticmethod
+    @pytest.mark.parametrize("mmap_threshold", [0, checker.MMAP_THRESHOLD])
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"Text",
+            b"Text\r\nMore\rEnd\n\n",
+            "Text\x0ba\x0cb\x1cc\x1dd\x1ee\x85f\u2028g\u2029h\n".encode(),
+        ],
+    )
+    def test_same_source_as_docutils(
+        content: bytes,
+        mmap_threshold: int,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test UTF-8 files are read exactly like docutils reads them."""
+        monkeypatch.setattr(checker, "MMAP_THRESHOLD", mmap_threshold)
+        test_file = tmp_path / "testfile.rst"
+        test_file.write_bytes(content)
+        with contextlib.closing(docutils.io.FileInput(source_path=test_file)) as input_file:
+            expected = input_file.read()
+
+        result = checker._get_source(test_file)
+
+        assert result == expected
+
+    @staticmethod
+    def test_non_utf8_falls_back_to_docutils(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test files not decodable as UTF-8 are read with docutils."""
+        test_file = tmp_path / "testfile.rst"
+        test_file.write_bytes(b"T\xe4st\n")
+        file_input_mock = mocker.patch.object(docutils.io, "FileInput")
+        file_input_mock.return_value.read.return_value = "Täst\n"
+
+        result = checker._get_source(test_file)
+
+        assert result == "Täst\n"
+        file_input_mock.assert_called_once_with(source_path=test_file.resolve())
+
+    @staticmethod
+    def test_other_encoding_declaration_falls_back_to_docutils(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test files declaring another encoding are read with docutils."""
+        test_file = tmp_path / "testfile.rst"
+        test_file.write_bytes(b".. -*- coding: latin-1 -*-\n\nTest\n")
+        file_input_mock = mocker.patch.object(docutils.io, "FileInput")
+
+        checker._get_source(test_file)
+
+        file_input_mock.assert_called_once()
+
 
 def test__replace_ignored_substitutions() -> None:
     """Test ``_replace_ignored_substitutions`` function replaces substitutions."""
@@ -125,33 +197,22 @@ def test__replace_ignored_substitutions() -> None:
     assert result == "xSubstitution1x |Substitution2|"
 
 
-def test__create_ignore_dict_from_config() -> None:
-    """Test ``_create_ignore_dict_from_config`` function creates ignore dict."""
-    ignore_messages = r"foo/bar"
-    ignore_messages_re = re.compile(ignore_messages)
-    ignore_languages = ["python", "cpp"]
-    ignore_directives = ["code"]
-    ignore_roles = ["role"]
-    ignore_substitutions = ["substi"]
-    test_config = config.RstcheckConfig(
-        ignore_messages=ignore_messages,
-        ignore_languages=ignore_languages,
-        ignore_directives=ignore_directives,
-        ignore_roles=ignore_roles,
-        ignore_substitutions=ignore_substitutions,
-    )
+def test__replace_ignored_substitutions_replaces_all_in_one_pass() -> None:
+    """Test all ignored substitutions are replaced, including names with regex characters."""
+    source = "|a| |ab| |a.b| |axb| |a|"
 
-    result = checker._create_ignore_dict_from_config(
-        test_config,
-    )
+    result = checker._replace_ignored_substitutions(source, ["a", "ab", "a.b"])
 
-    assert result == types.construct_ignore_dict(
-        messages=ignore_messages_re,
-        languages=ignore_languages,
-        directives=ignore_directives,
-        roles=ignore_roles,
-        substitutions=ignore_substitutions,
-    )
+    assert result == "xax xabx xa.bx |axb| xax"
+
+
+def test__replace_ignored_substitutions_without_substitutions() -> None:
+    """Test the source is returned unchanged if no substitutions are ignored."""
+    source = "|Substitution1|"
+
+    result = checker._replace_ignored_substitutions(source, [])
+
+    assert result is source
 
 
 class TestSourceChecker:
@@ -221,6 +282,24 @@ Test
 
         assert not result
 
+    @staticmethod
+    def test_inline_config_does_not_change_passed_ignores() -> None:
+        """Test ignores from inline config comments are not added to the caller's ignores."""
+        source = """
+.. rstcheck: ignore-roles=foo
+.. rstcheck: ignore-languages=python
+
+.. code-block:: rst
+
+    :bar:`x`
+"""
+        ignores = types.construct_ignore_dict(roles=["bar"])
+
+        result = list(checker.check_source(source, ignores=ignores))
+
+        assert not result
+        assert ignores == types.construct_ignore_dict(roles=["bar"])
+
     @staticmethod
     @pytest.mark.skipif(_extras.SPHINX_INSTALLED, reason="Test without sphinx extra.")
     def test_include_directive_without_sphinx(
@@ -1404,3 +1483,362 @@ int main()
         result = checker._parse_gcc_style_error_message(message, "<string>", has_column=False)
 
         assert result == error
+
+
+class TestCheckFileOptions:
+    """Test keyword options of ``check_file`` function."""
+
+    @staticmethod
+    def test_no_config_search(mocker: pytest_mock.MockerFixture) -> None:
+        """Test the config is used as is when the config file search is disabled."""
+        mocked_loader = mocker.patch.object(checker, "_load_run_config")
+        test_config = config.RstcheckConfig(report_level=config.ReportLevel.SEVERE)
+
+        result = checker.check_file(
+            pathlib.Path("-"), test_config, search_file_config=False, source="Title\n=\n"
+        )
+
+        mocked_loader.assert_not_called()
+        assert not result
+
+    @staticmethod
+    def test_resolved_run_config_is_used_as_is(mocker: pytest_mock.MockerFixture) -> None:
+        """Test a resolved run config is used without searching for a config file."""
+        mocked_loader = mocker.patch.object(config, "load_config_file_from_dir_tree")
+        run_config = config.RunConfig(report_level=config.ReportLevel.SEVERE)
+
+        result = checker.check_file(pathlib.Path("-"), run_config, source="Title\n=\n")
+
+        mocked_loader.assert_not_called()
+        assert not result
+
+    @staticmethod
+    def test_given_source_is_checked_instead_of_file(tmp_path: pathlib.Path) -> None:
+        """Test a passed source is checked instead of the file content."""
+        test_file = tmp_path / "doc.rst"
+        test_file.write_text("Title\n=====\n")
+        test_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+
+        result = checker.check_file(test_file, test_config, source="Title\n=====\n\n`broken\n")
+
+        assert len(result) == 1
+        assert result[0]["source_origin"] == test_file
+        assert result[0]["line_number"] == 4
+
+
+class TestCodeBlockResultCache:
+    """Test ``CodeBlockResultCache`` class and ``cache_code_block_results`` function."""
+
+    @staticmethod
+    def test_lru_eviction() -> None:
+        """Test the least recently used entry is evicted."""
+        cache = checker.CodeBlockResultCache(max_size=2)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+
+        cache.put("c", [])  # act
+
+        assert cache.get("a") == []
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    @staticmethod
+    def test_identical_code_blocks_are_checked_once(mocker: pytest_mock.MockerFixture) -> None:
+        """Test identical code blocks reuse the cached result with their own source origin."""
+        spy = mocker.spy(checker.CodeBlockChecker, "check_python")
+        source_code = "print(\n"
+
+        with checker.cache_code_block_results() as cache:
+            result_1 = list(checker.CodeBlockChecker("<string>").check(source_code, "python"))
+            result_2 = list(
+                checker.CodeBlockChecker(pathlib.Path("doc.rst")).check(source_code, "python")
+            )
+
+        assert spy.call_count == 1
+        assert len(cache) == 1
+        assert result_1[0]["source_origin"] == "<string>"
+        assert result_2[0]["source_origin"] == pathlib.Path("doc.rst")
+        assert result_1[0]["message"] == result_2[0]["message"]
+
+    @staticmethod
+    def test_rst_is_not_cached(mocker: pytest_mock.MockerFixture) -> None:
+        """Test nested rst code blocks are always checked."""
+        spy = mocker.spy(checker.CodeBlockChecker, "check_rst")
+
+        with checker.cache_code_block_results() as cache:
+            list(checker.CodeBlockChecker("<string>").check("Text\n", "rst"))
+            list(checker.CodeBlockChecker("<string>").check("Text\n", "rst"))
+
+        assert spy.call_count == 2
+        assert not len(cache)
+
+
+class TestAsyncCheckers:
+    """Test ``check_source_async`` and ``check_file_async`` functions."""
+
+    SOURCE = """Title
+=====
+
+.. code-block:: bash
+
+    if [ 1 ]; then
+
+.. code-block:: python
+
+    print(
+
+.. code-block:: bash
+
+    echo ok
+
+`broken
+"""
+
+    def test_check_source_async_matches_check_source(self) -> None:
+        """Test the async variant finds the same issues in the same order."""
+        expected = list(checker.check_source(self.SOURCE))
+
+        result = asyncio.run(checker.check_source_async(self.SOURCE))
+
+        assert result == expected
+        assert [e["message"].split(" ", 1)[0] for e in result[:2]] == ["(bash)", "(python)"]
+
+    def test_check_source_async_ignores_messages(self) -> None:
+        """Test issues of subprocess checks are filtered by the ignored messages."""
+        ignores = types.construct_ignore_dict(messages=re.compile(r"syntax error|unexpected"))
+
+        result = asyncio.run(checker.check_source_async(self.SOURCE, ignores=ignores))
+
+        assert not [e for e in result if e["message"].startswith("(bash)")]
+
+    @staticmethod
+    def test_check_source_async_with_own_semaphore(mocker: pytest_mock.MockerFixture) -> None:
+        """Test subprocesses are started via asyncio under the given semaphore."""
+        spy = mocker.spy(checker.asyncio, "create_subprocess_exec")
+        source = ".. code-block:: bash\n\n    echo 1\n\n.. code-block:: bash\n\n    echo 2\n"
+
+        async def check() -> list[types.LintError]:
+            semaphore = asyncio.Semaphore(1)
+            return await checker.check_source_async(source, subprocess_semaphore=semaphore)
+
+        result = asyncio.run(check())
+
+        assert not result
+        assert spy.call_count == 2
+
+    @staticmethod
+    @pytest.mark.parametrize("language", ["bash", "c", "cpp"])
+    def test_check_async_runs_same_command_as_check(
+        mocker: pytest_mock.MockerFixture, language: str
+    ) -> None:
+        """Test the sync and async code block checks run the same subprocess command."""
+        run_mock = mocker.patch.object(checker.CodeBlockChecker, "_run_in_subprocess")
+        run_mock.return_value = None
+        run_async_mock = mocker.patch.object(checker.CodeBlockChecker, "_run_in_subprocess_async")
+        run_async_mock.return_value = None
+        cb_checker = checker.CodeBlockChecker("<string>")
+
+        list(cb_checker.check("code", language))
+        asyncio.run(cb_checker.check_async("code", language))
+
+        (sync_call,) = run_mock.call_args_list
+        (async_call,) = run_async_mock.call_args_list
+        assert async_call.args[:3] == sync_call.args
+
+    def test_check_file_async_matches_check_file(self, tmp_path: pathlib.Path) -> None:
+        """Test the async file variant finds the same issues as ``check_file``."""
+        test_file = tmp_path / "doc.rst"
+        test_file.write_text(self.SOURCE)
+        test_config = config.RstcheckConfig()
+        expected = checker.check_file(test_file, test_config)
+
+        result = asyncio.run(checker.check_file_async(test_file, test_config))
+
+        assert result == expected
+        assert result[0]["source_origin"] == test_file
+
+
+def test_check_file_records_phases(tmp_path: pathlib.Path) -> None:
+    """Test ``check_file`` records its phases when stats are collected."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text(
+        ".. code-block:: python\n\n    print(1)\n\n.. code-block:: json\n\n    {}\n\n`broken\n"
+    )
+
+    with stats.collect_stats() as check_stats:
+        checker.check_file(test_file, config.RstcheckConfig())
+
+    assert {
+        "config",
+        "read",
+        "registry_reset",
+        "docutils_parse",
+        "code_block:python",
+        "code_block:json",
+        "error_parsing",
+    } <= set(check_stats.timings)
+
+
+def test_check_file_counts_code_blocks(tmp_path: pathlib.Path) -> None:
+    """Test ``check_file`` counts seen and skipped code blocks and spawned subprocesses."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text(
+        ".. code-block:: python\n\n    print(1)\n\n"
+        ".. rstcheck: ignore-next-code-block\n.. code-block:: python\n\n    print(\n\n"
+        ".. code-block:: json\n\n    {}\n\n"
+        ".. code-block:: unknown\n\n    foo\n\n"
+        ".. code-block:: bash\n\n    echo 1\n\n"
+        ">>> 1 + 1\n2\n"
+    )
+
+    with stats.collect_stats() as check_stats:
+        checker.check_file(test_file, config.RstcheckConfig(ignore_languages=["json"]))
+
+    assert check_stats.counters == {
+        "code_block.seen:python": 2,
+        "code_block.seen:json": 1,
+        "code_block.seen:unknown": 1,
+        "code_block.seen:bash": 1,
+        "code_block.seen:doctest": 1,
+        "code_block.skipped.ignore_comment:python": 1,
+        "code_block.skipped.ignored_language:json": 1,
+        "code_block.skipped.unsupported:unknown": 1,
+        "subprocess.spawned:bash": 1,
+        "temp_file.created:bash": 1,
+    }
+    assert check_stats.timings["subprocess:bash"]["count"] == 1
+
+
+def test_check_source_stops_code_block_checks_at_max_errors(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test ``check_source`` runs no further code block checkers once the limit is reached."""
+    spy = mocker.spy(checker.CodeBlockChecker, "check_python")
+    source = ".. code-block:: python\n\n    print(\n\n" * 3
+
+    result = list(checker.check_source(source, max_errors=1))
+
+    assert len(result) == 1
+    assert spy.call_count == 1
+
+
+def test_check_source_skips_code_blocks_if_rst_errors_reach_max_errors(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test ``check_source`` runs no code block checkers if the rst issues reach the limit."""
+    spy = mocker.spy(checker.CodeBlockChecker, "check_python")
+    source = "`broken\n\n.. code-block:: python\n\n    print(\n"
+
+    result = list(checker.check_source(source, max_errors=1))
+
+    (error,) = result
+    assert "Inline interpreted text" in error["message"]
+    spy.assert_not_called()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_subprocess_timeout_is_reported_as_issue(
+    monkeypatch: pytest.MonkeyPatch, *, use_async: bool
+) -> None:
+    """Test code block subprocesses exceeding the timeout are killed and reported."""
+    monkeypatch.setattr(
+        checker, "_get_c_arguments", lambda: [sys.executable, "-c", "import time; time.sleep(5)"]
+    )
+    source = "Title\n=====\n\n.. code-block:: c\n\n    int main() {}\n"
+
+    async def check_async() -> list[types.LintError]:
+        with checker.subprocess_timeout(0.1):
+            return await checker.check_source_async(source)
+
+    with checker.subprocess_timeout(0.1), checker.cache_code_block_results() as cache:
+        result = asyncio.run(check_async()) if use_async else list(checker.check_source(source))
+
+    assert result == [
+        types.LintError(
+            source_origin="<string>",
+            line_number=6,
+            message="(c) Check timed out after 0.1 seconds.",
+        )
+    ]
+    assert len(cache) == 0
+
+
+def test_subprocess_timeout_must_be_positive() -> None:
+    """Test a timeout of zero seconds is rejected."""
+    with pytest.raises(ValueError, match="must be positive"), checker.subprocess_timeout(0):
+        pass
+
+
+class TestCheckSources:
+    """Test ``check_sources`` function."""
+
+    SOURCES: t.ClassVar[dict[str, str]] = {
+        "ignoring.rst": ".. rstcheck: ignore-languages=python\n\n"
+        ".. code-block:: python\n\n    print(\n",
+        "broken.rst": ".. code-block:: python\n\n    print(\n\n`broken\n",
+        "good.rst": "Title\n=====\n\nText\n",
+    }
+
+    def test_results_per_source_match_check_source(self) -> None:
+        """Test the issues are yielded per source in order and inline ignores do not leak."""
+        expected = [
+            (name, list(checker.check_source(source, source_file=pathlib.Path(name))))
+            for name, source in self.SOURCES.items()
+        ]
+
+        result = list(checker.check_sources(self.SOURCES, config.RstcheckConfig()))
+
+        assert result == expected
+        assert [len(errors) for _, errors in result] == [0, 2, 0]
+        assert result[1][1][0]["source_origin"] == pathlib.Path("broken.rst")
+
+    def test_pool(self) -> None:
+        """Test the sources are checked in chunks in a pool."""
+        expected = list(checker.check_sources(self.SOURCES, config.RstcheckConfig()))
+
+        with multiprocessing.Pool(2) as pool:
+            result = list(
+                checker.check_sources(
+                    self.SOURCES, config.RstcheckConfig(), pool=pool, chunk_size=2
+                )
+            )
+
+        assert result == expected
+
+    def test_pool_consumes_iterable_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test only a few chunks of an iterable are read ahead of the results."""
+        monkeypatch.setattr(checker.os, "cpu_count", lambda: 1)
+        consumed = []
+
+        def _sources() -> t.Generator[tuple[str, str], None, None]:
+            for name, source in self.SOURCES.items():
+                consumed.append(name)
+                yield (name, source)
+
+        expected = list(checker.check_sources(self.SOURCES, config.RstcheckConfig()))
+
+        with multiprocessing.Pool(1) as pool:
+            results = checker.check_sources(
+                _sources(), config.RstcheckConfig(), pool=pool, chunk_size=1
+            )
+            first_result = next(results)
+            consumed_before_first_result = len(consumed)
+            result = [first_result, *results]
+
+        assert result == expected
+        assert consumed_before_first_result == 2
+
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    def test_file_exists_applies_to_nested_rst() -> None:
+        """Test the passed include lookup is used for rst code blocks, too."""
+        sources = {"doc.rst": ".. code-block:: rst\n\n    .. include:: part.inc\n"}
+
+        result = list(
+            checker.check_sources(
+                sources, config.RstcheckConfig(), file_exists=lambda path: path.name == "part.inc"
+            )
+        )
+
+        assert result == [("doc.rst", [])]
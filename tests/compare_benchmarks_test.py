@@ -0,0 +1,125 @@
+"""Tests for the ``compare_benchmarks`` script in ``testing/benchmarks``."""
+
+from __future__ import annotations
+
+import json
+import sys
+import typing as t
+
+import pytest
+
+from tests.conftest import TESTING_DIR
+
+sys.path.insert(0, str(TESTING_DIR / "benchmarks"))
+import compare_benchmarks
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+class TestSummarize:
+    """Test ``summarize`` function."""
+
+    @staticmethod
+    def test_quartiles() -> None:
+        """Test median and quartiles of the timings."""
+        result = compare_benchmarks.summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+
+        assert result == compare_benchmarks.Summary(median=3.0, q1=2.0, q3=4.0, runs=5)
+        assert result.iqr == 2.0
+
+    @staticmethod
+    def test_single_run() -> None:
+        """Test a single timing has no spread."""
+        result = compare_benchmarks.summarize([1.5])
+
+        assert result == compare_benchmarks.Summary(median=1.5, q1=1.5, q3=1.5, runs=1)
+
+    @staticmethod
+    def test_no_timings() -> None:
+        """Test empty timings are rejected."""
+        with pytest.raises(ValueError, match="No timings"):
+            compare_benchmarks.summarize([])
+
+
+@pytest.mark.parametrize(
+    ("scenario", "expected"),
+    [
+        ("runner/1000-files/parallel/docutils", 0.05),
+        ("runner/10-files/sync/docutils", 0.2),
+        ("check_source/100-lines/docutils", 0.1),
+    ],
+)
+def test_get_threshold(scenario: str, expected: float) -> None:
+    """Test the first matching pattern wins over the default threshold."""
+    scenario_thresholds = {"runner/1000-files/*": 0.05, "runner/*": 0.2}
+
+    result = compare_benchmarks.get_threshold(scenario, scenario_thresholds, 0.1)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("candidate", "expected"),
+    [
+        (compare_benchmarks.Summary(1.2, 1.15, 1.25, 5), compare_benchmarks.STATUS_REGRESSION),
+        (compare_benchmarks.Summary(1.2, 1.0, 1.3, 5), compare_benchmarks.STATUS_OK),
+        (compare_benchmarks.Summary(1.05, 1.04, 1.06, 5), compare_benchmarks.STATUS_OK),
+        (compare_benchmarks.Summary(0.8, 0.75, 0.85, 5), compare_benchmarks.STATUS_IMPROVEMENT),
+    ],
+)
+def test_compare_summaries(candidate: compare_benchmarks.Summary, expected: str) -> None:
+    """Test only changes beyond the threshold and the spread of the runs are flagged."""
+    baseline = compare_benchmarks.Summary(1.0, 0.95, 1.02, 5)
+
+    result = compare_benchmarks.compare_summaries(baseline, candidate, 0.1)
+
+    assert result == expected
+
+
+def _write_results(path: pathlib.Path, scenarios: dict[str, list[float]]) -> pathlib.Path:
+    """Write a result set like ``run_benchmarks`` does."""
+    results = {
+        "format_version": compare_benchmarks.run_benchmarks.FORMAT_VERSION,
+        "metadata": {},
+        "scenarios": {name: {"params": {}, "times": times} for name, times in scenarios.items()},
+    }
+    path.write_text(json.dumps(results), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    ("candidate_scenarios", "extra_args", "expected"),
+    [
+        ({"a": [1.0, 1.0, 1.0], "b": [1.0, 1.0, 1.0]}, [], 0),
+        ({"a": [1.0, 1.0, 1.0], "b": [2.0, 2.0, 2.0]}, [], 1),
+        ({"a": [1.0, 1.0, 1.0], "b": [2.0, 2.0, 2.0]}, ["--scenario-threshold", "b=1.5"], 0),
+        ({"a": [1.0, 1.0, 1.0]}, [], 1),
+        ({"a": [1.0, 1.0, 1.0]}, ["--allow-missing"], 0),
+        ({"a": [1.0, 1.0, 1.0], "b": [1.0, 1.0, 1.0], "c": [9.0]}, [], 0),
+    ],
+)
+def test_main_exit_code(
+    tmp_path: pathlib.Path,
+    candidate_scenarios: dict[str, list[float]],
+    extra_args: list[str],
+    expected: int,
+) -> None:
+    """Test the gate fails on regressed and missing scenarios."""
+    baseline = _write_results(
+        tmp_path / "baseline.json", {"a": [1.0, 1.0, 1.0], "b": [1.0, 1.0, 1.0]}
+    )
+    candidate = _write_results(tmp_path / "candidate.json", candidate_scenarios)
+
+    result = compare_benchmarks._main([str(baseline), str(candidate), *extra_args])
+
+    assert result == expected
+
+
+def test_load_results_rejects_other_format_versions(tmp_path: pathlib.Path) -> None:
+    """Test result sets of another format version are rejected."""
+    results_file = tmp_path / "results.json"
+    results_file.write_text(json.dumps({"format_version": -1}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported format version"):
+        compare_benchmarks.load_results(results_file)
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import logging
+import os
 import pathlib
 import re
+import subprocess
+import sys
 import typing as t
 
 import pytest
 
-from rstcheck_core import _extras, config
+from rstcheck_core import _extras, config, types
+
+if t.TYPE_CHECKING:
+    import pytest_mock
 
 
 def test_report_level_map_matches_numbers() -> None:
@@ -979,6 +985,41 @@ class TestConfigFileLoader:
         assert result.report_level == config.ReportLevel.ERROR
 
 
+class TestConfigFileContentLoader:
+    """Test ``load_config_file_content``."""
+
+    @staticmethod
+    def test_ini_content() -> None:
+        """Test INI content is parsed without a file on disk."""
+        file_content = "[rstcheck]\nreport_level = 3\nignore_languages = cpp\n"
+
+        result = config.load_config_file_content(file_content, pathlib.Path("docs.zip/setup.cfg"))
+
+        assert result is not None
+        assert result.report_level == config.ReportLevel.ERROR
+        assert result.ignore_languages == ["cpp"]
+
+    @staticmethod
+    @pytest.mark.skipif(not _extras.TOMLI_INSTALLED, reason="Depends on toml extra.")
+    def test_toml_content() -> None:
+        """Test TOML content is parsed without a file on disk."""
+        file_content = "[tool.rstcheck]\nreport_level = 3\n"
+
+        result = config.load_config_file_content(
+            file_content, pathlib.Path("docs.zip/pyproject.toml")
+        )
+
+        assert result is not None
+        assert result.report_level == config.ReportLevel.ERROR
+
+    @staticmethod
+    def test_missing_section_returns_none() -> None:
+        """Test content without rstcheck section results in no config."""
+        result = config.load_config_file_content("[other]\nkey = 1\n", pathlib.Path("setup.cfg"))
+
+        assert result is None
+
+
 class TestConfigDirLoader:
     """Test ``load_config_file_from_dir``."""
 
@@ -1378,3 +1419,206 @@ class TestConfigMerger:
         result = config.merge_configs(config_base, config_add, config_add_is_dominant=False)
 
         assert result.report_level == config.ReportLevel.ERROR
+
+
+class TestRunConfig:
+    """Test ``RunConfig`` class."""
+
+    @staticmethod
+    def test_from_config() -> None:
+        """Test the settings are converted to the frozen snapshot."""
+        test_config = config.RstcheckConfig(
+            ignore_messages=r"foo/bar",
+            ignore_languages=["python", "cpp"],
+            ignore_directives=["code"],
+            ignore_roles=["role"],
+            ignore_substitutions=["substi"],
+            warn_unknown_settings=True,
+        )
+
+        result = config.RunConfig.from_config(test_config)
+
+        assert result == config.RunConfig(
+            report_level=config.DEFAULT_REPORT_LEVEL,
+            ignores=types.Ignores(
+                messages=re.compile(r"foo/bar"),
+                languages=frozenset({"python", "cpp"}),
+                directives=frozenset({"code"}),
+                roles=frozenset({"role"}),
+                substitutions=frozenset({"substi"}),
+            ),
+            warn_unknown_settings=True,
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("config_add_is_dominant", "expected_report_level", "expected_roles"),
+        [
+            (True, config.ReportLevel.SEVERE, {"file_role"}),
+            (False, config.ReportLevel.ERROR, {"base_role"}),
+        ],
+    )
+    def test_from_config_merges_like_merge_configs(
+        *,
+        config_add_is_dominant: bool,
+        expected_report_level: config.ReportLevel,
+        expected_roles: set[str],
+    ) -> None:
+        """Test the file config is merged with the same result as ``merge_configs``."""
+        base_config = config.RstcheckConfig(
+            report_level=config.ReportLevel.ERROR,
+            ignore_roles=["base_role"],
+            ignore_languages=["cpp"],
+        )
+        file_config = config.RstcheckConfigFile(
+            report_level=config.ReportLevel.SEVERE, ignore_roles=["file_role"]
+        )
+
+        result = config.RunConfig.from_config(
+            base_config, file_config, config_add_is_dominant=config_add_is_dominant
+        )
+
+        assert result.report_level == expected_report_level
+        assert result.ignores.roles == expected_roles
+        assert result.ignores.languages == {"cpp"}
+        assert result == config.RunConfig.from_config(
+            config.merge_configs(
+                base_config, file_config, config_add_is_dominant=config_add_is_dominant
+            )
+        )
+
+    @staticmethod
+    def test_is_hashable() -> None:
+        """Test equal snapshots can be used as the same cache key."""
+        snapshots = {
+            config.RunConfig.from_config(config.RstcheckConfig(ignore_messages=r"foo|bar"))
+            for _ in range(2)
+        }
+
+        assert len(snapshots) == 1
+
+
+def test_check_source_does_not_import_pydantic() -> None:
+    """Test checking a source with explicit ignores and report level never imports pydantic."""
+    code = """
+import sys
+
+from rstcheck_core import checker, config, runner, types
+
+checker.check_source(
+    "Title\\n=====\\n",
+    ignores=types.construct_ignore_dict(),
+    report_level=config.ReportLevel.INFO,
+)
+assert "pydantic" not in sys.modules, "pydantic was imported"
+"""
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_config_models_are_loaded_on_access() -> None:
+    """Test the lazily loaded models are part of the config module."""
+    result = config.RstcheckConfig
+
+    assert result.__module__ == "rstcheck_core.config"
+    assert "RstcheckConfig" in dir(config)
+    with pytest.raises(AttributeError, match="no attribute 'NoConfig'"):
+        config.NoConfig  # noqa: B018
+
+
+class TestRunConfigCache:
+    """Test ``RunConfigCache`` class."""
+
+    @staticmethod
+    def test_searched_directories_are_remembered(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test each directory of the tree is searched only once."""
+        (tmp_path / ".rstcheck.cfg").write_text("[rstcheck]\nignore_roles=foo\n")
+        nested_dir = tmp_path / "a" / "b"
+        nested_dir.mkdir(parents=True)
+        (tmp_path / "c").mkdir()
+        load_spy = mocker.spy(config, "load_config_file_from_dir")
+        cache = config.RunConfigCache(config.RstcheckConfig())
+
+        nested_result = cache.get(nested_dir)
+        searched_count = load_spy.call_count
+        parent_result = cache.get(nested_dir.parent)
+        sibling_result = cache.get(tmp_path / "c")
+
+        assert nested_result.ignore_roles == ["foo"]
+        assert parent_result is nested_result
+        assert sibling_result is nested_result
+        assert searched_count == 3
+        assert load_spy.call_count == searched_count + 1
+
+    @staticmethod
+    def test_clear_searches_again(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test config files are searched again after clearing the cache."""
+        (tmp_path / ".rstcheck.cfg").write_text("[rstcheck]\nignore_roles=foo\n")
+        load_spy = mocker.spy(config, "load_config_file_from_dir")
+        cache = config.RunConfigCache(config.RstcheckConfig())
+        cache.get(tmp_path)
+
+        cache.clear()
+        result = cache.get(tmp_path)
+
+        assert result.ignore_roles == ["foo"]
+        assert load_spy.call_count == 2
+
+
+class TestConfigFileCache:
+    """Test the cache of parsed config files."""
+
+    @staticmethod
+    def test_unchanged_file_is_parsed_once(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test loading an unchanged file again returns an equal copy without parsing."""
+        conf_file = tmp_path / "config.cfg"
+        conf_file.write_text("[rstcheck]\nreport_level = error\n")
+        parse_spy = mocker.spy(config, "_parse_config_from_ini_parser")
+
+        results = [config._load_config_from_ini_file(conf_file) for _ in range(2)]
+
+        assert parse_spy.call_count == 1
+        assert results[0] is not None
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert results[0].report_level == config.ReportLevel.ERROR
+
+    @staticmethod
+    def test_changed_file_is_parsed_again(tmp_path: pathlib.Path) -> None:
+        """Test a changed ``mtime_ns`` or size invalidates the cached config."""
+        conf_file = tmp_path / "config.cfg"
+        conf_file.write_text("[rstcheck]\nreport_level = error\n")
+        config._load_config_from_ini_file(conf_file)
+        conf_file.write_text("[rstcheck]\nreport_level = severe\n")
+        stat_result = conf_file.stat()
+        os.utime(conf_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+        result = config._load_config_from_ini_file(conf_file)
+
+        assert result is not None
+        assert result.report_level == config.ReportLevel.SEVERE
+
+    @staticmethod
+    def test_clear_config_file_cache(
+        tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test the file is parsed again after the cache is cleared."""
+        conf_file = tmp_path / "config.cfg"
+        conf_file.write_text("[rstcheck]\nreport_level = error\n")
+        parse_spy = mocker.spy(config, "_parse_config_from_ini_parser")
+        config._load_config_from_ini_file(conf_file)
+
+        config.clear_config_file_cache()
+        config._load_config_from_ini_file(conf_file)
+
+        assert parse_spy.call_count == 2
@@ -0,0 +1,72 @@
+"""Tests for ``framing`` module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from rstcheck_core import framing
+
+
+class _ChunkedStream(io.RawIOBase):
+    """Stream returning at most one chunk per read and recording the reads."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.reads = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read1(self, _size: int = -1) -> bytes:
+        self.reads += 1
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+@pytest.mark.parametrize("framing_kind", framing.FRAMINGS)
+def test_roundtrip(framing_kind: framing.Framing) -> None:
+    """Test framed documents are read back in order."""
+    stream = io.BytesIO(
+        framing.frame_document("Title\r\n=====\n", framing_kind, "a.rst")
+        + framing.frame_document("Täxt\n", framing_kind)
+    )
+
+    result = list(framing.read_documents(stream, framing_kind))
+
+    first_name = "a.rst" if framing_kind == "length" else "<stdin:1>"
+    assert result == [(first_name, "Title\n=====\n"), ("<stdin:2>", "Täxt\n")]
+
+
+def test_nul_separated_documents_are_yielded_incrementally() -> None:
+    """Test a document is yielded before the rest of the stream is read."""
+    stream = _ChunkedStream([b"first\n\0sec", b"ond\n\0", b"third\n"])
+    documents = framing.read_documents(stream, "nul")  # type: ignore[arg-type]
+
+    first = next(documents)
+
+    assert first == ("<stdin:1>", "first\n")
+    assert stream.reads == 1
+    assert list(documents) == [("<stdin:2>", "second\n"), ("<stdin:3>", "third\n")]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [(b"abc name\nText", "Invalid frame header"), (b"10 name\nText", "Stream ended")],
+)
+def test_malformed_length_prefixed_stream(data: bytes, message: str) -> None:
+    """Test malformed frames raise errors."""
+    with pytest.raises(ValueError, match=message):
+        list(framing.read_documents(io.BytesIO(data), "length"))
+
+
+def test_nul_in_nul_separated_document() -> None:
+    """Test documents with NUL characters cannot be framed NUL separated."""
+    with pytest.raises(ValueError, match="NUL characters"):
+        framing.frame_document("a\0b", "nul")
+
+
+def test_unknown_framing() -> None:
+    """Test unknown framings raise errors."""
+    with pytest.raises(ValueError, match="Unknown framing"):
+        framing.read_documents(io.BytesIO(), "json")  # type: ignore[arg-type]
@@ -0,0 +1,203 @@
+"""Tests for ``include_graph`` module."""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+from rstcheck_core import _sphinx_workarounds, include_graph
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+
+def _touch_later(path: pathlib.Path, content: str) -> None:
+    """Write content and make sure the mtime differs from the previous one."""
+    old_mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, ns=(old_mtime_ns + 1_000_000_000, old_mtime_ns + 1_000_000_000))
+
+
+def test_normalize_path_collapses_parent_parts(tmp_path: pathlib.Path) -> None:
+    """Test ``..`` parts are collapsed."""
+    result = include_graph.normalize_path(tmp_path / "a" / ".." / "b.rst")
+
+    assert result == tmp_path / "b.rst"
+
+
+def test_existing_files(tmp_path: pathlib.Path) -> None:
+    """Test existing files are found and missing ones or directories are not."""
+    (tmp_path / "exists.rst").touch()
+    (tmp_path / "dir").mkdir()
+
+    result = include_graph.existing_files(
+        [tmp_path / "exists.rst", tmp_path / "missing.rst", tmp_path / "dir", tmp_path / "no" / "x"]
+    )
+
+    assert result == {tmp_path / "exists.rst"}
+
+
+def test_existing_files_falls_back_to_stat(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test files missing from the listing, e.g. by case, are checked with ``stat``."""
+    (tmp_path / "Part.rst").touch()
+    # NOTE: Emulate a case-insensitive file system listing the name in a different case.
+    monkeypatch.setattr(
+        _sphinx_workarounds, "list_directory_files", lambda _: frozenset({"part.rst"})
+    )
+
+    result = include_graph.existing_files([tmp_path / "Part.rst", tmp_path / "missing.rst"])
+
+    assert result == {tmp_path / "Part.rst"}
+
+
+class TestIncludeGraph:
+    """Test ``IncludeGraph`` class."""
+
+    @staticmethod
+    def test_edges(tmp_path: pathlib.Path) -> None:
+        """Test include edges are recorded with resolved paths."""
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "frag.rst").write_text("Fragment\n")
+        doc = tmp_path / "docs" / "index.rst"
+        doc.parent.mkdir()
+        doc.write_text(".. include:: ../shared/frag.rst\n")
+        graph = include_graph.IncludeGraph()
+
+        graph.update_file(doc)  # act
+
+        assert graph.includes(doc) == {tmp_path / "shared" / "frag.rst"}
+        assert graph.includers(tmp_path / "shared" / "frag.rst") == {doc}
+        assert graph.documents == {doc}
+
+    @staticmethod
+    def test_nested_includes_are_followed(tmp_path: pathlib.Path) -> None:
+        """Test included files are parsed for includes too and includers are transitive."""
+        (tmp_path / "inner.inc").write_text("Inner\n")
+        (tmp_path / "outer.inc").write_text(".. include:: inner.inc\n")
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: outer.inc\n")
+        graph = include_graph.IncludeGraph()
+
+        graph.update_file(doc)  # act
+
+        assert graph.includers(tmp_path / "inner.inc") == {tmp_path / "outer.inc", doc}
+        assert graph.includers(tmp_path / "inner.inc", transitive=False) == {tmp_path / "outer.inc"}
+        assert graph.documents == {doc}
+
+    @staticmethod
+    def test_update_replaces_edges(tmp_path: pathlib.Path) -> None:
+        """Test updating a file drops edges which no longer exist."""
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: a.rst\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_file(doc)
+
+        graph.update_file(doc, ".. include:: b.rst\n")  # act
+
+        assert graph.includes(doc) == {tmp_path / "b.rst"}
+        assert not graph.includers(tmp_path / "a.rst")
+
+    @staticmethod
+    def test_changed_fragment_affects_only_includers(tmp_path: pathlib.Path) -> None:
+        """Test a changed included file only affects the documents including it."""
+        frag = tmp_path / "frag.inc"
+        frag.write_text("Fragment\n")
+        doc_with = tmp_path / "with.rst"
+        doc_with.write_text(".. include:: frag.inc\n")
+        doc_without = tmp_path / "without.rst"
+        doc_without.write_text("Text\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_files([doc_with, doc_without])
+        _touch_later(frag, "Changed fragment\n")
+
+        changed = graph.changed_files()
+        result = graph.affected_files(changed)
+
+        assert changed == {frag}
+        assert result == {doc_with}
+
+    @staticmethod
+    def test_created_include_is_detected(tmp_path: pathlib.Path) -> None:
+        """Test creating a missing included file marks it changed."""
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: later.inc\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_file(doc)
+        (tmp_path / "later.inc").write_text("Now here\n")
+
+        changed = graph.changed_files()
+        graph.refresh_files(changed)
+
+        assert graph.affected_files(changed) == {doc}
+        assert not graph.changed_files()
+
+    @staticmethod
+    def test_missing_includes(tmp_path: pathlib.Path) -> None:
+        """Test missing included files are reported with their includers."""
+        (tmp_path / "exists.inc").touch()
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: exists.inc\n\n.. include:: missing.inc\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_file(doc)
+
+        result = graph.missing_includes()
+
+        assert result == {tmp_path / "missing.inc": frozenset({doc})}
+
+    @staticmethod
+    def test_absolute_include_uses_sphinx_source_dir(tmp_path: pathlib.Path) -> None:
+        """Test absolute include paths are resolved against the sphinx source dir."""
+        source_dir = tmp_path / "source"
+        (source_dir / "sub").mkdir(parents=True)
+        doc = source_dir / "sub" / "doc.rst"
+        doc.write_text(".. include:: /frag.inc\n")
+        graph = include_graph.IncludeGraph()
+
+        graph.update_file(doc)  # act
+
+        assert graph.includes(doc) == {source_dir / "frag.inc"}
+
+    @staticmethod
+    def test_save_and_load_roundtrip(tmp_path: pathlib.Path) -> None:
+        """Test a persisted graph is loaded with the same edges and signatures."""
+        frag = tmp_path / "frag.inc"
+        frag.write_text("Fragment\n")
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: frag.inc\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_file(doc)
+        graph_file = tmp_path / "graph.json"
+        graph.save(graph_file)
+
+        result = include_graph.IncludeGraph.load(graph_file)
+
+        assert result.documents == {doc}
+        assert result.includers(frag) == {doc}
+        assert not result.changed_files()
+
+    @staticmethod
+    def test_load_invalid_file_gives_empty_graph(tmp_path: pathlib.Path) -> None:
+        """Test loading a broken file results in an empty graph."""
+        graph_file = tmp_path / "graph.json"
+        graph_file.write_text("{broken")
+
+        result = include_graph.IncludeGraph.load(graph_file)
+
+        assert not result.files
+
+    @staticmethod
+    def test_remove_file(tmp_path: pathlib.Path) -> None:
+        """Test removing a document drops its edges."""
+        doc = tmp_path / "doc.rst"
+        doc.write_text(".. include:: frag.inc\n")
+        graph = include_graph.IncludeGraph()
+        graph.update_file(doc)
+
+        graph.remove_file(doc)  # act
+
+        assert not graph.documents
+        assert not graph.includers(tmp_path / "frag.inc")
@@ -0,0 +1,263 @@
+"""Tests for ``lsp`` module."""
+
+from __future__ import annotations
+
+import io
+import os
+import pathlib
+import threading
+import typing as t
+
+import pytest
+
+from rstcheck_core import checker, config, lsp, types
+
+if t.TYPE_CHECKING:
+    import pytest_mock
+
+
+def _frame(*messages: lsp.Message) -> io.BytesIO:
+    """Frame messages into a stream."""
+    stream = io.BytesIO()
+    for message in messages:
+        lsp.write_message(stream, message)
+    stream.seek(0)
+    return stream
+
+
+def test_message_roundtrip() -> None:
+    """Test a written message is read back and the end of the stream is detected."""
+    stream = _frame({"jsonrpc": "2.0", "method": "initialized", "params": {"text": "äö"}})
+
+    result = lsp.read_message(stream)
+
+    assert result == {"jsonrpc": "2.0", "method": "initialized", "params": {"text": "äö"}}
+    assert lsp.read_message(stream) is None
+
+
+def test_message_without_content_length() -> None:
+    """Test a header without content length raises an error."""
+    with pytest.raises(ValueError, match="Content-Length"):
+        lsp.read_message(io.BytesIO(b"Content-Type: foo\r\n\r\n{}"))
+
+
+@pytest.mark.parametrize(
+    ("uri", "expected"),
+    [
+        ("file:///srv/my%20docs/index.rst", pathlib.Path("/srv/my docs/index.rst")),
+        ("file:///srv/a%2525b.rst", pathlib.Path("/srv/a%25b.rst")),
+        ("untitled:Untitled-1", None),
+    ],
+)
+def test_uri_to_path(uri: str, expected: pathlib.Path | None) -> None:
+    """Test file URIs are converted and other schemes are not."""
+    result = lsp.uri_to_path(uri)
+
+    assert result == expected
+
+
+class TestTextDocument:
+    """Test ``TextDocument`` class."""
+
+    @staticmethod
+    def test_incremental_changes() -> None:
+        """Test ranges are replaced in order."""
+        document = lsp.TextDocument("untitled:doc", "Title\n=====\n\nText\n", 1)
+
+        document.apply_changes(
+            [
+                {
+                    "range": {
+                        "start": {"line": 3, "character": 0},
+                        "end": {"line": 3, "character": 4},
+                    },
+                    "text": "Body",
+                },
+                {
+                    "range": {
+                        "start": {"line": 0, "character": 5},
+                        "end": {"line": 0, "character": 5},
+                    },
+                    "text": "!",
+                },
+            ],
+            2,
+        )
+
+        assert document.text == "Title!\n=====\n\nBody\n"
+        assert document.version == 2
+
+    @staticmethod
+    def test_full_change() -> None:
+        """Test changes without range replace the text."""
+        document = lsp.TextDocument("untitled:doc", "Old\n", 1)
+
+        document.apply_changes([{"text": "New\n"}], 2)
+
+        assert document.text == "New\n"
+
+    @staticmethod
+    def test_offsets_count_utf16_code_units() -> None:
+        """Test characters outside the BMP count as two code units."""
+        document = lsp.TextDocument("untitled:doc", "a\U0001f600b\r\nc", 1)
+
+        assert document.offset_at({"line": 0, "character": 3}) == 2
+        assert document.offset_at({"line": 0, "character": 99}) == 3
+        assert document.offset_at({"line": 1, "character": 1}) == 6
+        assert document.offset_at({"line": 5, "character": 0}) == 6
+
+
+@pytest.mark.parametrize(
+    ("message", "expected_severity", "expected_message"),
+    [
+        ("(WARNING/2) Title underline too short.", 2, "Title underline too short."),
+        ("(INFO/1) Possible title underline.", 3, "Possible title underline."),
+        ("(python) unexpected EOF", 1, "(python) unexpected EOF"),
+    ],
+)
+def test_create_diagnostic(message: str, expected_severity: int, expected_message: str) -> None:
+    """Test the severity is taken from the docutils level."""
+    error = types.LintError(source_origin="<string>", line_number=3, message=message)
+
+    result = lsp.create_diagnostic(error)
+
+    assert result["severity"] == expected_severity
+    assert result["message"] == expected_message
+    assert result["range"]["start"] == {"line": 2, "character": 0}
+
+
+class TestLanguageServer:
+    """Test ``LanguageServer`` class."""
+
+    @staticmethod
+    def test_requests_before_initialize_are_rejected() -> None:
+        """Test requests before ``initialize`` get an error and notifications are dropped."""
+        output = io.BytesIO()
+        language_server = lsp.LanguageServer(config.RstcheckConfig())
+        input_stream = _frame(
+            {"jsonrpc": "2.0", "id": 1, "method": "shutdown"},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": "untitled:doc", "text": "", "version": 1}},
+            },
+        )
+
+        result = language_server.run(input_stream, output)
+
+        output.seek(0)
+        response = lsp.read_message(output)
+        assert result == 1
+        assert response is not None
+        assert response["error"]["code"] == -32002
+        assert not language_server.documents
+
+    @staticmethod
+    def test_outdated_check_is_cancelled(mocker: pytest_mock.MockerFixture) -> None:
+        """Test a check is cancelled when the document changes while it runs."""
+        language_server = lsp.LanguageServer(config.RstcheckConfig())
+        document = lsp.TextDocument("untitled:doc", "Text\n", 1)
+        language_server.documents[document.uri] = document
+
+        def _changing_check(*_args: t.Any, **_kwargs: t.Any) -> types.YieldedLintError:  # noqa: ANN401
+            document.version = 2
+            yield types.LintError(source_origin="<stdin>", line_number=1, message="msg")
+            pytest.fail("Check was not cancelled.")  # pragma: no cover
+
+        mocker.patch.object(checker, "yield_file_errors", _changing_check)
+
+        result = language_server.check_document(document.uri, document.text, 1)
+
+        assert result is None
+
+    @staticmethod
+    def test_outdated_check_starts_no_subprocess(mocker: pytest_mock.MockerFixture) -> None:
+        """Test no further code block subprocess is started once the document changed."""
+        language_server = lsp.LanguageServer(config.RstcheckConfig())
+        text = ".. code-block:: bash\n\n    echo a\n\n.. code-block:: bash\n\n    echo b\n"
+        document = lsp.TextDocument("untitled:doc", text, 1)
+        language_server.documents[document.uri] = document
+
+        def _changing_run(*_args: t.Any, **_kwargs: t.Any) -> None:  # noqa: ANN401
+            document.version = 2
+
+        mocked_run = mocker.patch.object(checker.subprocess, "run", side_effect=_changing_run)
+
+        result = language_server.check_document(document.uri, document.text, 1)
+
+        assert result is None
+        mocked_run.assert_called_once()
+
+    @staticmethod
+    def test_session(tmp_path: pathlib.Path) -> None:
+        """Test diagnostics are published for opened and changed documents."""
+        test_file = tmp_path / "doc.rst"
+        uri = test_file.as_uri()
+        read_fd, write_fd = os.pipe()
+        output_read_fd, output_write_fd = os.pipe()
+        language_server = lsp.LanguageServer(config.RstcheckConfig(), debounce=0.01)
+        with (
+            open(read_fd, "rb") as input_stream,  # noqa: PTH123
+            open(write_fd, "wb") as client_input,  # noqa: PTH123
+            open(output_read_fd, "rb") as client_output,  # noqa: PTH123
+            open(output_write_fd, "wb") as output_stream,  # noqa: PTH123
+        ):
+            server_thread = threading.Thread(
+                target=language_server.run, args=(input_stream, output_stream)
+            )
+            server_thread.start()
+
+            lsp.write_message(
+                client_input, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}
+            )
+            initialize_response = lsp.read_message(client_output)
+            lsp.write_message(
+                client_input,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didOpen",
+                    "params": {
+                        "textDocument": {
+                            "uri": uri,
+                            "text": "Title\n=====\n\n`broken\n",
+                            "version": 1,
+                        }
+                    },
+                },
+            )
+            open_diagnostics = lsp.read_message(client_output)
+            lsp.write_message(
+                client_input,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {"uri": uri, "version": 2},
+                        "contentChanges": [
+                            {
+                                "range": {
+                                    "start": {"line": 3, "character": 7},
+                                    "end": {"line": 3, "character": 7},
+                                },
+                                "text": "`",
+                            }
+                        ],
+                    },
+                },
+            )
+            change_diagnostics = lsp.read_message(client_output)
+            lsp.write_message(client_input, {"jsonrpc": "2.0", "id": 2, "method": "shutdown"})
+            shutdown_response = lsp.read_message(client_output)
+            lsp.write_message(client_input, {"jsonrpc": "2.0", "method": "exit"})
+            server_thread.join(timeout=30)
+
+        assert initialize_response is not None
+        assert initialize_response["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+        assert open_diagnostics is not None
+        assert open_diagnostics["params"]["version"] == 1
+        assert len(open_diagnostics["params"]["diagnostics"]) == 1
+        assert open_diagnostics["params"]["diagnostics"][0]["range"]["start"]["line"] == 3
+        assert change_diagnostics is not None
+        assert change_diagnostics["params"] == {"uri": uri, "diagnostics": [], "version": 2}
+        assert shutdown_response == {"jsonrpc": "2.0", "id": 2, "result": None}
+        assert not server_thread.is_alive()
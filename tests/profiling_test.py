@@ -0,0 +1,53 @@
+"""Tests for ``profiling`` module."""
+
+from __future__ import annotations
+
+import pathlib
+import pstats
+import tracemalloc
+
+from rstcheck_core import checker, config, profiling
+
+
+def test_artifact_stem_is_unique_per_path() -> None:
+    """Test files with the same name in different directories get different artifacts."""
+    result_1 = profiling.get_artifact_stem(pathlib.Path("a/index.rst"))
+    result_2 = profiling.get_artifact_stem(pathlib.Path("b/index.rst"))
+
+    assert result_1 != result_2
+    assert result_1.startswith("index-")
+    assert profiling.get_artifact_stem(pathlib.Path("-")) == "stdin"
+
+
+def test_check_file_writes_artifacts(tmp_path: pathlib.Path) -> None:
+    """Test a profiled check writes a CPU profile and a memory snapshot."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("Text\n")
+    output_dir = tmp_path / "profiles"
+    settings = profiling.ProfileSettings(output_dir, memory=True)
+
+    checker.check_file(test_file, config.RstcheckConfig(), profile=settings)
+
+    cpu_profile = profiling.get_cpu_profile_path(test_file, output_dir)
+    memory_snapshot = profiling.get_memory_snapshot_path(test_file, output_dir)
+    assert pstats.Stats(str(cpu_profile)).total_calls > 0  # type: ignore[attr-defined]
+    assert tracemalloc.Snapshot.load(str(memory_snapshot)).traces
+    assert not tracemalloc.is_tracing()
+
+
+def test_merge_cpu_profiles(tmp_path: pathlib.Path) -> None:
+    """Test profiles are merged and missing ones are skipped."""
+    settings = profiling.ProfileSettings(tmp_path)
+    for name in ("a.rst", "b.rst"):
+        with profiling.profile_file(tmp_path / name, settings):
+            sum(range(100))
+    profile_files = [
+        profiling.get_cpu_profile_path(tmp_path / name, tmp_path)
+        for name in ("a.rst", "b.rst", "missing.rst")
+    ]
+
+    result = profiling.merge_cpu_profiles(profile_files, tmp_path / "merged.prof")
+
+    assert result == tmp_path / "merged.prof"
+    assert pstats.Stats(str(result)).total_calls > 0  # type: ignore[attr-defined]
+    assert profiling.merge_cpu_profiles([], tmp_path / "none.prof") is None
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import io
 import multiprocessing
+import os
 import pathlib
+import re
 import sys
 import typing as t
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from rstcheck_core import checker, config, runner, types
+from rstcheck_core import (
+    _docutils,
+    _sphinx_workarounds,
+    checker,
+    config,
+    framing,
+    profiling,
+    runner,
+    types,
+)
 
 if t.TYPE_CHECKING:
     import pytest_mock
@@ -363,7 +377,7 @@ def test__run_checks_parallel_method(
             return [lint_errors, lint_errors]
 
     @contextlib.contextmanager
-    def mock_pool(_: t.Any) -> t.Generator[MockedPool, None, None]:  # noqa: ANN401
+    def mock_pool(_: t.Any, **__: t.Any) -> t.Generator[MockedPool, None, None]:  # noqa: ANN401
         """Mock context manager for ``multiprocessing.Pool``."""
         yield MockedPool()
 
@@ -434,6 +448,433 @@ def test_check_method_parallel_with_more_files(mocker: pytest_mock.MockerFixture
     mocked_parallel_runner.assert_called_once()
 
 
+def test_check_async_method_matches_check(tmp_path: pathlib.Path) -> None:
+    """Test ``RstcheckMainRunner.check_async`` method finds the same errors as ``check``."""
+    (tmp_path / "bad.rst").write_text("Title\n=====\n\n.. code:: python\n\n    print(\n")
+    (tmp_path / "also_bad.rst").write_text("`broken\n")
+    (tmp_path / "good.rst").write_text("Text\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(sorted(tmp_path.glob("*.rst")), init_config)
+    _runner._update_results(_runner._run_checks_sync())
+    expected_errors = _runner.errors
+
+    asyncio.run(_runner.check_async())  # act
+
+    assert _runner.errors == expected_errors
+    assert len(_runner.errors) == 2
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "option"),
+    [
+        ({"fail_fast": True}, "fail_fast/max_errors"),
+        ({"max_errors": 2}, "fail_fast/max_errors"),
+        ({"file_timeout": 1}, "file_timeout"),
+        ({"max_tasks_per_worker": 1}, "max_tasks_per_worker"),
+        ({"deduplicate": True}, "deduplicate"),
+    ],
+)
+def test_check_async_method_rejects_unsupported_options(
+    tmp_path: pathlib.Path, kwargs: dict[str, t.Any], option: str
+) -> None:
+    """Test ``RstcheckMainRunner.check_async`` method rejects options it would ignore."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("Text\n")
+    _runner = runner.RstcheckMainRunner([test_file], config.RstcheckConfig(), **kwargs)
+
+    with pytest.raises(ValueError, match=f"do not support {option}"):
+        asyncio.run(_runner.check_async())
+
+
+def test_check_async_method_rejects_archives(tmp_path: pathlib.Path) -> None:
+    """Test ``RstcheckMainRunner.check_async`` method rejects archives it cannot check."""
+    archive_file = tmp_path / "docs.zip"
+    with zipfile.ZipFile(archive_file, "w") as archive_:
+        archive_.writestr("doc.rst", "Text\n")
+    _runner = runner.RstcheckMainRunner([archive_file], config.RstcheckConfig())
+
+    with pytest.raises(ValueError, match="do not support archives"):
+        asyncio.run(_runner.check_async())
+
+
+def test_check_method_collects_stats(tmp_path: pathlib.Path) -> None:
+    """Test ``RstcheckMainRunner.check`` method records stats per file and for the run."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("`broken\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner([test_file], init_config, collect_stats=True)
+
+    _runner.check()  # act
+
+    assert _runner.stats is not None
+    assert list(_runner.stats.files) == [test_file]
+    assert "docutils_parse" in _runner.stats.total.timings
+    assert _runner.stats.wall_time > 0
+
+
+def test_check_method_without_stats(tmp_path: pathlib.Path) -> None:
+    """Test ``RstcheckMainRunner`` collects no stats by default."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("Text\n")
+    _runner = runner.RstcheckMainRunner([test_file], config.RstcheckConfig())
+
+    _runner.check()  # act
+
+    assert _runner.stats is None
+
+
+def test_check_method_profiles_files_in_pool_workers(tmp_path: pathlib.Path) -> None:
+    """Test profiles of files checked in pool workers are written and merged."""
+    test_files = [tmp_path / "a.rst", tmp_path / "b.rst"]
+    for test_file in test_files:
+        test_file.write_text("Text\n")
+    output_dir = tmp_path / "profiles"
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(
+        test_files, init_config, profile=profiling.ProfileSettings(output_dir)
+    )
+
+    _runner.check()  # act
+
+    assert {p.name for p in output_dir.iterdir()} == {
+        *(profiling.get_cpu_profile_path(f, output_dir).name for f in test_files),
+        profiling.MERGED_PROFILE_NAME,
+    }
+
+
+def test_check_framed_stream_method_prints_issues_per_document() -> None:
+    """Test the issues of framed documents are printed with their names."""
+    input_stream = io.BytesIO(
+        framing.frame_document("Text\n", "length", "good.rst")
+        + framing.frame_document("`broken\n", "length", "bad.rst")
+    )
+    output = io.StringIO()
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner([pathlib.Path("-")], init_config)
+
+    result = _runner.check_framed_stream(input_stream, "length", output)
+
+    assert result == 1
+    assert len(_runner.errors) == 1
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("bad.rst:1: (WARNING/2) Inline interpreted text")
+    assert lines[1:] == ["Error! Issues detected."]
+
+
+def test_max_errors_below_one_is_rejected() -> None:
+    """Test ``max_errors`` must allow at least one issue."""
+    with pytest.raises(ValueError, match="max_errors must be at least 1"):
+        runner.RstcheckMainRunner([], config.RstcheckConfig(), max_errors=0)
+
+
+@pytest.mark.parametrize("pool_size", [1, 2])
+def test_check_method_fail_fast_stops_at_first_issue(
+    tmp_path: pathlib.Path, pool_size: int
+) -> None:
+    """Test ``fail_fast`` keeps only the first issue and skips the remaining files."""
+    test_files = [tmp_path / f"{index}.rst" for index in range(4)]
+    for test_file in test_files:
+        test_file.write_text("`broken\n\n`broken\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(test_files, init_config, fail_fast=True)
+    _runner._pool_size = pool_size
+
+    _runner.check()  # act
+
+    (error,) = _runner.errors
+    assert error["source_origin"] == test_files[0]
+    assert error["line_number"] == 1
+
+
+def test__check_files_method_stops_at_max_errors(tmp_path: pathlib.Path) -> None:
+    """Test no further files are checked once ``max_errors`` issues are found."""
+    test_files = [tmp_path / f"{index}.rst" for index in range(4)]
+    for test_file in test_files:
+        test_file.write_text("`broken\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(test_files, init_config, collect_stats=True)
+
+    result = _runner._check_files(test_files, max_errors=2)
+
+    assert [len(errors) for errors in result] == [1, 1]
+    assert _runner.stats is not None
+    assert list(_runner.stats.files) == test_files[:2]
+
+
+def _check_file_or_hang(
+    file_check: runner._FileCheck,
+) -> tuple[list[types.LintError], None]:
+    """Check function which hangs in C code for ``hang.rst`` and reports its worker's PID."""
+    source_file = file_check.source_file
+    if source_file.name == "hang.rst":
+        re.match(r"(a+)+$", "a" * 64 + "b")
+    return (
+        [types.LintError(source_origin=source_file, line_number=1, message=str(os.getpid()))],
+        None,
+    )
+
+
+def _create_timeout_result(file_check: runner._FileCheck) -> tuple[list[types.LintError], None]:
+    """Create the result of a timed out check."""
+    return ([runner._create_timeout_error(file_check.source_file, 0.5)], None)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__worker_pool_imap_supervised_kills_late_workers(processes: int) -> None:
+    """Test a hanging check is reported as timed out and only its worker is replaced."""
+    files = [pathlib.Path(name) for name in ("a.rst", "hang.rst", "b.rst", "c.rst", "d.rst")]
+    file_checks = [runner._FileCheck(file, config.RunConfig()) for file in files]
+
+    pool = runner._WorkerPool(processes, file_timeout=0.5)
+    try:
+        result = list(
+            pool.imap_supervised(_check_file_or_hang, file_checks, _create_timeout_result)
+        )
+    finally:
+        pool.terminate()
+
+    errors = [errors for errors, _ in result]
+    assert errors[1] == [
+        types.LintError(
+            source_origin=files[1],
+            line_number=0,
+            message="(SEVERE/4) Check timed out after 0.5 seconds.",
+        )
+    ]
+    checked = [file_errors for index, file_errors in enumerate(errors) if index != 1]
+    assert [error["source_origin"] for (error,) in checked] == [
+        file for index, file in enumerate(files) if index != 1
+    ]
+    if processes == 1:
+        # NOTE: The file before the hanging one was checked by the killed worker.
+        assert checked[0][0]["message"] != checked[1][0]["message"]
+
+
+def test__worker_pool_imap_supervised_replaces_workers_after_max_tasks() -> None:
+    """Test supervised workers are replaced after their maximum number of tasks."""
+    pool = runner._WorkerPool(1, max_tasks_per_worker=2, file_timeout=30)
+
+    try:
+        pids = list(pool.imap_supervised(_get_pid, list(range(4)), _get_pid))
+    finally:
+        pool.terminate()
+
+    assert pids[0] == pids[1]
+    assert pids[1] != pids[2]
+    assert pids[2] == pids[3]
+
+
+def test_check_method_with_file_timeout(tmp_path: pathlib.Path) -> None:
+    """Test files are checked by watched pool workers if a file timeout is set."""
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("`broken\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner([test_file], init_config, file_timeout=30)
+
+    _runner.check()  # act
+
+    (error,) = _runner.errors
+    assert error["source_origin"] == test_file
+
+
+@pytest.mark.parametrize("argument", ["max_tasks_per_worker", "max_worker_rss"])
+def test_worker_limits_must_be_positive(argument: str) -> None:
+    """Test worker limits of zero are rejected."""
+    with pytest.raises(ValueError, match=f"{argument} must be at least 1"):
+        runner.RstcheckMainRunner([], config.RstcheckConfig(), **{argument: 0})
+
+
+@pytest.mark.parametrize("argument", ["file_timeout", "code_block_timeout"])
+def test_timeouts_must_be_positive(argument: str) -> None:
+    """Test timeouts of zero seconds are rejected."""
+    with pytest.raises(ValueError, match=f"{argument} must be positive"):
+        runner.RstcheckMainRunner([], config.RstcheckConfig(), **{argument: 0})
+
+
+def _get_pid(_: object) -> int:
+    """Get the PID of the worker process."""
+    return os.getpid()
+
+
+def test__worker_pool_imap_supervised_replaces_workers_over_rss_limit() -> None:
+    """Test a supervised worker exceeding the memory limit is replaced before its next item."""
+    pool = runner._WorkerPool(1, max_worker_rss=1)
+
+    try:
+        pids = list(pool.imap_supervised(_get_pid, list(range(3)), _get_pid))
+    finally:
+        pool.terminate()
+
+    assert len(set(pids)) == 3
+
+
+def test__worker_pool_imap_supervised_keeps_workers_below_rss_limit() -> None:
+    """Test supervised workers are kept if they stay below the memory limit."""
+    pool = runner._WorkerPool(1, max_worker_rss=2**62)
+
+    try:
+        pids = list(pool.imap_supervised(_get_pid, list(range(3)), _get_pid))
+    finally:
+        pool.terminate()
+
+    assert len(set(pids)) == 1
+
+
+@pytest.mark.parametrize("max_tasks_per_worker", [None, 1])
+def test__worker_pool_workers_are_warm(max_tasks_per_worker: int | None) -> None:
+    """Test pool workers set up the docutils registries once on start."""
+    pool = runner._WorkerPool(1, max_tasks_per_worker=max_tasks_per_worker)
+
+    try:
+        result = [pool.pool.apply(_docutils.registries_are_warm) for _ in range(2)]
+    finally:
+        pool.terminate()
+
+    assert result == [True, True]
+
+
+def _registries_are_warm(_: object) -> bool:
+    """Check if the docutils registries of the worker process are warm."""
+    return _docutils.registries_are_warm()
+
+
+def test__worker_pool_supervised_workers_are_warm() -> None:
+    """Test supervised workers set up the docutils registries once on start."""
+    pool = runner._WorkerPool(1, max_tasks_per_worker=1, file_timeout=30)
+
+    try:
+        result = list(pool.imap_supervised(_registries_are_warm, [0, 1], _registries_are_warm))
+    finally:
+        pool.terminate()
+
+    assert result == [True, True]
+
+
+@pytest.mark.parametrize(
+    "file_timeout",
+    [
+        None,
+        60,
+    ],
+)
+def test_check_method_with_worker_limits(
+    tmp_path: pathlib.Path, file_timeout: float | None
+) -> None:
+    """Test the issues are unchanged if workers are recycled, also with a file timeout."""
+    test_files = [tmp_path / f"{index}.rst" for index in range(3)]
+    for test_file in test_files:
+        test_file.write_text("`broken\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(
+        test_files, init_config, max_tasks_per_worker=1, max_worker_rss=1, file_timeout=file_timeout
+    )
+
+    _runner.check()  # act
+
+    assert [error["source_origin"] for error in _runner.errors] == test_files
+
+
+def test__check_files_method_deduplicates_identical_files(
+    tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    """Test identical files are checked once and their issues are reported for each file."""
+    test_files = [tmp_path / "a" / "doc.rst", tmp_path / "b" / "doc.rst", tmp_path / "other.rst"]
+    for test_file, content in zip(test_files, ["`broken\n", "`broken\n", "Text\n"], strict=True):
+        test_file.parent.mkdir(exist_ok=True)
+        test_file.write_text(content)
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(test_files, init_config, deduplicate=True)
+    check_file_spy = mocker.spy(runner.checker, "check_file")
+    from_config_spy = mocker.spy(config.RunConfig, "from_config")
+
+    result = _runner._check_files(test_files)
+
+    assert [call.args[0] for call in check_file_spy.call_args_list] == [
+        test_files[0],
+        test_files[2],
+    ]
+    assert from_config_spy.call_count == 1
+    assert [[error["source_origin"] for error in errors] for errors in result] == [
+        [test_files[0]],
+        [test_files[1]],
+        [],
+    ]
+    assert result[0][0]["message"] == result[1][0]["message"]
+
+
+def test_check_method_does_not_deduplicate_includes_across_directories(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test identical files with include directives are checked in each directory."""
+    test_files = [tmp_path / "a" / "doc.rst", tmp_path / "b" / "doc.rst"]
+    for test_file in test_files:
+        test_file.parent.mkdir()
+        test_file.write_text(".. include:: part.inc\n")
+    (tmp_path / "a" / "part.inc").write_text("Text\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner(test_files, init_config, deduplicate=True)
+
+    _runner.check()  # act
+
+    (error,) = _runner.errors
+    assert error["source_origin"] == test_files[1]
+
+
+def test__check_files_method_passes_resolved_run_configs(
+    tmp_path: pathlib.Path, mocker: pytest_mock.MockerFixture
+) -> None:
+    """Test the files are checked with the run configs of their directories."""
+    test_files = [tmp_path / "a" / "doc.rst", tmp_path / "a" / "other.rst", tmp_path / "b.rst"]
+    for test_file in test_files:
+        test_file.parent.mkdir(exist_ok=True)
+        test_file.write_text(":foo:`text`\n")
+    (tmp_path / "a" / ".rstcheck.cfg").write_text("[rstcheck]\nignore_roles=foo\n")
+    (tmp_path / ".rstcheck.cfg").write_text("[rstcheck]\nreport_level=WARNING\n")
+    _runner = runner.RstcheckMainRunner(test_files, config.RstcheckConfig())
+    check_file_spy = mocker.spy(runner.checker, "check_file")
+
+    result = _runner._check_files(test_files)
+
+    run_configs = [call.args[1] for call in check_file_spy.call_args_list]
+    assert all(isinstance(run_config, config.RunConfig) for run_config in run_configs)
+    assert run_configs[0] is run_configs[1]
+    assert run_configs[0].ignores.roles == frozenset({"foo"})
+    assert [len(errors) for errors in result] == [0, 0, 1]
+
+
+def test__call_with_include_lookup_cache_shares_cache_per_call_id() -> None:
+    """Test tasks of the same check call share the include lookup cache."""
+
+    def get_cache() -> object:
+        return _sphinx_workarounds._include_lookup_cache.get()
+
+    first = runner._call_with_include_lookup_cache("first", get_cache)
+    same = runner._call_with_include_lookup_cache("first", get_cache)
+    other = runner._call_with_include_lookup_cache("second", get_cache)
+
+    assert first is not None
+    assert same is first
+    assert other is not first
+    assert get_cache() is None
+
+
+def test_check_method_checks_archive_members(tmp_path: pathlib.Path) -> None:
+    """Test archives passed as paths have their rst members checked."""
+    archive_path = tmp_path / "docs.zip"
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        zip_file.writestr("bad.rst", "`broken\n")
+        zip_file.writestr("good.rst", "Text\n")
+    init_config = config.RstcheckConfig(config_path=pathlib.Path("NONE"))
+    _runner = runner.RstcheckMainRunner([archive_path], init_config)
+
+    _runner.check()  # act
+
+    assert _runner.files_to_check == []
+    assert _runner.archives_to_check == [archive_path]
+    (error,) = _runner.errors
+    assert error["source_origin"] == archive_path / "bad.rst"
+
+
 class TestRstcheckMainRunnerResultPrinter:
     """Test ``RstcheckMainRunner.get_result`` method."""
 
@@ -573,3 +1014,75 @@ class TestRstcheckMainRunnerResultPrinter:
         _runner.print_result()  # act
 
         assert "<string>:0: (ERROR/3) Some error." in capsys.readouterr().err
+
+
+class TestRstcheckMainRunnerWatch:
+    """Test ``RstcheckMainRunner.watch`` method."""
+
+    @staticmethod
+    def test_stdin_is_not_supported() -> None:
+        """Test watch mode refuses stdin as input."""
+        init_config = config.RstcheckConfig()
+        _runner = runner.RstcheckMainRunner([pathlib.Path("-")], init_config)
+
+        with pytest.raises(ValueError, match="stdin"):
+            _runner.watch()
+
+    @staticmethod
+    def test_prints_new_and_resolved_issues(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test changed files are re-checked and the issue diff is printed."""
+        test_file = tmp_path / "doc.rst"
+        test_file.write_text("Title\n=\n")
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            if not sleeps:
+                mtime_ns = test_file.stat().st_mtime_ns + 1_000_000_000
+                test_file.write_text("Title\n=====\n")
+                os.utime(test_file, ns=(mtime_ns, mtime_ns))
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(runner.time, "sleep", fake_sleep)
+        init_config = config.RstcheckConfig()
+        _runner = runner.RstcheckMainRunner([test_file], init_config)
+        output = io.StringIO()
+
+        result = _runner.watch(interval=1.0, debounce=0.1, output_file=output, max_iterations=2)
+
+        lines = output.getvalue().splitlines()
+        assert result == 0
+        assert lines[0].startswith(f"+ {test_file}:2: ")
+        assert lines[1] == "1 new issue(s), 0 resolved issue(s)."
+        assert lines[2] == "- " + lines[0][2:]
+        assert lines[3] == "0 new issue(s), 1 resolved issue(s)."
+        assert sleeps == [1.0, 0.1, 1.0]
+        assert not _runner.errors
+
+    @staticmethod
+    def test_keeps_docutils_warm_between_checks(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, mocker: pytest_mock.MockerFixture
+    ) -> None:
+        """Test re-checks reload no docutils modules and keep the registries warm."""
+        test_file = tmp_path / "doc.rst"
+        test_file.write_text("Title\n=\n")
+        reload_spy = mocker.spy(_docutils.importlib, "reload")
+        reloads_before_recheck: list[int] = []
+        registries_were_warm: list[bool] = []
+
+        def fake_sleep(_: float) -> None:
+            if not reloads_before_recheck:
+                reloads_before_recheck.append(reload_spy.call_count)
+                mtime_ns = test_file.stat().st_mtime_ns + 1_000_000_000
+                test_file.write_text("Title\n=====\n")
+                os.utime(test_file, ns=(mtime_ns, mtime_ns))
+            registries_were_warm.append(_docutils.registries_are_warm())
+
+        monkeypatch.setattr(runner.time, "sleep", fake_sleep)
+        _runner = runner.RstcheckMainRunner([test_file], config.RstcheckConfig())
+
+        _runner.watch(interval=1.0, debounce=0.1, output_file=io.StringIO(), max_iterations=2)
+
+        assert reload_spy.call_count == reloads_before_recheck[0]
+        assert all(registries_were_warm)
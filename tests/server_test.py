@@ -0,0 +1,133 @@
+"""Tests for ``server`` module."""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+from rstcheck_core import config, server, types
+
+
+class TestLintErrorSerialization:
+    """Test ``serialize_lint_error`` and ``deserialize_lint_error`` functions."""
+
+    @staticmethod
+    @pytest.mark.parametrize("source_origin", ["<string>", "<stdin>", pathlib.Path("doc.rst")])
+    def test_roundtrip(source_origin: types.SourceFileOrString) -> None:
+        """Test errors survive a roundtrip."""
+        error = types.LintError(source_origin=source_origin, line_number=3, message="msg")
+
+        result = server.deserialize_lint_error(server.serialize_lint_error(error))
+
+        assert result == error
+
+
+class TestRstcheckServerRequestHandling:
+    """Test ``RstcheckServer.handle_request`` method."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "request_data",
+        [[], {"action": "unknown"}, {"action": "check"}, {"action": "check", "path": 1}],
+    )
+    def test_invalid_requests(request_data: object, tmp_path: pathlib.Path) -> None:
+        """Test invalid requests are answered with an error."""
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        result = _server.handle_request(request_data)
+
+        assert result["ok"] is False
+        assert result["error"]
+
+    @staticmethod
+    def test_missing_file(tmp_path: pathlib.Path) -> None:
+        """Test a missing file is answered with an error."""
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        result = _server.handle_request({"action": "check", "path": str(tmp_path / "no.rst")})
+
+        assert result == {"ok": False, "error": f"File not found: '{tmp_path / 'no.rst'}'."}
+
+    @staticmethod
+    def test_check_file(tmp_path: pathlib.Path) -> None:
+        """Test a file is checked."""
+        test_file = tmp_path / "doc.rst"
+        test_file.write_text("Title\n=====\n\n`broken\n")
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        result = _server.handle_request({"action": "check", "path": str(test_file)})
+
+        assert result["ok"] is True
+        assert len(result["errors"]) == 1
+        assert result["errors"][0]["source_origin"] == str(test_file)
+
+    @staticmethod
+    def test_check_source(tmp_path: pathlib.Path) -> None:
+        """Test a source without path is checked like stdin."""
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        result = _server.handle_request({"action": "check", "source": "`broken\n"})
+
+        assert result["ok"] is True
+        assert result["errors"][0]["source_origin"] == "<stdin>"
+
+    @staticmethod
+    def test_shutdown(tmp_path: pathlib.Path) -> None:
+        """Test a shutdown request is recorded."""
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        result = _server.handle_request({"action": "shutdown"})
+
+        assert result == {"ok": True}
+        assert _server.shutdown_requested
+
+
+class TestRstcheckServerRunConfig:
+    """Test ``RstcheckServer.get_run_config`` method."""
+
+    @staticmethod
+    def test_run_config_is_cached_per_directory(tmp_path: pathlib.Path) -> None:
+        """Test the config file is loaded once per directory until reloaded."""
+        config_file = tmp_path / ".rstcheck.cfg"
+        config_file.write_text("[rstcheck]\nreport_level = severe\n")
+        _server = server.RstcheckServer(tmp_path / "s.sock", config.RstcheckConfig())
+
+        first_result = _server.get_run_config(tmp_path)
+        config_file.write_text("[rstcheck]\nreport_level = error\n")
+        cached_result = _server.get_run_config(tmp_path)
+        _server.handle_request({"action": "reload"})
+        reloaded_result = _server.get_run_config(tmp_path)
+
+        assert first_result.report_level == config.ReportLevel.SEVERE
+        assert cached_result is first_result
+        assert reloaded_result.report_level == config.ReportLevel.ERROR
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not on Windows.")
+def test_client_server_roundtrip(tmp_path: pathlib.Path) -> None:
+    """Test the client gets the errors from a running server and can stop it."""
+    socket_path = tmp_path / "s.sock"
+    test_file = tmp_path / "doc.rst"
+    test_file.write_text("Title\n=====\n\n`broken\n")
+    _server = server.RstcheckServer(socket_path, config.RstcheckConfig())
+    server_thread = threading.Thread(target=_server.serve)
+    server_thread.start()
+    for _ in range(100):
+        if socket_path.exists():
+            break
+        time.sleep(0.05)
+
+    try:
+        result = server.check_with_server(socket_path, path=test_file, timeout=30)
+    finally:
+        server.send_request(socket_path, {"action": "shutdown"}, timeout=30)
+        server_thread.join(timeout=30)
+
+    assert len(result) == 1
+    assert result[0]["source_origin"] == test_file
+    assert not server_thread.is_alive()
+    assert not socket_path.exists()
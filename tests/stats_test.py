@@ -0,0 +1,79 @@
+"""Tests for ``stats`` module."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+
+from rstcheck_core import stats
+
+
+def test_span_without_collection_records_nothing() -> None:
+    """Test spans outside of ``collect_stats`` are no-ops."""
+    with stats.span("phase"):
+        pass
+
+    assert stats.get_active_stats() is None
+
+
+def test_nested_collection_records_into_innermost_stats() -> None:
+    """Test spans are recorded into the innermost collected stats only."""
+    with stats.collect_stats() as outer_stats:
+        with stats.collect_stats() as inner_stats, stats.span("inner"):
+            pass
+        with stats.span("outer"):
+            pass
+
+    assert set(inner_stats.timings) == {"inner"}
+    assert set(outer_stats.timings) == {"outer"}
+
+
+def test_merge_adds_counts_and_seconds() -> None:
+    """Test merged timings are summed."""
+    check_stats = stats.CheckStats()
+    check_stats.add_timing("a", 1.0)
+    other_stats = stats.CheckStats()
+    other_stats.add_timing("a", 2.0)
+    other_stats.add_timing("b", 0.5)
+
+    check_stats.merge(other_stats)  # act
+
+    assert check_stats.timings == {
+        "a": {"count": 2, "seconds": 3.0},
+        "b": {"count": 1, "seconds": 0.5},
+    }
+
+
+def test_run_stats_dump(tmp_path: pathlib.Path) -> None:
+    """Test run stats are dumped as JSON with totals over files and the run itself."""
+    run_stats = stats.RunStats()
+    run_stats.run.add_timing("sphinx_load", 1.0)
+    for name in ("a.rst", "b.rst"):
+        file_stats = stats.CheckStats()
+        file_stats.add_timing("docutils_parse", 0.25)
+        run_stats.add_file(pathlib.Path(name), file_stats)
+    output_file = tmp_path / "stats.json"
+
+    run_stats.dump(output_file)  # act
+
+    result = json.loads(output_file.read_text())
+    assert result["total"]["timings"] == {
+        "docutils_parse": {"count": 2, "seconds": 0.5},
+        "sphinx_load": {"count": 1, "seconds": 1.0},
+    }
+    assert list(result["files"]) == ["a.rst", "b.rst"]
+
+
+def test_counters_are_merged_and_dumped() -> None:
+    """Test counters are summed on merge and sorted in the dict."""
+    check_stats = stats.CheckStats()
+    with stats.collect_stats(check_stats):
+        stats.count("b")
+        stats.count("a", 2)
+    other_stats = stats.CheckStats()
+    other_stats.add_count("b", 3)
+
+    check_stats.merge(other_stats)  # act
+
+    assert check_stats.to_dict()["counters"] == {"a": 2, "b": 4}
+    assert list(check_stats.to_dict()["counters"]) == ["a", "b"]
@@ -41,3 +41,51 @@ class TestIgnoreDictConstructor:
             roles=["role"],
             substitutions=["sub"],
         )
+
+
+class TestIgnores:
+    """Test ``Ignores`` class."""
+
+    @staticmethod
+    def test_from_ignore_dict() -> None:
+        """Test conversion of an IgnoreDict to sets."""
+        ignore_dict = types.construct_ignore_dict(
+            messages=re.compile("msg"), languages=["lang", "lang"], directives=["dir"]
+        )
+
+        result = types.Ignores.from_ignore_dict(ignore_dict)
+
+        assert result == types.Ignores(
+            messages=re.compile("msg"),
+            languages=frozenset({"lang"}),
+            directives=frozenset({"dir"}),
+        )
+
+    @staticmethod
+    def test_from_ignore_dict_passes_ignores_through() -> None:
+        """Test ``Ignores`` are returned as is and ``None`` results in empty ignores."""
+        ignores = types.Ignores(roles=frozenset({"role"}))
+
+        assert types.Ignores.from_ignore_dict(ignores) is ignores
+        assert types.Ignores.from_ignore_dict(None) == types.Ignores()
+
+    @staticmethod
+    def test_extend_derives_new_ignores() -> None:
+        """Test extending leaves the original ignores unchanged."""
+        ignores = types.Ignores(roles=frozenset({"role"}))
+
+        result = ignores.extend(roles=["other"], substitutions=["sub"])
+
+        assert result == types.Ignores(
+            roles=frozenset({"role", "other"}), substitutions=frozenset({"sub"})
+        )
+        assert ignores == types.Ignores(roles=frozenset({"role"}))
+
+    @staticmethod
+    def test_extend_without_new_values_returns_same_ignores() -> None:
+        """Test extending with known or no values returns the identical ignores."""
+        ignores = types.Ignores(roles=frozenset({"role"}))
+
+        result = ignores.extend(roles=["role"])
+
+        assert result is ignores